@@ -0,0 +1,108 @@
+"""
+Benchmark of the strength <-> hardware conversion performed by the control
+system strength aggregator, compared to a model by model conversion.
+Devices are in memory, only the conversion cost is measured.
+
+Usage: python examples/benchmarks/strength_aggregator_benchmark.py
+"""
+
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from pyaml.control.abstract_impl import CSScalarAggregator, CSStrengthScalarAggregator, check_range
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+from pyaml.magnet.inline_curve import ConfigModel as InlineCurveConfigModel
+from pyaml.magnet.inline_curve import InlineCurve
+from pyaml.magnet.linear_model import ConfigModel as LinearConfigModel
+from pyaml.magnet.linear_model import LinearMagnetModel
+
+SIZES = [10, 100, 1000, 5000]
+NB_FAMILY = 8  # Number of distinct excitation curves
+NB_REPEAT = 20
+
+
+class MemoryDevice(DeviceAccess):
+    def __init__(self, name: str, value: float):
+        self._name = name
+        self._value = value
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        return self._value
+
+    def readback(self):
+        return self._value
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [0.0, 200.0]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+def build(size: int):
+    curves = [
+        InlineCurve(InlineCurveConfigModel(mat=[[0.0, 0.0], [100.0, 1.0 + 0.1 * f], [200.0, 1.9 + 0.2 * f]]))
+        for f in range(NB_FAMILY)
+    ]
+    agg = CSStrengthScalarAggregator(CSScalarAggregator(ThreadedDeviceAccessList()))
+    models = []
+    for i in range(size):
+        ps = f"ps{i}"
+        model = LinearMagnetModel(
+            LinearConfigModel(curve=curves[i % NB_FAMILY], powerconverter=ps, unit="m-1", hardware_unit="A")
+        )
+        model.set_magnet_rigidity(20.0)
+        agg.add_magnet(SimpleNamespace(model=model, strength=None), [MemoryDevice(ps, 50.0 + i % 100)])
+        models.append(model)
+    return agg, models
+
+
+def loop_to_strengths(models, hardware_values):
+    return np.array([m.compute_strengths(hardware_values[i : i + 1])[0] for i, m in enumerate(models)])
+
+
+def loop_to_hardware(agg, models, strengths):
+    hw = np.array([m.compute_hardware_values(strengths[i : i + 1])[0] for i, m in enumerate(models)])
+    # Ranges fetched and converted on each write (the aggregator uses a precompiled range table)
+    check_range(hw, agg._devs.get_range())
+    return hw
+
+
+def timeit(fn, *args) -> float:
+    fn(*args)
+    t0 = time.perf_counter()
+    for _ in range(NB_REPEAT):
+        fn(*args)
+    return (time.perf_counter() - t0) / NB_REPEAT * 1e3
+
+
+print(f"{'magnets':>8} | {'loop get':>10} | {'batch get':>10} | {'loop set':>10} | {'batch set':>10}  (ms)")
+for size in SIZES:
+    agg, models = build(size)
+    hw = np.array([50.0 + i % 100 for i in range(size)])
+    strengths = agg._to_strengths(hw)
+    assert np.allclose(strengths, loop_to_strengths(models, hw))
+    assert np.allclose(agg._to_hardware(strengths, hw), hw)
+    t_loop_get = timeit(loop_to_strengths, models, hw)
+    t_batch_get = timeit(agg._to_strengths, hw)
+    t_loop_set = timeit(loop_to_hardware, agg, models, strengths)
+    t_batch_set = timeit(agg._to_hardware, strengths, hw)
+    print(f"{size:>8} | {t_loop_get:>10.3f} | {t_batch_get:>10.3f} | {t_loop_set:>10.3f} | {t_batch_set:>10.3f}")
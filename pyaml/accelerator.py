@@ -2,6 +2,8 @@
 Accelerator class
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from .arrays.array import ArrayConfig
@@ -10,6 +12,7 @@ from .common.element_holder import ElementHolder
 from .common.exception import PyAMLConfigException
 from .configuration import ConfigurationManager, UnsupportedConfigurationRootError
 from .configuration.factory import Factory
+from .control.availability import DEFAULT_AVAILABILITY_TIMEOUT, AvailabilityReport
 from .control.controlsystem import ControlSystem
 from .lattice.simulator import Simulator
 from .yellow_pages import YellowPages
@@ -249,6 +252,28 @@ class Accelerator(object):
         modes.update(self._controls)
         return modes
 
+    def health(self, timeout: float = DEFAULT_AVAILABILITY_TIMEOUT) -> dict[str, AvailabilityReport]:
+        """
+        Checks the availability of the devices of all control systems.
+        Control systems are checked concurrently, so that the check completes
+        in roughly one timeout period.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum duration of the check of a control system in seconds
+
+        Returns
+        -------
+        dict[str, AvailabilityReport]
+            Availability report per control system name
+        """
+        if len(self._controls) == 0:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self._controls)) as executor:
+            reports = {name: executor.submit(c.check_availability, timeout) for name, c in self._controls.items()}
+        return {name: f.result() for name, f in reports.items()}
+
     def __repr__(self):
         return repr(self._cfg).replace("ConfigModel", self.__class__.__name__)
 
@@ -28,6 +28,9 @@ modules = [
     "pyaml.common.element",
     "pyaml.common.element_holder",
     "pyaml.common.exception",
+    "pyaml.common.lazy",
+    "pyaml.common.ramp",
+    "pyaml.common.transaction",
     "pyaml.magnet.csvcurve",
     "pyaml.magnet.csvmatrix",
     "pyaml.magnet.curve",
@@ -38,16 +41,23 @@ modules = [
     "pyaml.configuration.manager",
     "pyaml.magnet.matrix",
     "pyaml.control.abstract_impl",
+    "pyaml.control.availability",
     "pyaml.control.controlsystem",
     "pyaml.control.deviceaccess",
     "pyaml.control.deviceaccesslist",
+    "pyaml.control.devicecache",
+    "pyaml.control.monitor",
+    "pyaml.control.multireader",
     "pyaml.control.readback_value",
+    "pyaml.control.setpoint_wait",
+    "pyaml.control.threadeddeviceaccesslist",
     "pyaml.tuning_tools.chromaticity_monitor",
     "pyaml.diagnostics.tune_monitor",
     "pyaml.external.pySC_interface",
     "pyaml.lattice.abstract_impl",
     "pyaml.lattice.attribute_linker",
     "pyaml.lattice.lattice_elements_linker",
+    "pyaml.lattice.orbit_response",
     "pyaml.lattice.polynom_info",
     "pyaml.lattice.simulator",
     "pyaml.magnet.cfm_magnet",
@@ -1,10 +1,19 @@
+import asyncio
+
 import numpy as np
 
 from ..bpm.bpm import BPM
-from ..common.abstract import ReadFloatArray
+from ..common.abstract import ReadFloatArray, ReadWriteFloatArray
+from ..common.abstract_aggregator import ScalarAggregator
+from ..common.exception import PyAMLException
 from ..control.deviceaccesslist import DeviceAccessList
 from .element_array import ElementArray
 
+BPM_SNAPSHOT_DTYPE = np.dtype(
+    [("x", np.float64), ("y", np.float64), ("x_offset", np.float64), ("y_offset", np.float64), ("tilt", np.float64)]
+)
+"""Record type of :py:meth:`BPMArray.snapshot`"""
+
 
 class RWBPMPosition(ReadFloatArray):
     """
@@ -43,6 +52,23 @@ class RWBPMPosition(ReadFloatArray):
         else:
             return self.__aggregator.get().reshape(len(self.__bpms), 2)
 
+    async def get_async(self) -> np.array:
+        """
+        Get BPM positions asynchronously, reads are overlapped on the event loop.
+
+        Returns
+        -------
+        np.array
+            Array of shape (n_bpms, 2) containing horizontal and vertical
+            positions for each BPM
+        """
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(b.positions.get) for b in self.__bpms])
+            return np.array(values)
+        else:
+            values = await self.__aggregator.get_async()
+            return values.reshape(len(self.__bpms), 2)
+
     # Gets the unit of the values
     def unit(self) -> list[str]:
         """
@@ -107,6 +133,22 @@ class RWBPMSinglePosition(ReadFloatArray):
         else:
             return self.__aggregator.get()
 
+    async def get_async(self) -> np.array:
+        """
+        Get single axis BPM positions asynchronously, reads are overlapped
+        on the event loop.
+
+        Returns
+        -------
+        np.array
+            Array of positions for the specified axis (horizontal or vertical)
+        """
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(b.positions.get) for b in self.__bpms])
+            return np.array([v[self.__idx] for v in values])
+        else:
+            return await self.__aggregator.get_async()
+
     # Gets the unit of the values
     def unit(self) -> list[str]:
         """
@@ -132,6 +174,205 @@ class RWBPMSinglePosition(ReadFloatArray):
         self.__aggregator = agg
 
 
+class RWBPMOffsets(ReadWriteFloatArray):
+    """
+    Read/write access to BPM offsets (horizontal and vertical).
+
+    Parameters
+    ----------
+    name : str
+        Name of the offset accessor
+    bpms : list[pyaml.bpm.bpm.BPM]
+        List of BPM objects to access
+    """
+
+    def __init__(self, name: str, bpms: list[BPM]):
+        self.__bpms = bpms
+        self.__name = name
+        self.__aggregator: ScalarAggregator = None
+
+    def get(self) -> np.array:
+        """
+        Get BPM offsets.
+
+        Returns
+        -------
+        np.array
+            Array of shape (n_bpms, 2) containing horizontal and vertical
+            offsets for each BPM
+        """
+        if not self.__aggregator:
+            return np.array([b.offset.get() for b in self.__bpms])
+        else:
+            return self.__aggregator.get().reshape(len(self.__bpms), 2)
+
+    async def get_async(self) -> np.array:
+        """
+        Get BPM offsets asynchronously, reads are overlapped on the event loop.
+        """
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(b.offset.get) for b in self.__bpms])
+            return np.array(values)
+        else:
+            values = await self.__aggregator.get_async()
+            return values.reshape(len(self.__bpms), 2)
+
+    def set(self, value: np.array):
+        """
+        Set BPM offsets.
+
+        Parameters
+        ----------
+        value : np.array
+            Array of shape (n_bpms, 2) containing horizontal and vertical
+            offsets for each BPM
+        """
+        value = self.__check(value)
+        if not self.__aggregator:
+            for b, v in zip(self.__bpms, value, strict=True):
+                b.offset.set(v)
+        else:
+            self.__aggregator.set(value.flatten())
+
+    def set_and_wait(self, value: np.array):
+        """
+        Set BPM offsets and wait that the read values reach the setpoints.
+        """
+        value = self.__check(value)
+        if not self.__aggregator:
+            for b, v in zip(self.__bpms, value, strict=True):
+                b.offset.set_and_wait(v)
+        else:
+            self.__aggregator.set_and_wait(value.flatten())
+
+    def __check(self, value: np.array) -> np.array:
+        value = np.asarray(value, dtype=float)
+        if value.shape != (len(self.__bpms), 2):
+            raise PyAMLException(f"{self.__name}: BPM offsets of shape ({len(self.__bpms)}, 2) expected, got {value.shape}")
+        return value
+
+    def unit(self) -> list[str]:
+        """
+        Get the units for BPM offsets.
+
+        Returns
+        -------
+        list[str]
+            List of unit strings for each BPM
+        """
+        return [b.offset.unit() for b in self.__bpms]
+
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        """
+        Set the aggregator for improved performance.
+
+        Parameters
+        ----------
+        agg : ScalarAggregator
+            Aggregator of the horizontal and vertical offsets of each BPM
+        """
+        self.__aggregator = agg
+
+
+class RWBPMTilts(ReadWriteFloatArray):
+    """
+    Read/write access to BPM tilts.
+
+    Parameters
+    ----------
+    name : str
+        Name of the tilt accessor
+    bpms : list[pyaml.bpm.bpm.BPM]
+        List of BPM objects to access
+    """
+
+    def __init__(self, name: str, bpms: list[BPM]):
+        self.__bpms = bpms
+        self.__name = name
+        self.__aggregator: ScalarAggregator = None
+
+    def get(self) -> np.array:
+        """
+        Get BPM tilts.
+
+        Returns
+        -------
+        np.array
+            Array of tilts, one per BPM
+        """
+        if not self.__aggregator:
+            return np.array([b.tilt.get() for b in self.__bpms])
+        else:
+            return self.__aggregator.get()
+
+    async def get_async(self) -> np.array:
+        """
+        Get BPM tilts asynchronously, reads are overlapped on the event loop.
+        """
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(b.tilt.get) for b in self.__bpms])
+            return np.array(values)
+        else:
+            return await self.__aggregator.get_async()
+
+    def set(self, value: np.array):
+        """
+        Set BPM tilts.
+
+        Parameters
+        ----------
+        value : np.array
+            Array of tilts, one per BPM
+        """
+        value = self.__check(value)
+        if not self.__aggregator:
+            for b, v in zip(self.__bpms, value, strict=True):
+                b.tilt.set(v)
+        else:
+            self.__aggregator.set(value)
+
+    def set_and_wait(self, value: np.array):
+        """
+        Set BPM tilts and wait that the read values reach the setpoints.
+        """
+        value = self.__check(value)
+        if not self.__aggregator:
+            for b, v in zip(self.__bpms, value, strict=True):
+                b.tilt.set_and_wait(v)
+        else:
+            self.__aggregator.set_and_wait(value)
+
+    def __check(self, value: np.array) -> np.array:
+        value = np.asarray(value, dtype=float)
+        if value.shape != (len(self.__bpms),):
+            raise PyAMLException(f"{self.__name}: {len(self.__bpms)} BPM tilts expected, got shape {value.shape}")
+        return value
+
+    def unit(self) -> list[str]:
+        """
+        Get the units for BPM tilts.
+
+        Returns
+        -------
+        list[str]
+            List of unit strings for each BPM
+        """
+        return [b.tilt.unit() for b in self.__bpms]
+
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        """
+        Set the aggregator for improved performance.
+
+        Parameters
+        ----------
+        agg : ScalarAggregator
+            Aggregator of the tilt of each BPM
+        """
+        self.__aggregator = agg
+
+
 class BPMArray(ElementArray):
     """
     Class that implements access to a BPM array.
@@ -170,12 +411,18 @@ class BPMArray(ElementArray):
         self.__hvpos = RWBPMPosition(arrayName, bpms)
         self.__hpos = RWBPMSinglePosition(arrayName, bpms, 0)
         self.__vpos = RWBPMSinglePosition(arrayName, bpms, 1)
+        self.__offsets = RWBPMOffsets(arrayName, bpms)
+        self.__tilts = RWBPMTilts(arrayName, bpms)
+        self.__snapshot: ScalarAggregator = None
 
         if use_aggregator and len(bpms) > 0:
             aggs = self.get_peer().create_bpm_aggregators(bpms)
             self.__hvpos.set_aggregator(aggs[0])
             self.__hpos.set_aggregator(aggs[1])
             self.__vpos.set_aggregator(aggs[2])
+            self.__offsets.set_aggregator(self.get_peer().create_bpm_offset_aggregator(bpms))
+            self.__tilts.set_aggregator(self.get_peer().create_bpm_tilt_aggregator(bpms))
+            self.__snapshot = self.get_peer().create_bpm_snapshot_aggregator(bpms)
 
     @property
     def positions(self) -> RWBPMPosition:
@@ -197,3 +444,65 @@ class BPMArray(ElementArray):
         Returns vertical position of each bpm of this array
         """
         return self.__vpos
+
+    @property
+    def offsets(self) -> RWBPMOffsets:
+        """
+        Returns offset of each bpm of this array
+        """
+        return self.__offsets
+
+    @property
+    def tilts(self) -> RWBPMTilts:
+        """
+        Returns tilt of each bpm of this array
+        """
+        return self.__tilts
+
+    def snapshot(self) -> np.ndarray:
+        """
+        Reads positions, offsets and tilts of all the BPMs of this array.
+        On a control system, all channels are fetched in a single batched
+        call and fields of BPMs without offset or tilt device are NaN.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array of shape (n_bpms,) with dtype
+            :py:data:`BPM_SNAPSHOT_DTYPE` (fields x, y, x_offset, y_offset, tilt)
+
+        Example
+        -------
+
+        .. code-block:: python
+
+            >>> snap = sr.live.get_bpms("BPM").snapshot()
+            >>> x = snap["x"] - snap["x_offset"]
+        """
+        if not self.__snapshot:
+            return self.__to_snapshot(self.__hvpos.get(), self.__offsets.get(), self.__tilts.get())
+        else:
+            return self.__from_channels(self.__snapshot.get())
+
+    async def snapshot_async(self) -> np.ndarray:
+        """
+        Asynchronous version of :py:meth:`snapshot`.
+        """
+        if not self.__snapshot:
+            pos, offsets, tilts = await asyncio.gather(
+                self.__hvpos.get_async(), self.__offsets.get_async(), self.__tilts.get_async()
+            )
+            return self.__to_snapshot(pos, offsets, tilts)
+        else:
+            return self.__from_channels(await self.__snapshot.get_async())
+
+    def __from_channels(self, values: np.ndarray) -> np.ndarray:
+        # Channels are ordered [x, y, x_offset, y_offset, tilt] for each BPM
+        return np.ascontiguousarray(values.reshape(len(self), 5)).view(BPM_SNAPSHOT_DTYPE).reshape(len(self))
+
+    def __to_snapshot(self, pos: np.ndarray, offsets: np.ndarray, tilts: np.ndarray) -> np.ndarray:
+        snap = np.empty(len(self), dtype=BPM_SNAPSHOT_DTYPE)
+        snap["x"], snap["y"] = pos[:, 0], pos[:, 1]
+        snap["x_offset"], snap["y_offset"] = offsets[:, 0], offsets[:, 1]
+        snap["tilt"] = tilts
+        return snap
@@ -1,21 +1,24 @@
+import asyncio
+
 import numpy as np
 
 from ..common.abstract import ReadWriteFloatArray
-from ..common.exception import PyAMLException
+from ..common.abstract_aggregator import ScalarAggregator
 from ..magnet.cfm_magnet import CombinedFunctionMagnet
 from .element_array import ElementArray
 
-# TODO handle aggregator for CFM
-
 
 class RWMagnetStrengths(ReadWriteFloatArray):
     def __init__(self, name: str, magnets: list[CombinedFunctionMagnet]):
         self.__name = name
         self.__magnets = magnets
         self.__nb = sum(m.nb_multipole() for m in magnets)
+        self.__aggregator: ScalarAggregator = None
 
     # Gets the values
     def get(self) -> np.array:
+        if self.__aggregator:
+            return self.__aggregator.get()
         r = np.zeros(self.__nb)
         idx = 0
         for m in self.__magnets:
@@ -26,6 +29,9 @@ class RWMagnetStrengths(ReadWriteFloatArray):
     # Sets the values
     def set(self, value: np.array):
         nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set(nvalue)
+            return
         idx = 0
         for m in self.__magnets:
             m.strengths.set(nvalue[idx : idx + m.nb_multipole()])
@@ -33,7 +39,32 @@ class RWMagnetStrengths(ReadWriteFloatArray):
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set_and_wait(nvalue)
+            return
+        idx = 0
+        for m in self.__magnets:
+            m.strengths.set_and_wait(nvalue[idx : idx + m.nb_multipole()])
+            idx += m.nb_multipole()
+
+    # Gets the values asynchronously
+    async def get_async(self) -> np.array:
+        if self.__aggregator:
+            return await self.__aggregator.get_async()
+        values = await asyncio.gather(*[asyncio.to_thread(m.strengths.get) for m in self.__magnets])
+        return np.concatenate(values) if len(values) > 0 else np.zeros(0)
+
+    # Sets the values asynchronously
+    async def set_async(self, value: np.array):
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            await self.__aggregator.set_async(nvalue)
+            return
+        bounds = np.cumsum([0] + [m.nb_multipole() for m in self.__magnets])
+        await asyncio.gather(
+            *[asyncio.to_thread(m.strengths.set, nvalue[bounds[i] : bounds[i + 1]]) for i, m in enumerate(self.__magnets)]
+        )
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
@@ -42,15 +73,22 @@ class RWMagnetStrengths(ReadWriteFloatArray):
             r.extend(m.strengths.unit())
         return r
 
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        self.__aggregator = agg
+
 
 class RWMagnetHardwares(ReadWriteFloatArray):
     def __init__(self, name: str, magnets: list[CombinedFunctionMagnet]):
         self.__name = name
         self.__magnets = magnets
         self.__nb = sum(m.nb_multipole() for m in magnets)
+        self.__aggregator: ScalarAggregator = None
 
     # Gets the values
     def get(self) -> np.array:
+        if self.__aggregator:
+            return self.__aggregator.get()
         r = np.zeros(self.__nb)
         idx = 0
         for m in self.__magnets:
@@ -61,6 +99,9 @@ class RWMagnetHardwares(ReadWriteFloatArray):
     # Sets the values
     def set(self, value: np.array):
         nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set(nvalue)
+            return
         idx = 0
         for m in self.__magnets:
             m.hardwares.set(nvalue[idx : idx + m.nb_multipole()])
@@ -68,7 +109,32 @@ class RWMagnetHardwares(ReadWriteFloatArray):
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set_and_wait(nvalue)
+            return
+        idx = 0
+        for m in self.__magnets:
+            m.hardwares.set_and_wait(nvalue[idx : idx + m.nb_multipole()])
+            idx += m.nb_multipole()
+
+    # Gets the values asynchronously
+    async def get_async(self) -> np.array:
+        if self.__aggregator:
+            return await self.__aggregator.get_async()
+        values = await asyncio.gather(*[asyncio.to_thread(m.hardwares.get) for m in self.__magnets])
+        return np.concatenate(values) if len(values) > 0 else np.zeros(0)
+
+    # Sets the values asynchronously
+    async def set_async(self, value: np.array):
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            await self.__aggregator.set_async(nvalue)
+            return
+        bounds = np.cumsum([0] + [m.nb_multipole() for m in self.__magnets])
+        await asyncio.gather(
+            *[asyncio.to_thread(m.hardwares.set, nvalue[bounds[i] : bounds[i + 1]]) for i, m in enumerate(self.__magnets)]
+        )
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
@@ -77,6 +143,10 @@ class RWMagnetHardwares(ReadWriteFloatArray):
             r.extend(m.hardwares.unit())
         return r
 
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        self.__aggregator = agg
+
 
 class CombinedFunctionMagnetArray(ElementArray):
     """
@@ -98,15 +168,18 @@ class CombinedFunctionMagnetArray(ElementArray):
         self,
         arrayName: str,
         magnets: list[CombinedFunctionMagnet],
-        use_aggregator=False,
+        use_aggregator=True,
     ):
         super().__init__(arrayName, magnets, use_aggregator)
 
         self.__rwstrengths = RWMagnetStrengths(arrayName, magnets)
         self.__rwhardwares = RWMagnetHardwares(arrayName, magnets)
 
-        if use_aggregator:
-            raise (PyAMLException("Aggregator not implemented for CombinedFunctionMagnetArray"))
+        if use_aggregator and len(magnets) > 0:
+            aggs = self.get_peer().create_cfm_strength_aggregator(magnets)
+            aggh = self.get_peer().create_cfm_hardware_aggregator(magnets)
+            self.__rwstrengths.set_aggregator(aggs)
+            self.__rwhardwares.set_aggregator(aggh)
 
     @property
     def strengths(self) -> RWMagnetStrengths:
@@ -1,7 +1,12 @@
+import asyncio
+from typing import Callable
+
 import numpy as np
 
 from ..common.abstract import ReadWriteFloatArray
 from ..common.abstract_aggregator import ScalarAggregator
+from ..common.constants import Action
+from ..common.ramp import DEFAULT_RAMP_PERIOD, DEFAULT_RAMP_STEPS, Ramp
 from ..magnet.magnet import Magnet
 from .element_array import ElementArray
 
@@ -31,12 +36,47 @@ class RWMagnetStrength(ReadWriteFloatArray):
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if not self.__aggregator:
+            for idx, m in enumerate(self.__magnets):
+                m.strength.set_and_wait(nvalue[idx])
+        else:
+            self.__aggregator.set_and_wait(nvalue)
+
+    # Gets the values asynchronously
+    async def get_async(self) -> np.array:
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(m.strength.get) for m in self.__magnets])
+            return np.array(values)
+        else:
+            return await self.__aggregator.get_async()
+
+    # Sets the values asynchronously
+    async def set_async(self, value: np.array):
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if not self.__aggregator:
+            await asyncio.gather(*[asyncio.to_thread(m.strength.set, nvalue[idx]) for idx, m in enumerate(self.__magnets)])
+        else:
+            await self.__aggregator.set_async(nvalue)
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
         return [m.strength.unit() for m in self.__magnets]
 
+    # Ramps the values in interpolated steps from a background thread
+    def ramp(
+        self,
+        value: np.array,
+        nb_step: int = DEFAULT_RAMP_STEPS,
+        period: float = DEFAULT_RAMP_PERIOD,
+        max_rate: float | np.ndarray | None = None,
+        callback: Callable[[Action, dict], bool] | None = None,
+    ) -> Ramp:
+        """Starts a ramp to the given values, see :py:class:`~pyaml.common.ramp.Ramp`"""
+        ramp = Ramp(self, value, nb_step, period, max_rate, callback)
+        ramp.start()
+        return ramp
+
     # Set the aggregator (Control system only)
     def set_aggregator(self, agg: ScalarAggregator):
         self.__aggregator = agg
@@ -67,12 +107,67 @@ class RWMagnetHardware(ReadWriteFloatArray):
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if not self.__aggregator:
+            for idx, m in enumerate(self.__magnets):
+                m.hardware.set_and_wait(nvalue[idx])
+        else:
+            self.__aggregator.set_and_wait(nvalue)
+
+    # Gets the values asynchronously
+    async def get_async(self) -> np.array:
+        if not self.__aggregator:
+            values = await asyncio.gather(*[asyncio.to_thread(m.hardware.get) for m in self.__magnets])
+            return np.array(values)
+        else:
+            return await self.__aggregator.get_async()
+
+    # Sets the values asynchronously
+    async def set_async(self, value: np.array):
+        nvalue = np.ones(self.__nb) * value if isinstance(value, float) else value
+        if not self.__aggregator:
+            await asyncio.gather(*[asyncio.to_thread(m.hardware.set, nvalue[idx]) for idx, m in enumerate(self.__magnets)])
+        else:
+            await self.__aggregator.set_async(nvalue)
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
+        if self.__aggregator:
+            # Magnets without hardware accessor may be handled by the aggregator
+            return list(self.__aggregator.unit())
         return [m.hardware.unit() for m in self.__magnets]
 
+    # Ramps the values in interpolated steps from a background thread
+    def ramp(
+        self,
+        value: np.array,
+        nb_step: int = DEFAULT_RAMP_STEPS,
+        period: float = DEFAULT_RAMP_PERIOD,
+        max_rate: float | np.ndarray | None = None,
+        callback: Callable[[Action, dict], bool] | None = None,
+    ) -> Ramp:
+        """
+        Starts a ramp to the given values, see :py:class:`~pyaml.common.ramp.Ramp`.
+        If max_rate is not given, the slew rates of the power supplies are used
+        (see DeviceAccess.get_max_rate()).
+        """
+        if max_rate is None:
+            max_rate = self.get_max_rate()
+        ramp = Ramp(self, value, nb_step, period, max_rate, callback)
+        ramp.start()
+        return ramp
+
+    # Gets the slew rates of the magnets
+    def get_max_rate(self) -> np.ndarray | None:
+        """
+        Returns the slew rate of each magnet, infinite for magnets without
+        limit, None if no magnet is limited
+        """
+        rates = [m.hardware.get_max_rate() if hasattr(m.hardware, "get_max_rate") else None for m in self.__magnets]
+        if all(r is None for r in rates):
+            return None
+        return np.array([np.inf if r is None else r for r in rates], dtype=float)
+
     # Set the aggregator
     def set_aggregator(self, agg: ScalarAggregator):
         self.__aggregator = agg
@@ -1,32 +1,41 @@
 import numpy as np
 
 from ..common.abstract import ReadWriteFloatArray
-from ..common.exception import PyAMLException
+from ..common.abstract_aggregator import ScalarAggregator
 from ..magnet.serialized_magnet import SerializedMagnets
 from .element_array import ElementArray
 
-# TODO handle aggregator for serialized magnets
-
 
 class RWMagnetStrengths(ReadWriteFloatArray):
     def __init__(self, name: str, magnets: list[SerializedMagnets]):
         self.__name = name
         self.__magnets = magnets
         self.__nb = sum(m.get_nb_magnets() for m in magnets)
+        self.__aggregator: ScalarAggregator = None
 
     # Gets the values
     def get(self) -> np.array:
+        if self.__aggregator:
+            return self.__aggregator.get()
         return np.array([m.strength.get() for m in self.__magnets])
 
     # Sets the values
     def set(self, value: np.array):
         nvalue = np.ones(len(self.__magnets)) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set(nvalue)
+            return
         for value, m in zip(nvalue, self.__magnets, strict=True):
             m.strength.set(value)
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(len(self.__magnets)) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set_and_wait(nvalue)
+            return
+        for value, m in zip(nvalue, self.__magnets, strict=True):
+            m.strength.set_and_wait(value)
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
@@ -35,26 +44,41 @@ class RWMagnetStrengths(ReadWriteFloatArray):
             r.extend(m.strength.unit())
         return r
 
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        self.__aggregator = agg
+
 
 class RWMagnetHardwares(ReadWriteFloatArray):
     def __init__(self, name: str, magnets: list[SerializedMagnets]):
         self.__name = name
         self.__magnets = magnets
         self.__nb = sum(m.get_nb_magnets() for m in magnets)
+        self.__aggregator: ScalarAggregator = None
 
     # Gets the values
     def get(self) -> np.array:
+        if self.__aggregator:
+            return self.__aggregator.get()
         return np.array([m.hardware.get() for m in self.__magnets])
 
     # Sets the values
     def set(self, value: np.array):
         nvalue = np.ones(len(self.__magnets)) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set(nvalue)
+            return
         for value, m in zip(nvalue, self.__magnets, strict=True):
             m.hardware.set(value)
 
     # Sets the values and waits that the read values reach their setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        nvalue = np.ones(len(self.__magnets)) * value if isinstance(value, float) else value
+        if self.__aggregator:
+            self.__aggregator.set_and_wait(nvalue)
+            return
+        for value, m in zip(nvalue, self.__magnets, strict=True):
+            m.hardware.set_and_wait(value)
 
     # Gets the unit of the values
     def unit(self) -> list[str]:
@@ -63,6 +87,10 @@ class RWMagnetHardwares(ReadWriteFloatArray):
             r.extend(m.hardware.unit())
         return r
 
+    # Set the aggregator (Control system only)
+    def set_aggregator(self, agg: ScalarAggregator):
+        self.__aggregator = agg
+
 
 class SerializedMagnetsArray(ElementArray):
     """
@@ -84,15 +112,18 @@ class SerializedMagnetsArray(ElementArray):
         self,
         arrayName: str,
         magnets: list[SerializedMagnets],
-        use_aggregator=False,
+        use_aggregator=True,
     ):
         super().__init__(arrayName, magnets, use_aggregator)
 
         self.__rwstrengths = RWMagnetStrengths(arrayName, magnets)
         self.__rwhardwares = RWMagnetHardwares(arrayName, magnets)
 
-        if use_aggregator:
-            raise (PyAMLException("Aggregator not implemented for SerializedMagnetsArray"))
+        if use_aggregator and len(magnets) > 0:
+            aggs = self.get_peer().create_serialized_strength_aggregator(magnets)
+            aggh = self.get_peer().create_serialized_hardware_aggregator(magnets)
+            self.__rwstrengths.set_aggregator(aggs)
+            self.__rwhardwares.set_aggregator(aggh)
 
     @property
     def strengths(self) -> RWMagnetStrengths:
@@ -1,6 +1,7 @@
 from ..common.abstract import ReadFloatArray, ReadWriteFloatArray, ReadWriteFloatScalar
 from ..common.element import Element, ElementConfigModel
 from ..common.exception import PyAMLException
+from ..common.lazy import LazyAccessor, resolve
 
 try:
     from typing import Self  # Python 3.11+
@@ -77,6 +78,7 @@ class BPM(Element):
         """
         if self._positions is None:
             raise PyAMLException(f"{str(self)} has no attached positions")
+        self._positions = resolve(self._positions)
         return self._positions
 
     @property
@@ -96,6 +98,7 @@ class BPM(Element):
         """
         if self._offset is None:
             raise PyAMLException(f"{str(self)} has no attached offset")
+        self._offset = resolve(self._offset)
         return self._offset
 
     @property
@@ -115,14 +118,15 @@ class BPM(Element):
         """
         if self._tilt is None:
             raise PyAMLException(f"{str(self)} has no attached tilt")
+        self._tilt = resolve(self._tilt)
         return self._tilt
 
     def attach(
         self,
         peer,
-        positions: ReadFloatArray,
-        offset: ReadWriteFloatArray,
-        tilt: ReadWriteFloatScalar,
+        positions: ReadFloatArray | LazyAccessor,
+        offset: ReadWriteFloatArray | LazyAccessor,
+        tilt: ReadWriteFloatScalar | LazyAccessor,
     ) -> Self:
         """
         Attach BPM attributes to a peer.
@@ -138,6 +142,8 @@ class BPM(Element):
         tilt : RWBpmTiltScalar
             BPM tilt angle for rotation correction
 
+        Accessors given as LazyAccessor are created on first use.
+
         Returns
         -------
         Self
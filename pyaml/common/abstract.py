@@ -115,13 +115,10 @@ class RWMapper(ReadWriteFloatScalar):
         ----------
         value : float
             Target value to set and wait for
-
-        Raises
-        ------
-        NotImplementedError
-            This method is not yet implemented
         """
-        raise NotImplementedError("Not implemented yet.")
+        arr = self.bind.get()
+        arr[self.idx] = value
+        self.bind.set_and_wait(arr)
 
     # Return the unit
     def unit(self) -> str:
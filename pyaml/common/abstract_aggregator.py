@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
 
 import numpy as np
@@ -33,3 +34,15 @@ class ScalarAggregator(metaclass=ABCMeta):
     def unit(self) -> str:
         """Return the variables unit"""
         pass
+
+    async def set_async(self, value: npt.NDArray[np.float64]):
+        """Asynchronous version of set(), offloaded to a worker thread by default"""
+        await asyncio.to_thread(self.set, value)
+
+    async def get_async(self) -> npt.NDArray[np.float64]:
+        """Asynchronous version of get(), offloaded to a worker thread by default"""
+        return await asyncio.to_thread(self.get)
+
+    async def readback_async(self) -> np.array:
+        """Asynchronous version of readback(), offloaded to a worker thread by default"""
+        return await asyncio.to_thread(self.readback)
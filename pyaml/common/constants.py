@@ -23,3 +23,5 @@ class Action(Enum):
     "Triggered imediatly after actuator has been restored to initial value"
     MEASURE = 2
     "Triggered imediatly after measurement"
+    CANCEL = 3
+    "Triggered when an operation (i.e. a ramp) has been cancelled"
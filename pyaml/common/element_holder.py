@@ -7,6 +7,9 @@ import re
 from abc import ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ..arrays.bpm_array import BPMArray
 from ..arrays.cfm_magnet_array import CombinedFunctionMagnetArray
 from ..arrays.element_array import ElementArray
@@ -15,6 +18,10 @@ from ..arrays.serialized_magnet_array import SerializedMagnetsArray
 from ..bpm.bpm import BPM
 from ..common.abstract_aggregator import ScalarAggregator
 from ..common.exception import PyAMLException
+from ..common.transaction import WriteTransaction
+from ..control.availability import DEFAULT_AVAILABILITY_TIMEOUT, AvailabilityReport, check_devices
+from ..control.multireader import MultiReader
+from ..diagnostics.atune_monitor import ABetatronTuneMonitor
 from ..diagnostics.tune_monitor import BetatronTuneMonitor
 from ..magnet.cfm_magnet import CombinedFunctionMagnet
 from ..magnet.magnet import Magnet
@@ -26,6 +33,7 @@ from .element import Element
 
 if TYPE_CHECKING:
     from ..accelerator import Accelerator
+    from ..control.deviceaccess import DeviceAccess
     from ..tuning_tools.chromaticity import Chromaticity
     from ..tuning_tools.chromaticity_response_matrix import ChromaticityResponseMatrix
     from ..tuning_tools.dispersion import Dispersion
@@ -86,6 +94,102 @@ class ElementHolder(metaclass=ABCMeta):
     def fill_device(self, elements: list[Element]):
         raise PyAMLException("ElementHolder.fill_device() is not subclassed")
 
+    def _get_attached_devices(self) -> list["DeviceAccess"]:
+        """Returns the devices used by the attached elements, none for a simulator"""
+        return []
+
+    def check_availability(self, timeout: float = DEFAULT_AVAILABILITY_TIMEOUT) -> AvailabilityReport:
+        """
+        Probes all the devices used by the attached elements concurrently.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum duration of the check in seconds, devices that did not
+            answer in time are reported as unavailable
+
+        Returns
+        -------
+        AvailabilityReport
+            Report of unavailable devices
+        """
+        return check_devices(self.name(), self._get_attached_devices(), timeout)
+
+    def transaction(self, wait: bool = False) -> WriteTransaction:
+        """
+        Creates a transaction grouping setpoints of several arrays or scalars of
+        this holder, applied together on commit.
+
+        Parameters
+        ----------
+        wait : bool
+            Wait that readbacks reach the setpoints on commit
+
+        Returns
+        -------
+        WriteTransaction
+            Transaction, to be used as a context manager
+        """
+        return WriteTransaction(wait)
+
+    def create_multi_reader(self, observables: dict[str, Element | ElementArray]) -> MultiReader:
+        """
+        Creates a reader acquiring several observables together.
+
+        Parameters
+        ----------
+        observables : dict[str, Element | ElementArray]
+            Observables by name: a betatron tune monitor (tune), an RF plant
+            (frequency), a BPM or a BPM array (positions)
+
+        Returns
+        -------
+        MultiReader
+            Reader of the observables
+        """
+        reader = self._create_multi_reader()
+        for name, obs in observables.items():
+            self._add_observable(reader, name, obs)
+        return reader
+
+    def _create_multi_reader(self) -> MultiReader:
+        return MultiReader()
+
+    def _add_observable(self, reader: MultiReader, name: str, obs: Element | ElementArray):
+        """Adds an observable to a reader, control systems read devices directly when possible"""
+        if isinstance(obs, ABetatronTuneMonitor):
+            reader.add_accessor(name, obs.tune, (2,))
+        elif isinstance(obs, RFPlant):
+            reader.add_accessor(name, obs.frequency)
+        elif isinstance(obs, BPMArray):
+            reader.add_accessor(name, obs.positions, (len(obs), 2))
+        elif isinstance(obs, BPM):
+            reader.add_accessor(name, obs.positions, (2,))
+        else:
+            raise PyAMLException(f"Unsupported observable '{name}' of type {type(obs).__name__}")
+
+    def compute_orbit_response(self, bpms: list[BPM], magnets: list[Magnet], delta: float) -> NDArray[np.float64]:
+        """
+        Computes the orbit response matrix from the model, without excitation
+        of the correctors one by one. Only available on simulators.
+
+        Parameters
+        ----------
+        bpms : list[BPM]
+            Observed BPMs
+        magnets : list[Magnet]
+            Correctors
+        delta : float
+            Corrector strength excursion used to compute the corrector kicks
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Matrix of shape (2 * len(bpms), len(magnets)), horizontal responses
+            followed by vertical responses
+        """
+        raise PyAMLException(f"{self.name()}: model orbit response is only available on simulators")
+
     # Aggregators
 
     @abstractmethod
@@ -100,6 +204,34 @@ class ElementHolder(metaclass=ABCMeta):
     def create_bpm_aggregators(self, bpms: list[BPM]) -> list[ScalarAggregator | None]:
         pass
 
+    @abstractmethod
+    def create_bpm_offset_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_bpm_tilt_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_bpm_snapshot_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_cfm_strength_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_cfm_hardware_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_serialized_strength_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator | None:
+        pass
+
+    @abstractmethod
+    def create_serialized_hardware_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator | None:
+        pass
+
     # Elements
 
     def find_elements(self, filter: str) -> list[str]:
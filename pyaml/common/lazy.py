@@ -0,0 +1,42 @@
+"""
+Deferred construction of element accessors.
+"""
+
+import threading
+from typing import Any, Callable
+
+
+class LazyAccessor:
+    """
+    Holds the factory of an element accessor (i.e. the strength of a magnet)
+    which is constructed on first use. Used by control systems in lazy attach
+    mode so that devices are only resolved and connected when needed.
+
+    Parameters
+    ----------
+    factory : Callable[[], Any]
+        Function creating the accessor
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.__factory = factory
+        self.__value = None
+        self.__lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Returns the accessor, creating it on the first call"""
+        if self.__factory is not None:
+            with self.__lock:
+                if self.__factory is not None:
+                    self.__value = self.__factory()
+                    self.__factory = None
+        return self.__value
+
+    def is_resolved(self) -> bool:
+        """Tells if the accessor has been created"""
+        return self.__factory is None
+
+
+def resolve(accessor: Any) -> Any:
+    """Returns the accessor held by a LazyAccessor or the given object otherwise"""
+    return accessor.get() if isinstance(accessor, LazyAccessor) else accessor
@@ -0,0 +1,181 @@
+"""
+Ramping of array setpoints in interpolated steps.
+"""
+
+import logging
+import math
+import threading
+from typing import Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from .constants import Action
+from .exception import PyAMLException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RAMP_STEPS = 10
+"""Default minimum number of ramp steps"""
+DEFAULT_RAMP_PERIOD = 0.1
+"""Default time between two ramp steps in seconds"""
+
+
+class Ramp:
+    """
+    Moves an accessor (i.e. the strengths or hardware values of a magnet array)
+    from its current setpoints to a target in linearly interpolated steps.
+    Steps are written from a background thread at a fixed cadence, each step
+    is a single write of the whole array so that array aggregators apply it in
+    one backend call.
+
+    The number of steps is increased when needed so that no channel changes by
+    more than max_rate * period between two steps. Slew limits require a
+    strictly positive period.
+
+    The callback is called with Action.APPLY after each step and with
+    Action.CANCEL if the ramp is cancelled. If the callback returns False, the
+    ramp is cancelled and setpoints stay at the last applied step.
+
+    Parameters
+    ----------
+    accessor : ReadWriteFloatArray
+        Accessor to ramp
+    target : np.array
+        Final setpoints
+    nb_step : int
+        Minimum number of steps
+    period : float
+        Time between two steps in seconds
+    max_rate : float | np.array, optional
+        Maximum change per second, for all channels or per channel, in the
+        unit of the accessor. Channels with an infinite rate are not limited.
+    callback : Callable, optional
+        callback(action: Action, data: dict) -> bool, data contains the step
+        index ("step"), the number of steps ("nb_step"), the applied setpoints
+        ("value") and the ramp ("source")
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        >>> ramp = quads.strengths.ramp(target, period=0.2, max_rate=0.01)
+        >>> ramp.wait()
+    """
+
+    def __init__(
+        self,
+        accessor: Any,
+        target: npt.ArrayLike,
+        nb_step: int = DEFAULT_RAMP_STEPS,
+        period: float = DEFAULT_RAMP_PERIOD,
+        max_rate: float | npt.ArrayLike | None = None,
+        callback: Callable[[Action, dict], bool] | None = None,
+    ):
+        if nb_step < 1:
+            raise PyAMLException(f"Ramp: number of steps must be strictly positive, got {nb_step}")
+        if period < 0:
+            raise PyAMLException(f"Ramp: period must be positive, got {period}")
+        self.__accessor = accessor
+        self.__target = np.asarray(target, dtype=float)
+        self.__min_step = nb_step
+        self.__period = period
+        self.__max_rate = None if max_rate is None else np.asarray(max_rate, dtype=float)
+        if self.__max_rate is not None and np.any(~(self.__max_rate > 0)):
+            raise PyAMLException("Ramp: max_rate must be strictly positive")
+        if self.__max_rate is not None and period == 0:
+            raise PyAMLException("Ramp: max_rate requires a strictly positive period")
+        self.__callback = callback
+        self.__nb_step = 0
+        self.__step = 0
+        self.__cancel = threading.Event()
+        self.__thread: threading.Thread | None = None
+        self.__error: Exception | None = None
+
+    def start(self):
+        """Reads the initial setpoints and starts the ramp thread"""
+        if self.__thread is not None:
+            raise PyAMLException("Ramp already started")
+        start = np.asarray(self.__accessor.get(), dtype=float)
+        steps = self.__compute_steps(start)
+        self.__nb_step = len(steps)
+        self.__thread = threading.Thread(target=self.__run, args=(steps,), name=f"pyaml-ramp-{id(self):x}", daemon=True)
+        self.__thread.start()
+
+    def __compute_steps(self, start: npt.NDArray[np.float64]) -> list[npt.NDArray[np.float64]]:
+        delta = np.broadcast_to(self.__target, start.shape) - start
+        nb = self.__min_step
+        if self.__max_rate is not None:
+            nb = max(nb, math.ceil(np.max(np.abs(delta) / (self.__max_rate * self.__period), initial=0.0)))
+        return [start + delta * (i / nb) for i in range(1, nb + 1)]
+
+    def __run(self, steps: list[npt.NDArray[np.float64]]):
+        try:
+            for i, value in enumerate(steps):
+                if i > 0 and self.__cancel.wait(self.__period):
+                    break
+                self.__accessor.set(value)
+                self.__step = i + 1
+                if not self.__notify(Action.APPLY, value):
+                    self.__cancel.set()
+                    break
+            if self.__cancel.is_set():
+                self.__notify(Action.CANCEL, steps[self.__step - 1] if self.__step > 0 else None)
+        except Exception as ex:
+            logger.error(f"Ramp of {self.__accessor} failed at step {self.__step + 1}/{self.__nb_step}: {ex}")
+            self.__error = ex
+
+    def __notify(self, action: Action, value: npt.NDArray[np.float64] | None) -> bool:
+        if self.__callback is None:
+            return True
+        data = {"step": self.__step, "nb_step": self.__nb_step, "value": value, "source": self}
+        return self.__callback(action, data) is not False
+
+    def cancel(self):
+        """Stops the ramp after the current step, setpoints stay at the last applied step"""
+        self.__cancel.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits for the end of the ramp.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time in seconds, no timeout by default
+
+        Returns
+        -------
+        bool
+            True if the ramp is over (completed or cancelled), False on timeout
+
+        Raises
+        ------
+        PyAMLException
+            If a step could not be applied
+        """
+        if self.__thread is None:
+            raise PyAMLException("Ramp not started")
+        self.__thread.join(timeout)
+        if self.__error is not None:
+            raise PyAMLException(f"Ramp failed at step {self.__step + 1}/{self.__nb_step}: {self.__error}") from self.__error
+        return not self.__thread.is_alive()
+
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def is_cancelled(self) -> bool:
+        return self.__cancel.is_set()
+
+    def get_step(self) -> int:
+        """Returns the number of applied steps"""
+        return self.__step
+
+    def get_nb_step(self) -> int:
+        """Returns the total number of steps"""
+        return self.__nb_step
+
+    def progress(self) -> float:
+        """Returns the fraction of applied steps"""
+        return self.__step / self.__nb_step if self.__nb_step > 0 else 0.0
@@ -0,0 +1,189 @@
+"""
+Grouped write of setpoints to several element accessors.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from .exception import PyAMLException
+
+
+class WriteTransaction:
+    """
+    Collects setpoints of several accessors (magnet arrays, RF frequency, ...)
+    and applies them together on :py:meth:`commit`.
+
+    On commit, current values needed by relative changes (see :py:meth:`add`)
+    are read concurrently, then all setpoints are written concurrently. Array
+    accessors keep using their aggregator, so that each array is written in a
+    single backend call. Compared to a sequence of get()/set() calls, this
+    reduces the number of round trips and the time the machine spends with
+    only part of the correction applied. A transaction is only useful to
+    group several accessors, a single accessor is written by its own set().
+
+    The commit is not atomic: each accessor is written by its own backend
+    call and there is no rollback. If some writes fail, the other setpoints
+    stay applied and a PyAMLException lists the failed accessors.
+
+    Used as a context manager, the transaction is committed on exit unless an
+    exception is raised within the block, in which case nothing is written.
+
+    Parameters
+    ----------
+    wait : bool
+        Use set_and_wait() instead of set() on commit
+    concurrent : bool
+        Overlap reads and writes on commit, when False accessors are accessed
+        sequentially (i.e. in-process simulators)
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        >>> with sr.live.transaction() as tx:
+        ...     tx.add(hvcorr.strengths, dk)
+        ...     tx.add(rf.frequency, df)
+    """
+
+    def __init__(self, wait: bool = False, concurrent: bool = True):
+        self.__wait = wait
+        self.__concurrent = concurrent
+        self.__entries: dict[int, list] = {}  # id(accessor) -> [accessor, value, relative]
+        self.__committed = False
+
+    def set(self, accessor: Any, value: Any):
+        """
+        Stages an absolute setpoint, replaces any setpoint previously staged
+        for the same accessor.
+
+        Parameters
+        ----------
+        accessor : ReadWriteFloatScalar | ReadWriteFloatArray
+            Accessor to write
+        value : float | np.array
+            Setpoint
+        """
+        self.__check_open()
+        self.__entries[id(accessor)] = [accessor, self.__copy(value), False]
+
+    def add(self, accessor: Any, delta: Any):
+        """
+        Stages a relative change. The current value is read on commit, unless
+        an absolute setpoint has already been staged for the accessor.
+
+        Parameters
+        ----------
+        accessor : ReadWriteFloatScalar | ReadWriteFloatArray
+            Accessor to write
+        delta : float | np.array
+            Change to apply
+        """
+        self.__check_open()
+        entry = self.__entries.get(id(accessor))
+        if entry is None:
+            self.__entries[id(accessor)] = [accessor, self.__copy(delta), True]
+        else:
+            entry[1] = entry[1] + delta
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def is_committed(self) -> bool:
+        return self.__committed
+
+    def discard(self):
+        """Drops all staged setpoints"""
+        self.__check_open()
+        self.__entries.clear()
+
+    def commit(self):
+        """
+        Applies all staged setpoints.
+
+        Raises
+        ------
+        PyAMLException
+            If one or several writes failed, other setpoints are applied
+        """
+        self.__check_open()
+        self.__committed = True
+        entries = list(self.__entries.values())
+        if len(entries) == 0:
+            return
+        if len(entries) == 1 or not self.__concurrent:
+            for e in entries:
+                if e[2]:
+                    e[1] = e[0].get() + e[1]
+            errors = []
+            for accessor, value, _ in entries:
+                try:
+                    self.__write(accessor, value)
+                    errors.append((accessor, None))
+                except Exception as ex:
+                    errors.append((accessor, ex))
+            self.__raise_errors(errors)
+            return
+        with ThreadPoolExecutor(max_workers=len(entries), thread_name_prefix="pyaml-transaction") as executor:
+            relatives = [e for e in entries if e[2]]
+            currents = executor.map(lambda e: e[0].get(), relatives)
+            for e, current in zip(relatives, currents, strict=True):
+                e[1] = current + e[1]
+            futures = [(e[0], executor.submit(self.__write, e[0], e[1])) for e in entries]
+            self.__raise_errors([(a, f.exception()) for a, f in futures])
+
+    async def commit_async(self):
+        """
+        Asynchronous version of :py:meth:`commit`, accessors providing
+        get_async()/set_async() are used on the event loop, others in threads.
+        """
+        self.__check_open()
+        self.__committed = True
+        entries = list(self.__entries.values())
+        relatives = [e for e in entries if e[2]]
+        currents = await asyncio.gather(*[self.__get_async(e[0]) for e in relatives])
+        for e, current in zip(relatives, currents, strict=True):
+            e[1] = current + e[1]
+        results = await asyncio.gather(*[self.__write_async(e[0], e[1]) for e in entries], return_exceptions=True)
+        self.__raise_errors([(e[0], r if isinstance(r, Exception) else None) for e, r in zip(entries, results, strict=True)])
+
+    def __write(self, accessor: Any, value: Any):
+        if self.__wait:
+            accessor.set_and_wait(value)
+        else:
+            accessor.set(value)
+
+    async def __get_async(self, accessor: Any) -> Any:
+        if hasattr(accessor, "get_async"):
+            return await accessor.get_async()
+        return await asyncio.to_thread(accessor.get)
+
+    async def __write_async(self, accessor: Any, value: Any):
+        if not self.__wait and hasattr(accessor, "set_async"):
+            await accessor.set_async(value)
+        else:
+            await asyncio.to_thread(self.__write, accessor, value)
+
+    @staticmethod
+    def __raise_errors(results: list[tuple[Any, BaseException | None]]):
+        errors = [f"{accessor}: {ex}" for accessor, ex in results if ex is not None]
+        if errors:
+            raise PyAMLException("Transaction partially applied, write failed for:\n" + "\n".join(errors))
+
+    @staticmethod
+    def __copy(value: Any) -> Any:
+        return np.array(value, dtype=float) if isinstance(value, (list, tuple, np.ndarray)) else value
+
+    def __check_open(self):
+        if self.__committed:
+            raise PyAMLException("Transaction already committed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and not self.__committed:
+            self.commit()
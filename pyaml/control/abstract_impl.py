@@ -1,4 +1,6 @@
-from typing import Any
+import asyncio
+import time
+from typing import Any, Callable
 
 import numpy as np
 from numpy import double
@@ -9,10 +11,16 @@ from ..common import abstract
 from ..common.abstract_aggregator import ScalarAggregator
 from ..control.deviceaccess import DeviceAccess
 from ..control.deviceaccesslist import DeviceAccessList
+from ..magnet.cfm_magnet import CombinedFunctionMagnet
+from ..magnet.linear_serialized_model import LinearSerializedMagnetModel
 from ..magnet.magnet import Magnet
 from ..magnet.model import MagnetModel
+from ..magnet.serialized_magnet import SerializedMagnets
 from ..rf.rf_plant import RFPlant
 from ..rf.rf_transmitter import RFTransmitter
+from .monitor import DEFAULT_CAPACITY, DEFAULT_POLL_PERIOD, Monitor
+from .readback_value import ValueArray
+from .setpoint_wait import wait_for_device_list, wait_for_devices
 
 # ------------------------------------------------------------------------------
 
@@ -34,48 +42,78 @@ def check_range(values: Any, dev_range: Any) -> bool:
         - N == 1 and K > 1: the single value must satisfy ALL ranges
         - N > 1 and K == 1: the single range applies to ALL values
     """
-    # ---- Normalize values to a 1D float array ----
-    v = np.asarray(values, dtype=float)
-    if v.ndim == 0:
-        v = v.reshape(1)
-    else:
-        v = v.ravel()
-    n = v.size
+    mins, maxs = compile_range(dev_range)
+    return check_compiled_range(values, mins, maxs)
 
-    # ---- Normalize dev_range (object to preserve None) ----
+
+def compile_range(dev_range: Any) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Converts a flat range list [min1, max1, min2, max2, ...] into contiguous
+    float64 min and max arrays. None bounds are replaced by -inf / +inf.
+    """
     r = np.asarray(dev_range, dtype=object).ravel()
     if (r.size % 2) != 0:
         raise ValueError(f"dev_range must have an even length, got {r.size}")
+    mins = r[0::2]
+    maxs = r[1::2]
+    mins_f = np.where(np.equal(mins, None), -np.inf, mins).astype(np.float64)
+    maxs_f = np.where(np.equal(maxs, None), +np.inf, maxs).astype(np.float64)
+    return np.ascontiguousarray(mins_f), np.ascontiguousarray(maxs_f)
 
-    mins_obj = r[0::2]
-    maxs_obj = r[1::2]
-    k = mins_obj.size
 
-    # ---- Broadcasting rules ----
-    if n == k:
-        vv = v
-        mins = mins_obj
-        maxs = maxs_obj
-    elif n == 1 and k > 1:
-        vv = np.full(k, v[0], dtype=float)
-        mins = mins_obj
-        maxs = maxs_obj
-    elif n > 1 and k == 1:
-        vv = v
-        mins = np.full(n, mins_obj[0], dtype=object)
-        maxs = np.full(n, maxs_obj[0], dtype=object)
-    else:
+def check_compiled_range(values: Any, mins: NDArray[np.float64], maxs: NDArray[np.float64]) -> bool:
+    """
+    Check whether values are within ranges returned by compile_range().
+    Same semantics and broadcasting rules as check_range().
+    """
+    v = _as_1d_float_array(values)
+    n = v.size
+    k = mins.size
+    if n != k and n != 1 and k != 1:
         raise ValueError(f"Inconsistent sizes: {n} value(s) for {k} range(s). Supported: N==K, N==1, or K==1.")
+    return bool(np.all((v >= mins) & (v <= maxs)))
 
-    # ---- Replace None bounds with -inf / +inf (NumPy-safe) ----
-    mins_is_none = np.equal(mins, None)
-    maxs_is_none = np.equal(maxs, None)
 
-    mins_f = np.where(mins_is_none, -np.inf, mins).astype(float)
-    maxs_f = np.where(maxs_is_none, +np.inf, maxs).astype(float)
+class RangeTable:
+    """
+    Ranges of a set of devices, fetched once (on first check or on explicit
+    refresh) and stored as contiguous float64 min and max arrays.
 
-    # ---- Vectorized range check ----
-    return bool(np.all((vv >= mins_f) & (vv <= maxs_f)))
+    Parameters
+    ----------
+    devs : DeviceAccess | DeviceAccessList | list[DeviceAccess]
+        Devices whose ranges are checked
+    """
+
+    def __init__(self, devs: DeviceAccess | DeviceAccessList | list[DeviceAccess]):
+        self.__devs = devs
+        self.__mins: NDArray[np.float64] | None = None
+        self.__maxs: NDArray[np.float64] | None = None
+
+    def refresh(self):
+        """Fetches device ranges"""
+        devs = [self.__devs] if isinstance(self.__devs, DeviceAccess) else self.__devs
+        if isinstance(devs, list):
+            dev_range = []
+            for d in devs:
+                r = d.get_range()
+                dev_range.extend(r if r is not None else [None, None])
+        else:
+            dev_range = devs.get_range()
+        self.__mins, self.__maxs = compile_range(dev_range)
+
+    def reset(self):
+        """Ranges will be fetched again on next check"""
+        self.__mins = None
+        self.__maxs = None
+
+    def check(self, values: Any) -> bool:
+        """
+        Check whether values are within device ranges, see check_range().
+        """
+        if self.__mins is None:
+            self.refresh()
+        return check_compiled_range(values, self.__mins, self.__maxs)
 
 
 def _as_1d_float_array(values: Any) -> np.ndarray:
@@ -93,6 +131,7 @@ def _iter_devices_and_ranges(devs: DeviceAccess | DeviceAccessList):
     Works for:
       - DeviceAccess: yields 1 item
       - DeviceAccessList: yields N items based on get_devices() and get_range() flattening
+      - list[DeviceAccess]: yields 1 item per device
     """
     # Single device
     if isinstance(devs, DeviceAccess):
@@ -101,6 +140,10 @@ def _iter_devices_and_ranges(devs: DeviceAccess | DeviceAccessList):
             r = [None, None]
         return [(devs, [r[0], r[1]])]
 
+    # List of devices
+    if isinstance(devs, list):
+        return [p for d in devs for p in _iter_devices_and_ranges(d)]
+
     # get_range() return a flat list
     flat = devs.get_range()
     if (len(flat) % 2) != 0:
@@ -115,7 +158,7 @@ def _iter_devices_and_ranges(devs: DeviceAccess | DeviceAccessList):
 
 def format_out_of_range_message(
     values: Any,
-    devs: DeviceAccess | DeviceAccessList,
+    devs: DeviceAccess | DeviceAccessList | list[DeviceAccess],
     *,
     header: str = "Values out of range:",
 ) -> str:
@@ -171,33 +214,160 @@ def format_out_of_range_message(
 
 class CSScalarAggregator(ScalarAggregator):
     """
-    Basic control system aggregator for a list of scalar values
+    Basic control system aggregator for a list of scalar values.
+
+    When devices define a dead-band (see DeviceAccess.get_deadband()), writes
+    changing a channel by less than its dead-band with respect to its current
+    setpoint are dropped. If the DeviceAccessList supports sparse writes, only
+    the changed channels are written, otherwise the whole vector is written as
+    soon as one channel changes.
+
+    The reference setpoints are the values last written by this aggregator,
+    the first write (or the first one after reset_write_filter()) writes all
+    channels. Setpoints written by other means are not seen, unless a write
+    filter staleness is set, in which case the current setpoints are read
+    again once the last written values are older than the staleness.
     """
 
     def __init__(self, devs: DeviceAccessList):
         self._devs = devs
+        self.__deadbands: NDArray[np.float64] | None = None  # Fetched on first write
+        self.__last_written: NDArray[np.float64] | None = None
+        self.__last_time = 0.0
+        self.__staleness: float | None = None
+        self.__nb_suppressed = 0
 
     def add_devices(self, devices: DeviceAccess | list[DeviceAccess]):
         self._devs.add_devices(devices)
+        self.reset_write_filter()
+
+    def reset_write_filter(self):
+        """Fetches again device dead-bands, the next write is a full write"""
+        self.__deadbands = None
+        self.__last_written = None
+
+    def set_write_filter_staleness(self, staleness: float | None):
+        """
+        Sets the maximum age of the values last written by this aggregator
+        to be used as dead-band reference, older values are replaced by the
+        current setpoints read before writing.
+
+        Parameters
+        ----------
+        staleness : float | None
+            Maximum age in seconds, None (default) for no limit
+        """
+        self.__staleness = staleness
+
+    def nb_suppressed_write(self) -> int:
+        """Returns the number of channel writes dropped by the dead-band filter"""
+        return self.__nb_suppressed
+
+    def __get_deadbands(self) -> NDArray[np.float64]:
+        if self.__deadbands is None:
+            deadbands = [self._devs.get_device_at(i).get_deadband() for i in range(self._devs.len())]
+            self.__deadbands = np.array([np.nan if d is None else d for d in deadbands], dtype=float)
+        return self.__deadbands
+
+    def __needs_reference(self) -> bool:
+        """Returns True if the last written values are too old to be used as dead-band reference"""
+        if self.__last_written is None or self.__staleness is None or np.all(np.isnan(self.__get_deadbands())):
+            return False
+        return time.monotonic() - self.__last_time > self.__staleness
+
+    def __cached_reference(self) -> NDArray[np.float64] | None:
+        if self.__last_written is None or np.all(np.isnan(self.__get_deadbands())):
+            return None
+        return self.__last_written
+
+    def _channels_to_write(self, value: NDArray[np.float64], reference: NDArray[np.float64] | None) -> NDArray[np.intp] | None:
+        """
+        Applies the dead-band filter against the reference setpoints, returns
+        the indices of the channels to write, None for all channels
+        """
+        if reference is None:
+            return None
+        changed = ~(np.abs(value - reference) <= self.__get_deadbands())
+        nbChanged = np.count_nonzero(changed)
+        if nbChanged == len(changed) or (nbChanged > 0 and not self._devs.supports_sparse_write()):
+            return None
+        return np.flatnonzero(changed)
+
+    def _commit_write(
+        self, value: NDArray[np.float64], indices: NDArray[np.intp] | None, reference: NDArray[np.float64] | None
+    ) -> NDArray[np.float64]:
+        """
+        Updates the dead-band filter reference after a successful write and
+        returns the setpoints of the devices (reference for dropped channels)
+        """
+        if indices is None:
+            written = np.array(value, dtype=float)
+        else:
+            written = np.array(reference, dtype=float)
+            written[indices] = value[indices]
+            self.__nb_suppressed += len(value) - len(indices)
+        if not np.all(np.isnan(self.__get_deadbands())):
+            self.__last_written = written
+            self.__last_time = time.monotonic()
+        return written
+
+    def _write(self, value: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Writes the given setpoints through the dead-band filter, returns the device setpoints"""
+        value = np.asarray(value, dtype=float)
+        reference = np.asarray(self._devs.get(), dtype=float) if self.__needs_reference() else self.__cached_reference()
+        indices = self._channels_to_write(value, reference)
+        if indices is None:
+            self._devs.set(value)
+        elif len(indices) > 0:
+            self._devs.set_sparse(indices, value[indices])
+        return self._commit_write(value, indices, reference)
+
+    async def _write_async(self, value: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Asynchronous version of _write()"""
+        value = np.asarray(value, dtype=float)
+        if self.__needs_reference():
+            reference = np.asarray(await self._devs.get_async(), dtype=float)
+        else:
+            reference = self.__cached_reference()
+        indices = self._channels_to_write(value, reference)
+        if indices is None:
+            await self._devs.set_async(value)
+        elif len(indices) > 0:
+            await asyncio.to_thread(self._devs.set_sparse, indices, value[indices])
+        return self._commit_write(value, indices, reference)
 
     def set(self, value: NDArray[np.float64]):
-        self._devs.set(value)
+        self._write(value)
 
     def set_and_wait(self, value: NDArray[np.float64]):
-        self._devs.set_and_wait(value)
+        # Channels dropped by the dead-band filter stay at their current setpoint
+        wait_for_device_list(self._devs, self._write(value))
 
     def get(self) -> NDArray[np.float64]:
         return self._devs.get()
 
-    def readback(self) -> np.array:
+    def readback(self) -> ValueArray:
         return self._devs.readback()
 
+    async def set_async(self, value: NDArray[np.float64]):
+        await self._write_async(value)
+
+    async def get_async(self) -> NDArray[np.float64]:
+        return await self._devs.get_async()
+
+    async def readback_async(self) -> ValueArray:
+        return await self._devs.readback_async()
+
     def unit(self) -> str:
         return self._devs.unit()
 
     def nb_device(self) -> int:
         return self._devs.len()
 
+    def monitor(self, period: float = DEFAULT_POLL_PERIOD, capacity: int = DEFAULT_CAPACITY) -> Monitor:
+        """Creates a (not started) monitor of the readbacks of the aggregated devices"""
+        return self._devs.monitor(period, capacity)
+
 
 # ------------------------------------------------------------------------------
 
@@ -209,13 +379,37 @@ class CSStrengthScalarAggregator(CSScalarAggregator):
     and applying them without overlap.
     When virtual magnets exported from combined function mangets are present (RWMapper),
     the aggregator prevents to apply several times the same power supply setpoint.
+
+    Writing strengths requires the current hardware setpoints only for models
+    whose strengths are not all part of the aggregator (i.e. a combined function
+    magnet of which only some virtual magnets are present). Those shared channels
+    are read through a dedicated aggregator (see shared_factory) or, when a shadow
+    staleness is set, taken from the last hardware setpoints written or read by
+    this aggregator.
+
+    Parameters
+    ----------
+    peer : CSScalarAggregator
+        Aggregator holding the power supply devices
+    shared_factory : Callable[[], CSScalarAggregator], optional
+        Creates the aggregator used to read the shared channels. If not given,
+        all channels are read.
     """
 
-    def __init__(self, peer: CSScalarAggregator):
+    def __init__(self, peer: CSScalarAggregator, shared_factory: Callable[[], CSScalarAggregator] | None = None):
         CSScalarAggregator.__init__(self, peer._devs)
         self.__models: list[MagnetModel] = []  # List of magnet model
         self.__modelToMagnet: list[list[tuple[int, int]]] = []  # strengths indexing
         self.__nbMagnet = 0  # Number of magnet strengths
+        self.__batches = None  # Vectorized conversions, compiled on first access
+        self.__others = None  # Models that do not support batching
+        self.__sharedIdx = None  # Hardware indices of shared models
+        self.__shared: CSScalarAggregator | None = None  # Aggregator reading shared channels
+        self.__shared_factory = shared_factory
+        self.__range = RangeTable(self._devs)
+        self.__shadow_staleness: float | None = None
+        self.__shadow: NDArray[np.float64] | None = None  # Last known hardware setpoints
+        self.__shadow_time = 0.0
 
     def add_magnet(self, magnet: Magnet, devs: list[DeviceAccess]):
         # Incoming magnet can be a magnet exported from
@@ -223,58 +417,215 @@ class CSStrengthScalarAggregator(CSScalarAggregator):
         # All magnets exported from a same CombinedFunctionMagnet share the same model
         # TODO: check that strength is supported (m.strength may be None)
         strengthIndex = magnet.strength.index() if isinstance(magnet.strength, abstract.RWMapper) else 0
-        if magnet.model not in self.__models:
-            index = len(self.__models)
-            self.__models.append(magnet.model)
+        self.__add_strength(magnet.model, strengthIndex, devs)
+
+    def add_cfm_magnet(self, magnet: CombinedFunctionMagnet, devs: list[DeviceAccess]):
+        """Adds all the strengths of a combined function magnet"""
+        for strengthIndex in range(magnet.nb_multipole()):
+            self.__add_strength(magnet.model, strengthIndex, devs)
+
+    def __add_strength(self, model: MagnetModel, strengthIndex: int, devs: list[DeviceAccess]):
+        if model not in self.__models:
+            self.__models.append(model)
             self.__modelToMagnet.append([(self.__nbMagnet, strengthIndex)])
             self._devs.add_devices(devs)
         else:
-            index = self.__models.index(magnet.model)
+            index = self.__models.index(model)
             self.__modelToMagnet[index].append((self.__nbMagnet, strengthIndex))
         self.__nbMagnet += 1
-
-    def set(self, value: NDArray[np.float64]):
-        allHardwareValues = self._devs.get()  # Read all hardware setpoints
-        newHardwareValues = np.zeros(self.nb_device())
+        self.__batches = None
+        self.__shadow = None
+        self.__range.reset()
+        self.reset_write_filter()
+
+    def refresh_range(self):
+        """Fetches again the ranges of the power supplies"""
+        self.__range.refresh()
+
+    def set_shadow_staleness(self, staleness: float | None):
+        """
+        Enables the setpoint shadow. Hardware setpoints of shared channels are
+        taken from the last values written or read by this aggregator if they
+        are younger than staleness. The same staleness applies to the dead-band
+        filter reference (see set_write_filter_staleness()), which has no age
+        limit when the shadow is disabled.
+
+        Parameters
+        ----------
+        staleness : float | None
+            Maximum age of the shadow in seconds, None to disable the shadow
+        """
+        self.__shadow_staleness = staleness
+        self.__shadow = None
+        self.set_write_filter_staleness(staleness)
+
+    def refresh_shadow(self):
+        """Forces the hardware setpoints of shared channels to be read on next write"""
+        self.__shadow = None
+
+    def nb_shared_device(self) -> int:
+        """Returns the number of channels that have to be read before a write"""
+        if self.__batches is None:
+            self._compile()
+        return len(self.__sharedIdx)
+
+    def _compile(self):
+        """
+        Groups models sharing the same batch key and builds the index arrays
+        used to convert each group with a few NumPy operations. Models that do
+        not support batching and combined function magnets of which only some
+        strengths are part of the aggregator are converted one by one.
+        """
+        groups: dict[Any, tuple[list, list, list, list, int]] = {}
+        others = []
+        sharedIdx = []
         hardwareIndex = 0
         for modelIndex, model in enumerate(self.__models):
             nbDev = len(model.get_device_names())
-            mStrengths = model.compute_strengths(allHardwareValues[hardwareIndex : hardwareIndex + nbDev])
-            for valueIdx, strengthIdx in self.__modelToMagnet[modelIndex]:
+            nbStrength = len(model.get_strength_units())
+            shared = len({strengthIdx for _, strengthIdx in self.__modelToMagnet[modelIndex]}) < nbStrength
+            key = model.get_batch_key()
+            if key is None or shared:
+                if shared:
+                    sharedIdx.extend(range(hardwareIndex, hardwareIndex + nbDev))
+                others.append((model, hardwareIndex, nbDev, nbStrength, shared, self.__modelToMagnet[modelIndex]))
+            else:
+                models, hardwareIdx, valueIdx, strengthIdx, _ = groups.setdefault(key, ([], [], [], [], nbStrength))
+                for valIdx, sIdx in self.__modelToMagnet[modelIndex]:
+                    valueIdx.append(valIdx)
+                    strengthIdx.append(len(models) * nbStrength + sIdx)
+                models.append(model)
+                hardwareIdx.extend(range(hardwareIndex, hardwareIndex + nbDev))
+            hardwareIndex += nbDev
+        self.__others = others
+        self.__batches = [
+            (
+                type(models[0]).create_batch(models),
+                np.array(hardwareIdx),
+                np.array(valueIdx),
+                np.array(strengthIdx),
+                len(models) * nbStrength,
+            )
+            for models, hardwareIdx, valueIdx, strengthIdx, nbStrength in groups.values()
+        ]
+        self.__sharedIdx = np.array(sharedIdx, dtype=int)
+        self.__shared = None
+        if len(sharedIdx) > 0 and self.__shared_factory is not None:
+            self.__shared = self.__shared_factory()
+            self.__shared.add_devices([self._devs.get_device_at(i) for i in sharedIdx])
+
+    def _to_hardware(self, value: NDArray[np.float64], allHardwareValues: NDArray[np.float64] | None) -> NDArray[np.float64]:
+        """
+        Computes new hardware setpoints from strengths and current hardware setpoints.
+        Only hardware setpoints of shared channels are used, allHardwareValues may be
+        None if there is no shared channel.
+        """
+        if self.__batches is None:
+            self._compile()
+        value = np.asarray(value, dtype=float)
+        newHardwareValues = np.zeros(self.nb_device())
+        for batch, hardwareIdx, valueIdx, strengthIdx, nbStrength in self.__batches:
+            # Batched models are fully defined by the given strengths
+            mStrengths = np.zeros(nbStrength)
+            mStrengths[strengthIdx] = value[valueIdx]
+            newHardwareValues[hardwareIdx] = batch.compute_hardware_values(mStrengths)
+        for model, hardwareIndex, nbDev, nbStrength, shared, magnets in self.__others:
+            if shared:
+                hw = np.asarray(allHardwareValues[hardwareIndex : hardwareIndex + nbDev], dtype=float)
+                mStrengths = model.compute_strengths(hw)
+            else:
+                mStrengths = np.zeros(nbStrength)
+            for valueIdx, strengthIdx in magnets:
                 mStrengths[strengthIdx] = value[valueIdx]
             newHardwareValues[hardwareIndex : hardwareIndex + nbDev] = model.compute_hardware_values(mStrengths)
-            hardwareIndex += nbDev
-        dev_range = self._devs.get_range()
-        if not check_range(newHardwareValues, dev_range):
+        if not self.__range.check(newHardwareValues):
             raise PyAMLException(format_out_of_range_message(newHardwareValues, self._devs))
-        self._devs.set(newHardwareValues)
+        return newHardwareValues
 
-    def set_and_wait(self, value: NDArray[np.float64]):
-        raise NotImplementedError("Not implemented yet.")
-
-    def get(self) -> NDArray[np.float64]:
-        allHardwareValues = self._devs.get()  # Read all hardware setpoints
+    def _to_strengths(self, allHardwareValues: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Computes magnet strengths from hardware values"""
+        if self.__batches is None:
+            self._compile()
+        allHardwareValues = np.asarray(allHardwareValues, dtype=float)
         allStrength = np.zeros(self.__nbMagnet)
-        hardwareIndex = 0
-        for modelIndex, model in enumerate(self.__models):
-            nbDev = len(model.get_device_names())
+        for batch, hardwareIdx, valueIdx, strengthIdx, _ in self.__batches:
+            allStrength[valueIdx] = batch.compute_strengths(allHardwareValues[hardwareIdx])[strengthIdx]
+        for model, hardwareIndex, nbDev, _, _, magnets in self.__others:
             mStrengths = model.compute_strengths(allHardwareValues[hardwareIndex : hardwareIndex + nbDev])
-            for valueIdx, strengthIdx in self.__modelToMagnet[modelIndex]:
+            for valueIdx, strengthIdx in magnets:
                 allStrength[valueIdx] = mStrengths[strengthIdx]
-            hardwareIndex += nbDev
         return allStrength
 
+    def __store_shadow(self, allHardwareValues: NDArray[np.float64]):
+        if self.__shadow_staleness is not None:
+            self.__shadow = np.asarray(allHardwareValues, dtype=float)
+            self.__shadow_time = time.monotonic()
+
+    def __from_shadow(self) -> NDArray[np.float64] | None:
+        if self.__shadow is not None and time.monotonic() - self.__shadow_time <= self.__shadow_staleness:
+            return self.__shadow
+        return None
+
+    def __expand_shared(self, sharedValues: NDArray[np.float64]) -> NDArray[np.float64]:
+        allHardwareValues = np.zeros(self.nb_device())
+        allHardwareValues[self.__sharedIdx] = np.asarray(sharedValues, dtype=float)
+        return allHardwareValues
+
+    def _current_hardware(self) -> NDArray[np.float64] | None:
+        """Returns the hardware setpoints needed to compute new setpoints (None if not needed)"""
+        if self.__batches is None:
+            self._compile()
+        if len(self.__sharedIdx) == 0:
+            return None
+        allHardwareValues = self.__from_shadow()
+        if allHardwareValues is not None:
+            return allHardwareValues
+        if self.__shared is None:
+            return self._devs.get()  # Read all hardware setpoints
+        return self.__expand_shared(self.__shared.get())  # Read hardware setpoints of shared channels
+
+    async def _current_hardware_async(self) -> NDArray[np.float64] | None:
+        """Returns the hardware setpoints needed to compute new setpoints (None if not needed)"""
+        if self.__batches is None:
+            self._compile()
+        if len(self.__sharedIdx) == 0:
+            return None
+        allHardwareValues = self.__from_shadow()
+        if allHardwareValues is not None:
+            return allHardwareValues
+        if self.__shared is None:
+            return await self._devs.get_async()
+        return self.__expand_shared(await self.__shared.get_async())
+
+    def set(self, value: NDArray[np.float64]):
+        newHardwareValues = self._to_hardware(value, self._current_hardware())
+        self.__store_shadow(self._write(newHardwareValues))
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        newHardwareValues = self._to_hardware(value, self._current_hardware())
+        written = self._write(newHardwareValues)
+        self.__store_shadow(written)
+        wait_for_device_list(self._devs, written)
+
+    def get(self) -> NDArray[np.float64]:
+        allHardwareValues = self._devs.get()  # Read all hardware setpoints
+        self.__store_shadow(allHardwareValues)
+        return self._to_strengths(allHardwareValues)
+
     def readback(self) -> np.array:
-        allHardwareValues = self._devs.readback()  # Read all hardware readback
-        allStrength = np.zeros(self.__nbMagnet)
-        hardwareIndex = 0
-        for modelIndex, model in enumerate(self.__models):
-            nbDev = len(model.get_device_names())
-            mStrengths = model.compute_strengths(allHardwareValues[hardwareIndex : hardwareIndex + nbDev])
-            for valueIdx, strengthIdx in self.__modelToMagnet[modelIndex]:
-                allStrength[valueIdx] = mStrengths[strengthIdx]
-            hardwareIndex += nbDev
-        return allStrength
+        return self._to_strengths(self._devs.readback())  # Read all hardware readback
+
+    async def set_async(self, value: NDArray[np.float64]):
+        newHardwareValues = self._to_hardware(value, await self._current_hardware_async())
+        self.__store_shadow(await self._write_async(newHardwareValues))
+
+    async def get_async(self) -> NDArray[np.float64]:
+        allHardwareValues = await self._devs.get_async()
+        self.__store_shadow(allHardwareValues)
+        return self._to_strengths(allHardwareValues)
+
+    async def readback_async(self) -> np.array:
+        return self._to_strengths(await self._devs.readback_async())
 
     def unit(self) -> str:
         return self._devs.unit()
@@ -283,6 +634,387 @@ class CSStrengthScalarAggregator(CSScalarAggregator):
 # ------------------------------------------------------------------------------
 
 
+class CSRangeScalarAggregator(CSScalarAggregator):
+    """
+    Control system aggregator for a list of scalar values, rejecting writes
+    out of the device ranges.
+
+    Parameters
+    ----------
+    peer : CSScalarAggregator
+        Aggregator holding the devices
+    """
+
+    def __init__(self, peer: CSScalarAggregator):
+        CSScalarAggregator.__init__(self, peer._devs)
+        self.__range = RangeTable(self._devs)
+
+    def add_devices(self, devices: DeviceAccess | list[DeviceAccess]):
+        CSScalarAggregator.add_devices(self, devices)
+        self.__range.reset()
+
+    def refresh_range(self):
+        """Fetches again the ranges of the devices"""
+        self.__range.refresh()
+
+    def __check(self, value: NDArray[np.float64]):
+        if not self.__range.check(value):
+            raise PyAMLException(format_out_of_range_message(value, self._devs))
+
+    def set(self, value: NDArray[np.float64]):
+        self.__check(value)
+        CSScalarAggregator.set(self, value)
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        self.__check(value)
+        CSScalarAggregator.set_and_wait(self, value)
+
+    async def set_async(self, value: NDArray[np.float64]):
+        self.__check(value)
+        await CSScalarAggregator.set_async(self, value)
+
+
+# ------------------------------------------------------------------------------
+
+
+class CSHardwareScalarAggregator(CSScalarAggregator):
+    """
+    Control system aggregator for a list of magnet hardware values.
+    Devices are the union of the power supplies used by the magnets, shared
+    power supplies are accessed once.
+
+    Magnets whose model maps one power supply to each function use the value
+    of their power supply. For other models (see MagnetModel.get_hardware_matrix()),
+    the hardware value of a function is the linear combination of the power
+    supply values given by the model matrix (pseudo current). When only some
+    functions of such a model are part of the aggregator, its power supplies
+    are read before writing.
+
+    Parameters
+    ----------
+    peer : CSScalarAggregator
+        Aggregator holding the power supply devices
+    """
+
+    def __init__(self, peer: CSScalarAggregator):
+        CSScalarAggregator.__init__(self, peer._devs)
+        self.__channelByName: dict[str, int] = {}
+        self.__nbMagnet = 0
+        self.__direct: list[tuple[int, int]] = []  # (magnet index, channel index)
+        self.__models: list[MagnetModel] = []  # Models using a hardware matrix
+        self.__modelChannels: list[list[int]] = []
+        self.__modelToMagnet: list[list[tuple[int, int]]] = []  # (magnet index, function index)
+        self.__units: list[str] = []
+        self.__compiled = None
+        self.__range = RangeTable(self._devs)
+
+    def __channel(self, dev: DeviceAccess) -> int:
+        if dev.name() not in self.__channelByName:
+            self.__channelByName[dev.name()] = self._devs.len()
+            self.add_devices(dev)
+            self.__range.reset()
+        return self.__channelByName[dev.name()]
+
+    def add_magnet(self, magnet: Magnet, devs: list[DeviceAccess]):
+        """
+        Adds a magnet.
+
+        Parameters
+        ----------
+        magnet : Magnet
+            Magnet to add
+        devs : list[DeviceAccess]
+            The power supply of the magnet function if its model supports
+            hardware units, all the power supplies of the model otherwise
+        """
+        model = magnet.model
+        mapper = magnet.hardware if model.has_hardware() else magnet.strength
+        index = mapper.index() if isinstance(mapper, abstract.RWMapper) else 0
+        if model.has_hardware():
+            # One power supply per function
+            self.__direct.append((self.__nbMagnet, self.__channel(devs[0])))
+        else:
+            if model not in self.__models:
+                self.__models.append(model)
+                self.__modelChannels.append([self.__channel(d) for d in devs])
+                self.__modelToMagnet.append([])
+            self.__modelToMagnet[self.__models.index(model)].append((self.__nbMagnet, index))
+        self.__units.append(model.get_function_hardware_units()[index])
+        self.__nbMagnet += 1
+        self.__compiled = None
+
+    def refresh_range(self):
+        """Fetches again the ranges of the power supplies"""
+        self.__range.refresh()
+
+    def _compile(self):
+        direct = np.array(self.__direct, dtype=int).reshape(-1, 2)
+        matrices = []
+        for model, channels, magnets in zip(self.__models, self.__modelChannels, self.__modelToMagnet, strict=True):
+            m = np.asarray(model.get_hardware_matrix(), dtype=float)
+            idx = np.array(magnets, dtype=int)
+            shared = len(set(idx[:, 1])) < m.shape[0]
+            matrices.append((m, np.linalg.pinv(m), np.array(channels), idx[:, 0], idx[:, 1], shared))
+        self.__compiled = (direct, matrices, any(shared for *_, shared in matrices))
+
+    def _to_values(self, allHardwareValues: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Computes magnet hardware values from power supply values"""
+        if self.__compiled is None:
+            self._compile()
+        direct, matrices, _ = self.__compiled
+        allHardwareValues = np.asarray(allHardwareValues, dtype=float)
+        values = np.zeros(self.__nbMagnet)
+        values[direct[:, 0]] = allHardwareValues[direct[:, 1]]
+        for m, _, channels, magnetIdx, functionIdx, _ in matrices:
+            values[magnetIdx] = (m @ allHardwareValues[channels])[functionIdx]
+        return values
+
+    def _to_hardware(self, value: NDArray[np.float64], allHardwareValues: NDArray[np.float64] | None) -> NDArray[np.float64]:
+        """Computes power supply setpoints, allHardwareValues is needed only if _needs_read() is True"""
+        if self.__compiled is None:
+            self._compile()
+        direct, matrices, _ = self.__compiled
+        value = np.asarray(value, dtype=float)
+        newHardwareValues = np.zeros(self.nb_device())
+        newHardwareValues[direct[:, 1]] = value[direct[:, 0]]
+        for m, inv, channels, magnetIdx, functionIdx, shared in matrices:
+            pseudo = m @ np.asarray(allHardwareValues, dtype=float)[channels] if shared else np.zeros(m.shape[0])
+            pseudo[functionIdx] = value[magnetIdx]
+            newHardwareValues[channels] = inv @ pseudo
+        # Magnets sharing a power supply must agree on its setpoint
+        if not np.allclose(self._to_values(newHardwareValues), value):
+            raise PyAMLException("Inconsistent setpoints for magnets sharing the same power supply")
+        if not self.__range.check(newHardwareValues):
+            raise PyAMLException(format_out_of_range_message(newHardwareValues, self._devs))
+        return newHardwareValues
+
+    def _needs_read(self) -> bool:
+        """Tells if power supplies have to be read before writing"""
+        if self.__compiled is None:
+            self._compile()
+        return self.__compiled[2]
+
+    def set(self, value: NDArray[np.float64]):
+        self._write(self._to_hardware(value, self._devs.get() if self._needs_read() else None))
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        newHardwareValues = self._to_hardware(value, self._devs.get() if self._needs_read() else None)
+        wait_for_device_list(self._devs, self._write(newHardwareValues))
+
+    def get(self) -> NDArray[np.float64]:
+        return self._to_values(self._devs.get())
+
+    def readback(self) -> np.array:
+        return self._to_values(self._devs.readback())
+
+    async def set_async(self, value: NDArray[np.float64]):
+        allHardwareValues = await self._devs.get_async() if self._needs_read() else None
+        await self._write_async(self._to_hardware(value, allHardwareValues))
+
+    async def get_async(self) -> NDArray[np.float64]:
+        return self._to_values(await self._devs.get_async())
+
+    async def readback_async(self) -> np.array:
+        return self._to_values(await self._devs.readback_async())
+
+    def unit(self) -> list[str]:
+        return self.__units
+
+    def nb_magnet(self) -> int:
+        """Returns the number of aggregated magnets"""
+        return self.__nbMagnet
+
+
+# ------------------------------------------------------------------------------
+
+
+class CSSerializedMagnetsAggregator(CSScalarAggregator):
+    """
+    Control system aggregator for a list of serialized magnets, one value per
+    series. Power supplies shared by several series are read and written once.
+
+    In physics units, the value of a series is the sum of the strengths of its
+    magnets (see LinearSerializedMagnetModel.get_total_curve()). Series sharing
+    the same total curve are converted together with a single interpolation.
+    In hardware units, the value of a series is its power supply setpoint.
+
+    Parameters
+    ----------
+    peer : CSScalarAggregator
+        Aggregator holding the power supply devices
+    hardware : bool
+        True to work in hardware units
+    """
+
+    def __init__(self, peer: CSScalarAggregator, hardware: bool = False):
+        CSScalarAggregator.__init__(self, peer._devs)
+        self.__hardware = hardware
+        self.__models = []  # Serialized magnet model of each series
+        self.__channels: list[int] = []  # Power supply index of each series
+        self.__channelByName: dict[str, int] = {}
+        self.__groups = None  # Series sharing the same total curve, compiled on first access
+        self.__range = RangeTable(self._devs)
+
+    def add_serialized_magnet(self, magnet: SerializedMagnets, dev: DeviceAccess):
+        if dev.name() not in self.__channelByName:
+            self.__channelByName[dev.name()] = self._devs.len()
+            self.add_devices(dev)
+            self.__range.reset()
+        self.__channels.append(self.__channelByName[dev.name()])
+        self.__models.append(magnet.model)
+        self.__groups = None
+
+    def refresh_range(self):
+        """Fetches again the ranges of the power supplies"""
+        self.__range.refresh()
+
+    def _compile(self):
+        groups: dict[bytes, tuple[np.ndarray, list[int]]] = {}
+        for idx, model in enumerate(self.__models):
+            curve = model.get_total_curve()
+            # Total curve oriented for the strength to current interpolation
+            if curve[-1, 1] < curve[0, 1]:
+                curve = curve[::-1]
+            groups.setdefault(curve.tobytes(), (curve, []))[1].append(idx)
+        self.__groups = [(curve, np.array(series)) for curve, series in groups.values()]
+
+    def __brho(self, series: NDArray[np.intp]) -> NDArray[np.float64]:
+        # Rigidity may change after the aggregator creation
+        return np.array([self.__models[i].get_magnet_rigidity() for i in series], dtype=float)
+
+    def _to_hardware(self, value: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Computes power supply setpoints from series values"""
+        value = np.ones(len(self.__models)) * value if np.isscalar(value) else np.asarray(value, dtype=float)
+        if self.__hardware:
+            seriesHardware = value
+        else:
+            if self.__groups is None:
+                self._compile()
+            seriesHardware = np.zeros(len(self.__models))
+            for curve, series in self.__groups:
+                seriesHardware[series] = np.interp(value[series] * self.__brho(series), curve[:, 1], curve[:, 0])
+        channels = np.array(self.__channels)
+        newHardwareValues = np.zeros(self.nb_device())
+        newHardwareValues[channels] = seriesHardware
+        # Series sharing a power supply must agree on its setpoint
+        if not np.allclose(newHardwareValues[channels], seriesHardware):
+            raise PyAMLException("Inconsistent setpoints for series sharing the same power supply")
+        if not self.__range.check(newHardwareValues):
+            raise PyAMLException(format_out_of_range_message(newHardwareValues, self._devs))
+        return newHardwareValues
+
+    def _to_values(self, allHardwareValues: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Computes series values from power supply values"""
+        seriesHardware = np.asarray(allHardwareValues, dtype=float)[self.__channels]
+        if self.__hardware:
+            return seriesHardware
+        if self.__groups is None:
+            self._compile()
+        values = np.zeros(len(self.__models))
+        for curve, series in self.__groups:
+            values[series] = np.interp(seriesHardware[series], curve[:, 0], curve[:, 1]) / self.__brho(series)
+        return values
+
+    def set(self, value: NDArray[np.float64]):
+        self._write(self._to_hardware(value))
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        newHardwareValues = self._to_hardware(value)
+        wait_for_device_list(self._devs, self._write(newHardwareValues))
+
+    def get(self) -> NDArray[np.float64]:
+        return self._to_values(self._devs.get())
+
+    def readback(self) -> np.array:
+        return self._to_values(self._devs.readback())
+
+    async def set_async(self, value: NDArray[np.float64]):
+        await self._write_async(self._to_hardware(value))
+
+    async def get_async(self) -> NDArray[np.float64]:
+        return self._to_values(await self._devs.get_async())
+
+    async def readback_async(self) -> np.array:
+        return self._to_values(await self._devs.readback_async())
+
+    def unit(self) -> list[str]:
+        if self.__hardware:
+            return [m.get_hardware_units()[0] for m in self.__models]
+        return [m.get_strength_units()[0] for m in self.__models]
+
+
+# ------------------------------------------------------------------------------
+
+
+class CSBpmSnapshotAggregator(CSScalarAggregator):
+    """
+    Read only control system aggregator for the positions, offsets and tilt
+    of a list of BPMs. All the available channels are read in a single
+    DeviceAccessList call, get() returns for each BPM the values
+    [x, y, x_offset, y_offset, tilt]. Channels of BPMs without offset or
+    tilt device are NaN.
+
+    Parameters
+    ----------
+    peer : CSScalarAggregator
+        Aggregator holding the BPM devices
+    """
+
+    NB_CHANNEL = 5
+
+    def __init__(self, peer: CSScalarAggregator):
+        super().__init__(peer._devs)
+        self.__index: list[int] = []  # Index of available channels in the snapshot
+        self.__nb_channel = 0
+
+    def add_bpm(self, devs: list[DeviceAccess | None]):
+        """
+        Adds a BPM
+
+        Parameters
+        ----------
+        devs : list[DeviceAccess | None]
+            Devices of the BPM in the order [x, y, x_offset, y_offset, tilt], None
+            for channels not available
+        """
+        if len(devs) != self.NB_CHANNEL:
+            raise PyAMLException(f"BPM snapshot: {self.NB_CHANNEL} devices expected, got {len(devs)}")
+        for idx, dev in enumerate(devs):
+            if dev is not None:
+                self._devs.add_devices(dev)
+                self.__index.append(self.__nb_channel + idx)
+        self.__nb_channel += self.NB_CHANNEL
+
+    def __expand(self, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        snapshot = np.full(self.__nb_channel, np.nan)
+        snapshot[self.__index] = values
+        return snapshot
+
+    def set(self, value: NDArray[np.float64]):
+        raise PyAMLException("BPM snapshot is read only")
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        raise PyAMLException("BPM snapshot is read only")
+
+    async def set_async(self, value: NDArray[np.float64]):
+        raise PyAMLException("BPM snapshot is read only")
+
+    def get(self) -> NDArray[np.float64]:
+        return self.__expand(self._devs.get())
+
+    def readback(self) -> NDArray[np.float64]:
+        return self.__expand(np.asarray(self._devs.readback(), dtype=float))
+
+    async def get_async(self) -> NDArray[np.float64]:
+        return self.__expand(await self._devs.get_async())
+
+    async def readback_async(self) -> NDArray[np.float64]:
+        return self.__expand(np.asarray(await self._devs.readback_async(), dtype=float))
+
+    def nb_bpm(self) -> int:
+        return self.__nb_channel // self.NB_CHANNEL
+
+
 # ------------------------------------------------------------------------------
 
 
@@ -295,25 +1027,34 @@ class RWHardwareScalar(abstract.ReadWriteFloatScalar):
     def __init__(self, model: MagnetModel, dev: DeviceAccess):
         self.__model = model
         self.__dev = dev
+        self.__range = RangeTable(dev)
 
     def get(self) -> float:
         return self.__dev.get()
 
     def set(self, value: float):
-        dev_range = self.__dev.get_range()
-        if not check_range(value, dev_range):
+        if not self.__range.check(value):
             raise PyAMLException(format_out_of_range_message(value, self.__dev))
         self.__dev.set(value)
 
     def set_and_wait(self, value: double):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices([self.__dev], value)
 
     def unit(self) -> str:
         return self.__model.get_hardware_units()[0]
 
+    def get_max_rate(self) -> float | None:
+        """Returns the slew rate of the power supply, None for no limit"""
+        return self.__dev.get_max_rate()
+
     def set_magnet_rigidity(self, brho: np.double):
         self.__model.set_magnet_rigidity(brho)
 
+    def refresh_range(self):
+        """Fetches again the range of the power supply"""
+        self.__range.refresh()
+
 
 # ------------------------------------------------------------------------------
 
@@ -326,6 +1067,7 @@ class RWStrengthScalar(abstract.ReadWriteFloatScalar):
     def __init__(self, model: MagnetModel, dev: DeviceAccess):
         self.__model = model
         self.__dev = dev
+        self.__range = RangeTable(dev)
 
     # Gets the value
     def get(self) -> float:
@@ -334,23 +1076,74 @@ class RWStrengthScalar(abstract.ReadWriteFloatScalar):
 
     # Sets the value
     def set(self, value: float):
+        self.__set(value)
+
+    # Sets the value and wait that the read value reach the setpoint
+    def set_and_wait(self, value: float):
+        current = self.__set(value)
+        wait_for_devices([self.__dev], current)
+
+    def __set(self, value: float) -> float:
         current = self.__model.compute_hardware_values([value])[0]
-        dev_range = self.__dev.get_range()
-        if not check_range(current, dev_range):
+        if not self.__range.check(current):
             raise PyAMLException(format_out_of_range_message(current, self.__dev))
         self.__dev.set(current)
+        return current
+
+    # Gets the unit of the value
+    def unit(self) -> str:
+        return self.__model.get_strength_units()[0]
+
+    def set_magnet_rigidity(self, brho: np.double):
+        self.__model.set_magnet_rigidity(brho)
+
+    def refresh_range(self):
+        """Fetches again the range of the power supply"""
+        self.__range.refresh()
+
+
+# ------------------------------------------------------------------------------
+
+
+class RWSerializedStrengthScalar(abstract.ReadWriteFloatScalar):
+    """
+    Class providing read write access to the strength of a series of magnets
+    of a control system, the strength of the series is the sum of the strengths
+    of its magnets (same convention as CSSerializedMagnetsAggregator)
+    """
+
+    def __init__(self, model: LinearSerializedMagnetModel, dev: DeviceAccess):
+        self.__model = model
+        self.__dev = dev
+        self.__range = RangeTable(dev)
+
+    def get(self) -> float:
+        return self.__model.compute_total_strength(self.__dev.get())
+
+    def set(self, value: float):
+        self.__set(value)
 
-    # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        current = self.__set(value)
+        wait_for_devices([self.__dev], current)
+
+    def __set(self, value: float) -> float:
+        current = self.__model.compute_total_hardware_value(value)
+        if not self.__range.check(current):
+            raise PyAMLException(format_out_of_range_message(current, self.__dev))
+        self.__dev.set(current)
+        return current
 
-    # Gets the unit of the value
     def unit(self) -> str:
         return self.__model.get_strength_units()[0]
 
     def set_magnet_rigidity(self, brho: np.double):
         self.__model.set_magnet_rigidity(brho)
 
+    def refresh_range(self):
+        """Fetches again the range of the power supply"""
+        self.__range.refresh()
+
 
 # ------------------------------------------------------------------------------
 
@@ -364,6 +1157,7 @@ class RWHardwareArray(abstract.ReadWriteFloatArray):
     def __init__(self, model: MagnetModel, devs: list[DeviceAccess]):
         self.__model = model
         self.__devs = devs
+        self.__range = RangeTable(devs)
 
     # Gets the value
     def get(self) -> np.array:
@@ -371,20 +1165,24 @@ class RWHardwareArray(abstract.ReadWriteFloatArray):
 
     # Sets the value
     def set(self, value: np.array):
+        if not self.__range.check(value):
+            raise PyAMLException(format_out_of_range_message(value, self.__devs))
         for idx, p in enumerate(self.__devs):
-            dev_range = p.get_range()
-            if not check_range(value[idx], dev_range):
-                raise PyAMLException(format_out_of_range_message(value[idx], p))
             p.set(value[idx])
 
     # Sets the value and waits that the read value reach the setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices(self.__devs, value)
 
     # Gets the unit of the value
     def unit(self) -> list[str]:
         return self.__model.get_hardware_units()
 
+    def refresh_range(self):
+        """Fetches again the ranges of the power supplies"""
+        self.__range.refresh()
+
 
 # ------------------------------------------------------------------------------
 
@@ -397,6 +1195,7 @@ class RWStrengthArray(abstract.ReadWriteFloatArray):
     def __init__(self, model: MagnetModel, devs: list[DeviceAccess]):
         self.__model = model
         self.__devs = devs
+        self.__range = RangeTable(devs)
 
     # Gets the value
     def get(self) -> np.array:
@@ -406,23 +1205,29 @@ class RWStrengthArray(abstract.ReadWriteFloatArray):
 
     # Sets the value
     def set(self, value: np.array):
-        cur = self.__model.compute_hardware_values(value)
-        for idx, p in enumerate(self.__devs):
-            dev_range = p.get_range()
-            if not check_range(cur[idx], dev_range):
-                raise PyAMLException(format_out_of_range_message(cur[idx], p))
-
-        for idx, p in enumerate(self.__devs):
-            p.set(cur[idx])
+        self.__set(value)
 
     # Sets the value and waits that the read value reach the setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        cur = self.__set(value)
+        wait_for_devices(self.__devs, cur)
+
+    def __set(self, value: np.array) -> np.array:
+        cur = self.__model.compute_hardware_values(value)
+        if not self.__range.check(cur):
+            raise PyAMLException(format_out_of_range_message(cur, self.__devs))
+        for idx, p in enumerate(self.__devs):
+            p.set(cur[idx])
+        return cur
 
     # Gets the unit of the value
     def unit(self) -> list[str]:
         return self.__model.get_strength_units()
 
+    def refresh_range(self):
+        """Fetches again the ranges of the power supplies"""
+        self.__range.refresh()
+
 
 # ------------------------------------------------------------------------------
 
@@ -450,20 +1255,24 @@ class RBpmArray(abstract.ReadFloatArray):
 
 class RWBpmTiltScalar(abstract.ReadFloatScalar):
     """
-    Class providing read access to a BPM tilt of a control system
+    Class providing read access to a BPM tilt of a control system. The tilt
+    of a BPM without tilt device is NaN.
     """
 
-    def __init__(self, dev: DeviceAccess):
+    def __init__(self, dev: DeviceAccess | None):
         self._dev = dev
 
     def get(self) -> float:
-        return self._dev.get()
+        return np.nan if self._dev is None else self._dev.get()
 
     def set(self, value: float):
+        if self._dev is None:
+            raise PyAMLException("BPM has no tilt device")
         self._dev.set(value)
 
-    def set_and_wait(self, value: NDArray[np.float64]):
-        raise NotImplementedError("Not implemented yet.")
+    def set_and_wait(self, value: float):
+        self.set(value)
+        wait_for_devices([self._dev], value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -475,22 +1284,26 @@ class RWBpmTiltScalar(abstract.ReadFloatScalar):
 
 class RWBpmOffsetArray(abstract.ReadWriteFloatArray):
     """
-    Class providing read write access to a BPM offset [x,y] of a control system
+    Class providing read write access to a BPM offset [x,y] of a control system.
+    Offsets of planes without offset device are NaN.
     """
 
-    def __init__(self, hDev: DeviceAccess, vDev: DeviceAccess):
+    def __init__(self, hDev: DeviceAccess | None, vDev: DeviceAccess | None):
         self._hDev = hDev
         self._vDev = vDev
 
     def get(self) -> np.array:
-        return np.array([self._hDev.get(), self._vDev.get()])
+        return np.array([np.nan if d is None else d.get() for d in (self._hDev, self._vDev)], dtype=float)
 
     def set(self, value: NDArray[np.float64]):
+        if self._hDev is None or self._vDev is None:
+            raise PyAMLException("BPM has no offset device")
         self._hDev.set(value[0])
         self._vDev.set(value[1])
 
     def set_and_wait(self, value: NDArray[np.float64]):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices([self._hDev, self._vDev], value)
 
     # Gets the unit of the value Assume that x and y, offsets and positions
     # have the same unit
@@ -518,7 +1331,8 @@ class RWRFVoltageScalar(abstract.ReadWriteFloatScalar):
         self.__dev.set(value)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices([self.__dev], value)
 
     def unit(self) -> str:
         return self.__transmitter._cfg.voltage.unit()
@@ -544,7 +1358,8 @@ class RWRFPhaseScalar(abstract.ReadWriteFloatScalar):
         self.__dev.set(value)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices([self.__dev], value)
 
     def unit(self) -> str:
         return self.__transmitter._cfg.phase.unit()
@@ -570,7 +1385,8 @@ class RWRFFrequencyScalar(abstract.ReadWriteFloatScalar):
         self.__dev.set(value)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
+        wait_for_devices([self.__dev], value)
 
     def unit(self) -> str:
         return self.__rf._cfg.masterclock.unit()
@@ -0,0 +1,109 @@
+"""
+Concurrent availability check of control system devices.
+"""
+
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from .deviceaccess import DeviceAccess
+
+DEFAULT_AVAILABILITY_TIMEOUT = 3.0
+"""Default maximum duration of an availability check in seconds"""
+DEFAULT_AVAILABILITY_WORKERS = 64
+"""Number of threads of the pool shared by availability checks"""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AvailabilityReport:
+    """
+    Result of an availability check.
+
+    Attributes
+    ----------
+    holder : str
+        Name of the checked control system or simulator
+    nb_checked : int
+        Number of probed devices
+    unavailable : dict[str, str]
+        Unavailable device names mapped to the reason ('unavailable',
+        'timeout', 'not probed' or the error message raised by the probe)
+    elapsed : float
+        Duration of the check in seconds
+    """
+
+    holder: str
+    nb_checked: int
+    unavailable: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def is_healthy(self) -> bool:
+        """Tells if all probed devices are available"""
+        return len(self.unavailable) == 0
+
+    def __str__(self):
+        lines = [f"{self.holder}: {self.nb_checked - len(self.unavailable)}/{self.nb_checked} devices available"]
+        lines.extend(f"  {name}: {reason}" for name, reason in self.unavailable.items())
+        return "\n".join(lines)
+
+
+def _get_executor() -> Executor:
+    """Returns the thread pool shared by all availability checks"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_AVAILABILITY_WORKERS, thread_name_prefix="pyaml-health")
+        return _executor
+
+
+def check_devices(
+    holder: str,
+    devices: list[DeviceAccess],
+    timeout: float = DEFAULT_AVAILABILITY_TIMEOUT,
+    executor: Executor | None = None,
+) -> AvailabilityReport:
+    """
+    Calls check_device_availability() of all devices concurrently. The check
+    completes within ``timeout`` seconds: probes still running by then are
+    reported as 'timeout' (they are left to complete in the background) and
+    probes that did not get a free worker are cancelled and reported as
+    'not probed'.
+
+    Parameters
+    ----------
+    holder : str
+        Name of the control system the devices belong to
+    devices : list[DeviceAccess]
+        Devices to check
+    timeout : float
+        Maximum duration of the check in seconds
+    executor : Executor | None
+        Thread pool running the probes, defaults to a pool of
+        DEFAULT_AVAILABILITY_WORKERS threads shared by all checks
+
+    Returns
+    -------
+    AvailabilityReport
+        Structured report of unavailable devices
+    """
+    t0 = time.monotonic()
+    if len(devices) == 0:
+        return AvailabilityReport(holder, 0)
+    if executor is None:
+        executor = _get_executor()
+    futures = [executor.submit(d.check_device_availability) for d in devices]
+    wait(futures, timeout=max(t0 + timeout - time.monotonic(), 0.0))
+    unavailable: dict[str, str] = {}
+    for f, d in zip(futures, devices, strict=True):
+        if not f.done():
+            # Queued probes are cancelled, running ones cannot be interrupted
+            unavailable[d.name()] = "not probed" if f.cancel() else "timeout"
+        elif f.exception() is not None:
+            unavailable[d.name()] = str(f.exception())
+        elif not f.result():
+            unavailable[d.name()] = "unavailable"
+    return AvailabilityReport(holder, len(devices), unavailable, time.monotonic() - t0)
@@ -1,17 +1,27 @@
+import logging
+import time
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 from pydantic import BaseModel
 
+from ..arrays.bpm_array import BPMArray
+from ..arrays.element_array import ElementArray
 from ..bpm.bpm import BPM
 from ..common.abstract import RWMapper
 from ..common.abstract_aggregator import ScalarAggregator
 from ..common.element import Element
 from ..common.element_holder import ElementHolder
 from ..common.exception import PyAMLException
+from ..common.lazy import LazyAccessor
 from ..configuration.factory import Factory
 from ..configuration.unbound_element import UnboundElement
 from ..control.abstract_impl import (
+    CSBpmSnapshotAggregator,
+    CSHardwareScalarAggregator,
+    CSRangeScalarAggregator,
     CSScalarAggregator,
+    CSSerializedMagnetsAggregator,
     CSStrengthScalarAggregator,
     RBetatronTuneArray,
     RBpmArray,
@@ -22,6 +32,7 @@ from ..control.abstract_impl import (
     RWRFFrequencyScalar,
     RWRFPhaseScalar,
     RWRFVoltageScalar,
+    RWSerializedStrengthScalar,
     RWStrengthArray,
     RWStrengthScalar,
 )
@@ -36,6 +47,11 @@ from ..tuning_tools.measurement_tool import MeasurementTool
 from ..tuning_tools.tuning_tool import TuningTool
 from .deviceaccess import DeviceAccess
 from .deviceaccesslist import DeviceAccessList
+from .devicecache import CachedDeviceAccess, CachedDeviceAccessList, DeviceCache
+from .multireader import MultiReader
+from .threadeddeviceaccesslist import DEFAULT_MAX_WORKERS, ThreadedDeviceAccessList
+
+logger = logging.getLogger(__name__)
 
 
 class ControlSystem(ElementHolder, metaclass=ABCMeta):
@@ -45,6 +61,12 @@ class ControlSystem(ElementHolder, metaclass=ABCMeta):
 
     def __init__(self):
         ElementHolder.__init__(self)
+        self.__executor: Executor | None = None
+        self.__device_cache: DeviceCache | None = None
+        self.__shadow_staleness: float | None = None
+        self.__fill_device_timing: dict[str, float] = {}
+        self.__lazy_attach: bool = False
+        self.__attached_devices: dict[int, DeviceAccess] = {}
 
     @abstractmethod
     def name(self) -> str:
@@ -53,7 +75,7 @@ class ControlSystem(ElementHolder, metaclass=ABCMeta):
 
     @abstractmethod
     def get_aggregator(self) -> DeviceAccessList | None:
-        """Returns a new empty DeviceAccessList. If None is returned serialized readings/writtings are performed"""
+        """Returns a new empty DeviceAccessList. If None is returned, a ThreadedDeviceAccessList is used"""
         pass
 
     @abstractmethod
@@ -68,51 +90,211 @@ class ControlSystem(ElementHolder, metaclass=ABCMeta):
 
     def get_devices_access(self, refs: list[str | BaseModel | None]) -> list[DeviceAccess]:
         """
-        Return a device reference for this control system.
-        YAML element configuration passes opaque strings. Public Python APIs may
-        also pass backend ConfigModel instances. Concrete backends own all
-        lookup, parsing and DeviceAccess construction.
+        Return device references for this control system (bulk version of
+        get_device_access()). fill_device() resolves the devices of all the
+        elements in a single call, backends able to batch name resolution or
+        connection setup should override this method.
+        The default implementation resolves each distinct string reference once,
+        concurrently through the control system thread pool when
+        concurrent_device_resolution() returns True.
         """
         if not isinstance(refs, list):
             raise PyAMLException(f"get_devices() expect a list as input arguments but got {str(type(refs))}")
-        return [self.get_device_access(ref) for ref in refs]
+        # Only string references can be shared, others are resolved individually
+        unique = list(dict.fromkeys(r for r in refs if isinstance(r, str)))
+        others = [r for r in refs if not isinstance(r, str)]
+        if self.concurrent_device_resolution() and len(unique) + len(others) > 1:
+            resolved = list(self._get_executor().map(self.get_device_access, unique + others))
+        else:
+            resolved = [self.get_device_access(r) for r in unique + others]
+        byName = dict(zip(unique, resolved[: len(unique)], strict=True))
+        othersIt = iter(resolved[len(unique) :])
+        return [byName[r] if isinstance(r, str) else next(othersIt) for r in refs]
+
+    def concurrent_device_resolution(self) -> bool:
+        """
+        Tells if the default get_devices_access() resolves references concurrently.
+        False by default, backends whose get_device_access() blocks (i.e. on
+        connection setup) and is thread safe may return True.
+        """
+        return False
+
+    def set_device_cache(self, cache: DeviceCache | None):
+        """
+        Sets the cache used to serve redundant reads of this control system.
+        It applies to devices and aggregators created afterwards, so it has to
+        be set before elements are attached. Backends usually set it from their
+        configuration at construction time.
+
+        Parameters
+        ----------
+        cache : DeviceCache | None
+            The device cache, None to disable caching
+        """
+        self.__device_cache = cache
+
+    def get_device_cache(self) -> DeviceCache | None:
+        """Returns the device cache of this control system, None if caching is disabled"""
+        return self.__device_cache
+
+    def set_shadow_staleness(self, staleness: float | None):
+        """
+        Enables the setpoint shadow of magnet strength aggregators created afterwards.
+        When writing strengths of combined function magnets of which only some
+        multipoles are part of the array, the hardware setpoints written or read
+        by the aggregator less than staleness seconds ago are used instead of
+        reading them again.
+
+        Parameters
+        ----------
+        staleness : float | None
+            Maximum age of the shadow in seconds, None to always read setpoints
+        """
+        self.__shadow_staleness = staleness
+
+    def get_shadow_staleness(self) -> float | None:
+        """Returns the setpoint shadow staleness, None if the shadow is disabled"""
+        return self.__shadow_staleness
 
-    def _create_scalar_aggregator(self) -> ScalarAggregator | None:
+    def set_lazy_attach(self, lazy: bool):
+        """
+        Enables the lazy attach mode for elements filled afterwards. In lazy mode,
+        the devices and accessors of magnets (strength, hardware) and BPMs
+        (positions, offset, tilt) are created on first use instead of when the
+        configuration is loaded.
+
+        Parameters
+        ----------
+        lazy : bool
+            True to enable lazy attach
+        """
+        self.__lazy_attach = lazy
+
+    def is_lazy_attach(self) -> bool:
+        """Tells if the lazy attach mode is enabled"""
+        return self.__lazy_attach
+
+    def _lazy_device(self, ref: str | BaseModel | None) -> LazyAccessor:
+        """Returns a LazyAccessor resolving the device of the given reference"""
+        return LazyAccessor(lambda: self._get_element_devices([ref])[0])
+
+    def _get_element_devices(self, refs: list[str | BaseModel | None]) -> list[DeviceAccess | None]:
+        """Returns the devices used by element accessors, decorated by the device cache if any"""
+        devs = self.get_devices_access(refs)
+        for d in devs:
+            if d is not None:
+                self.__attached_devices.setdefault(id(d), d)
+        if self.__device_cache is None:
+            return devs
+        return [CachedDeviceAccess(d, self.__device_cache) if d is not None else None for d in devs]
+
+    def _get_attached_devices(self) -> list[DeviceAccess]:
+        # In lazy attach mode, only devices already in use are returned
+        return list(self.__attached_devices.values())
+
+    def get_max_workers(self) -> int:
+        """
+        Returns the maximum number of concurrent device accesses performed by
+        the default aggregator (:py:class:`~pyaml.control.threadeddeviceaccesslist.ThreadedDeviceAccessList`)
+        used when the backend does not provide its own DeviceAccessList.
+        Backends may override it to expose it in their configuration.
+        """
+        return DEFAULT_MAX_WORKERS
+
+    def _get_executor(self) -> Executor:
+        """Returns the thread pool shared by all the default aggregators of this control system"""
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=self.get_max_workers(), thread_name_prefix=f"pyaml-{self.name()}")
+        return self.__executor
+
+    def _create_scalar_aggregator(self) -> ScalarAggregator:
         agg = self.get_aggregator()
         if agg is None:
-            return None
+            # Fallback to concurrent accesses through the control system thread pool
+            agg = ThreadedDeviceAccessList(executor=self._get_executor())
+        if self.__device_cache is not None:
+            agg = CachedDeviceAccessList(agg, self.__device_cache)
         return CSScalarAggregator(agg)
 
+    def _create_multi_reader(self) -> MultiReader:
+        return MultiReader(self._create_scalar_aggregator())
+
+    def _add_observable(self, reader: MultiReader, name: str, obs: Element | ElementArray):
+        # Devices of known observables are read in the single call of the reader
+        if isinstance(obs, BetatronTuneMonitor) and obs._cfg.tune_h is not None and obs._cfg.tune_v is not None:
+            reader.add_devices(name, self.get_devices_access([obs._cfg.tune_h, obs._cfg.tune_v]))
+        elif isinstance(obs, RFPlant) and obs._cfg.masterclock is not None:
+            reader.add_devices(name, self.get_devices_access([obs._cfg.masterclock]), ())
+        elif isinstance(obs, BPMArray):
+            refs = [r for b in obs for r in b.get_pos_devices()]
+            reader.add_devices(name, self.get_devices_access(refs), (len(obs), 2))
+        elif isinstance(obs, BPM):
+            reader.add_devices(name, self.get_devices_access(obs.get_pos_devices()), (2,))
+        else:
+            super()._add_observable(reader, name, obs)
+
     def create_magnet_strength_aggregator(self, magnets: list[Magnet]) -> ScalarAggregator | None:
         agg = self._create_scalar_aggregator()
-        if agg is None:
-            return None
-        magg = CSStrengthScalarAggregator(agg)
+        # Only hardware setpoints of shared combined function magnets are read before writing
+        magg = CSStrengthScalarAggregator(agg, self._create_scalar_aggregator)
+        magg.set_shadow_staleness(self.__shadow_staleness)
         for m in magnets:
             devs = self.get_devices_access(m.model.get_device_names())
             magg.add_magnet(m, devs)
         return magg
 
     def create_magnet_hardware_aggregator(self, magnets: list[Magnet]) -> ScalarAggregator | None:
-        """When working in hardware space, 1 single power
-        supply device per multipolar strength is required
+        """When working in hardware space, either 1 single power supply device
+        per multipolar strength or a model hardware matrix (pseudo currents) is required
         """
-        agg = self._create_scalar_aggregator()
-        if agg is None:
-            return None
+        agg = CSHardwareScalarAggregator(self._create_scalar_aggregator())
         for m in magnets:
-            if not m.model.has_hardware():
+            if m.model.has_hardware():
+                psIndex = m.hardware.index() if isinstance(m.hardware, RWMapper) else 0
+                refs = [m.model.get_device_names()[psIndex]]
+            elif m.model.get_hardware_matrix() is not None:
+                refs = m.model.get_device_names()
+            else:
                 return None
-            psIndex = m.hardware.index() if isinstance(m.hardware, RWMapper) else 0
-            agg.add_devices(self.get_devices_access([m.model.get_device_names()[psIndex]])[0])
+            agg.add_magnet(m, self.get_devices_access(refs))
+        return agg
+
+    def create_cfm_strength_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator | None:
+        """All power supplies are read in a single call and models sharing
+        the same curves and matrix are converted together
+        """
+        magg = CSStrengthScalarAggregator(self._create_scalar_aggregator())
+        for m in magnets:
+            magg.add_cfm_magnet(m, self.get_devices_access(m.model.get_device_names()))
+        return magg
+
+    def create_cfm_hardware_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator | None:
+        """Power supply setpoints are checked against their ranges before writing"""
+        agg = CSRangeScalarAggregator(self._create_scalar_aggregator())
+        for m in magnets:
+            agg.add_devices(self.get_devices_access(m.model.get_device_names()))
+        return agg
+
+    def __create_serialized_aggregator(self, magnets: list[SerializedMagnets], hardware: bool) -> ScalarAggregator | None:
+        # Strength conversion requires the total curve of the series
+        if not all(hasattr(m.model, "get_total_curve") for m in magnets):
+            return None
+        agg = CSSerializedMagnetsAggregator(self._create_scalar_aggregator(), hardware)
+        for m in magnets:
+            agg.add_serialized_magnet(m, self.get_devices_access(m.model.get_device_names())[0])
         return agg
 
+    def create_serialized_strength_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator | None:
+        """Power supplies shared by several series are read and written once"""
+        return self.__create_serialized_aggregator(magnets, False)
+
+    def create_serialized_hardware_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator | None:
+        return self.__create_serialized_aggregator(magnets, True)
+
     def create_bpm_aggregators(self, bpms: list[BPM]) -> list[ScalarAggregator | None]:
         agg = self._create_scalar_aggregator()
         aggh = self._create_scalar_aggregator()
         aggv = self._create_scalar_aggregator()
-        if agg is None or aggh is None or aggv is None:
-            return [None, None, None]
         for b in bpms:
             devs = self.get_devices_access(b.get_pos_devices())
             agg.add_devices(devs)
@@ -120,10 +302,68 @@ class ControlSystem(ElementHolder, metaclass=ABCMeta):
             aggv.add_devices(devs[1])
         return [agg, aggh, aggv]
 
+    def create_bpm_offset_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        refs = [r for b in bpms for r in b.get_offset_devices()]
+        if any(r is None for r in refs):
+            return None
+        agg = self._create_scalar_aggregator()
+        agg.add_devices(self.get_devices_access(refs))
+        return agg
+
+    def create_bpm_tilt_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        refs = [b.get_tilt_device() for b in bpms]
+        if any(r is None for r in refs):
+            return None
+        agg = self._create_scalar_aggregator()
+        agg.add_devices(self.get_devices_access(refs))
+        return agg
+
+    def create_bpm_snapshot_aggregator(self, bpms: list[BPM]) -> ScalarAggregator | None:
+        """Positions, offsets and tilts are read in a single DeviceAccessList call"""
+        agg = CSBpmSnapshotAggregator(self._create_scalar_aggregator())
+        refs = [r for b in bpms for r in b.get_pos_devices() + b.get_offset_devices() + [b.get_tilt_device()]]
+        available = [r for r in refs if r is not None]
+        devs = iter(self.get_devices_access(available))
+        allDevs = [None if r is None else next(devs) for r in refs]
+        for i in range(len(bpms)):
+            agg.add_bpm(allDevs[5 * i : 5 * i + 5])
+        return agg
+
+    def get_fill_device_timing(self) -> dict[str, float]:
+        """
+        Returns the duration in seconds of each phase of the last fill_device() call:
+        'collect' (device references of all elements), 'resolve' (get_devices_access()
+        call) and 'attach' (element attachment).
+        """
+        return dict(self.__fill_device_timing)
+
+    def _element_device_refs(self, e: Element) -> list[str | BaseModel | None]:
+        """Returns the references of the devices used by an element, in the order expected by _attach_element()"""
+        if isinstance(e, (Magnet, BPM)) and self.__lazy_attach:
+            # Devices are resolved on first use
+            return []
+        elif isinstance(e, Magnet):
+            return [e.model.get_device_names()[0]]
+        elif isinstance(e, (CombinedFunctionMagnet, SerializedMagnets)):
+            return list(e.model.get_device_names())
+        elif isinstance(e, BPM):
+            return list(e.get_pos_devices()) + [e.get_tilt_device()] + list(e.get_offset_devices())
+        elif isinstance(e, RFPlant):
+            refs = []
+            for t in e._cfg.transmitters or []:
+                refs.extend([t._cfg.voltage, t._cfg.phase])
+            return refs + [e._cfg.masterclock]
+        elif isinstance(e, BetatronTuneMonitor):
+            return [e._cfg.tune_h, e._cfg.tune_v]
+        return []
+
     def fill_device(self, elements: list[Element]):
         """
         Fill device of this control system with Element
-        coming from the configuration file
+        coming from the configuration file.
+        Device references of all elements are collected first and resolved
+        in a single get_devices_access() call, so that backends can batch
+        name resolution and connection setup.
 
         Parameters
         ----------
@@ -131,89 +371,133 @@ class ControlSystem(ElementHolder, metaclass=ABCMeta):
             List of elements coming from the configuration
             file to attach to this control system
         """
+        t0 = time.perf_counter()
+        refs = []
+        offsets = []
         for e in elements:
-            if isinstance(e, Magnet):
-                dev = self.get_device_access(e.model.get_device_names()[0])
-                current = RWHardwareScalar(e.model, dev) if e.model.has_hardware() else None
-                strength = RWStrengthScalar(e.model, dev) if e.model.has_physics() else None
-                # Create a unique ref for this control system
-                m = e.attach(self, strength, current)
+            offsets.append(len(refs))
+            refs.extend(self._element_device_refs(e))
+        offsets.append(len(refs))
+
+        t1 = time.perf_counter()
+        devs = self._get_element_devices(refs) if refs else []
+
+        t2 = time.perf_counter()
+        for idx, e in enumerate(elements):
+            self._attach_element(e, devs[offsets[idx] : offsets[idx + 1]])
+        t3 = time.perf_counter()
+
+        self.__fill_device_timing = {"collect": t1 - t0, "resolve": t2 - t1, "attach": t3 - t2}
+        logger.debug(
+            f"{self.name()}: {len(elements)} elements, {len(refs)} devices, "
+            f"collect {t1 - t0:.3f}s, resolve {t2 - t1:.3f}s, attach {t3 - t2:.3f}s"
+        )
+
+    def _attach_element(self, e: Element, devs: list[DeviceAccess | None]):
+        """Attaches an element to this control system using devices resolved from _element_device_refs()"""
+        if isinstance(e, Magnet) and self.__lazy_attach:
+            model = e.model
+            dev = self._lazy_device(model.get_device_names()[0])
+            current = LazyAccessor(lambda: RWHardwareScalar(model, dev.get())) if model.has_hardware() else None
+            strength = LazyAccessor(lambda: RWStrengthScalar(model, dev.get())) if model.has_physics() else None
+            m = e.attach(self, strength, current)
+            self.add_magnet(m)
+
+        elif isinstance(e, BPM) and self.__lazy_attach:
+            pos = [self._lazy_device(r) for r in e.get_pos_devices()]
+            tilt = self._lazy_device(e.get_tilt_device())
+            offsets = [self._lazy_device(r) for r in e.get_offset_devices()]
+            e = e.attach(
+                self,
+                LazyAccessor(lambda: RBpmArray(pos[0].get(), pos[1].get())),
+                LazyAccessor(lambda: RWBpmOffsetArray(offsets[0].get(), offsets[1].get())),
+                LazyAccessor(lambda: RWBpmTiltScalar(tilt.get())),
+            )
+            self.add_bpm(e)
+
+        elif isinstance(e, Magnet):
+            dev = devs[0]
+            current = RWHardwareScalar(e.model, dev) if e.model.has_hardware() else None
+            strength = RWStrengthScalar(e.model, dev) if e.model.has_physics() else None
+            # Create a unique ref for this control system
+            m = e.attach(self, strength, current)
+            self.add_magnet(m)
+
+        elif isinstance(e, CombinedFunctionMagnet):
+            currents = RWHardwareArray(e.model, devs)
+            strengths = RWStrengthArray(e.model, devs)
+            # Create unique refs the cfm and
+            # each of its function for this control system
+            ms = e.attach(self, strengths, currents)
+            self.add_cfm_magnet(ms[0])
+            for m in ms[1:]:
                 self.add_magnet(m)
 
-            elif isinstance(e, CombinedFunctionMagnet):
-                devs = self.get_devices_access(e.model.get_device_names())
-                currents = RWHardwareArray(e.model, devs)
-                strengths = RWStrengthArray(e.model, devs)
-                # Create unique refs the cfm and
-                # each of its function for this control system
-                ms = e.attach(self, strengths, currents)
-                self.add_cfm_magnet(ms[0])
-                for m in ms[1:]:
-                    self.add_magnet(m)
-
-            elif isinstance(e, SerializedMagnets):
-                devs = self.get_devices_access(e.model.get_device_names())
-                currents = []
-                strengths = []
-                # Create unique refs the series and each of its function for this
-                # control system
-                for i in range(e.get_nb_magnets()):
-                    current = RWHardwareScalar(e.model.get_sub_model(i), devs[i]) if e.model.has_hardware() else None
-                    strength = RWStrengthScalar(e.model.get_sub_model(i), devs[i]) if e.model.has_physics() else None
-                    currents.append(current)
-                    strengths.append(strength)
-                ms = e.attach(self, strengths, currents)
-                self.add_serialized_magnet(ms[0])
-                for m in ms[1:]:
-                    self.add_magnet(m)
-
-            elif isinstance(e, BPM):
-                pos_devs = self.get_devices_access(e.get_pos_devices())
-                tilt_devs = self.get_devices_access([e.get_tilt_device()])
-                offset_devs = self.get_devices_access(e.get_offset_devices())
-                positions = RBpmArray(pos_devs[0], pos_devs[1])
-                tilt = RWBpmTiltScalar(tilt_devs[0])
-                offsets = RWBpmOffsetArray(offset_devs[0], offset_devs[1])
-                e = e.attach(self, positions, offsets, tilt)
-                self.add_bpm(e)
-
-            elif isinstance(e, RFPlant):
-                attachedTrans: list[RFTransmitter] = []
-                if e._cfg.transmitters:
-                    for t in e._cfg.transmitters:
-                        vDev = self.get_device_access(t._cfg.voltage)
-                        pDev = self.get_device_access(t._cfg.phase)
-                        voltage = RWRFVoltageScalar(t, vDev)
-                        phase = RWRFPhaseScalar(t, pDev)
-                        nt = t.attach(self, voltage, phase)
-                        self.add_rf_transnmitter(nt)
-                        attachedTrans.append(nt)
-
-                fDev = self.get_device_access(e._cfg.masterclock)
-                frequency = RWRFFrequencyScalar(e, fDev)
-                voltage = RWTotalVoltage(attachedTrans) if e._cfg.transmitters else None
-                ne = e.attach(self, frequency, voltage)
-                self.add_rf_plant(ne)
-
-            elif isinstance(e, BetatronTuneMonitor):
-                # Built in tune monitor
-                tuneDevs = self.get_devices_access([e._cfg.tune_h, e._cfg.tune_v])
-                betatron_tune = RBetatronTuneArray(e, tuneDevs)
-                e = e.attach(self, betatron_tune)
-                self.add_betatron_tune_monitor(e)
-
-            elif isinstance(e, TuningTool) | isinstance(e, MeasurementTool):
-                self.add_tool(e.attach(self))
-
-            elif isinstance(e, UnboundElement):
-                if self.name() in e._control_modes:
-                    ne = e.instantiate(self)
-
-                    if isinstance(ne, ABetatronTuneMonitor):
-                        self.add_betatron_tune_monitor(ne)
-                    else:
-                        # Default to standard Element
-                        self.add_element(ne)
+        elif isinstance(e, SerializedMagnets):
+            currents = []
+            strengths = []
+            # Create unique refs the series and each of its function for this
+            # control system, all magnets share the same power supply
+            for i in range(e.get_nb_magnets()):
+                current = RWHardwareScalar(e.model.get_sub_model(i), devs[0]) if e.model.has_hardware() else None
+                strength = RWStrengthScalar(e.model.get_sub_model(i), devs[0]) if e.model.has_physics() else None
+                currents.append(current)
+                strengths.append(strength)
+            # The series is accessed through its power supply, its strength is the
+            # sum of the strengths of its magnets (as for the serialized aggregators)
+            series_current = RWHardwareScalar(e.model, devs[0]) if e.model.has_hardware() else None
+            series_strength = RWSerializedStrengthScalar(e.model, devs[0]) if e.model.has_physics() else None
+            ms = e.attach(self, strengths, currents, series_strength, series_current)
+            self.add_serialized_magnet(ms[0])
+            for m in ms[1:]:
+                self.add_magnet(m)
+
+        elif isinstance(e, BPM):
+            nbPos = len(e.get_pos_devices())
+            pos_devs = devs[:nbPos]
+            tilt_devs = devs[nbPos : nbPos + 1]
+            offset_devs = devs[nbPos + 1 :]
+            positions = RBpmArray(pos_devs[0], pos_devs[1])
+            tilt = RWBpmTiltScalar(tilt_devs[0])
+            offsets = RWBpmOffsetArray(offset_devs[0], offset_devs[1])
+            e = e.attach(self, positions, offsets, tilt)
+            self.add_bpm(e)
+
+        elif isinstance(e, RFPlant):
+            attachedTrans: list[RFTransmitter] = []
+            if e._cfg.transmitters:
+                for idx, t in enumerate(e._cfg.transmitters):
+                    vDev, pDev = devs[2 * idx : 2 * idx + 2]
+                    voltage = RWRFVoltageScalar(t, vDev)
+                    phase = RWRFPhaseScalar(t, pDev)
+                    nt = t.attach(self, voltage, phase)
+                    self.add_rf_transnmitter(nt)
+                    attachedTrans.append(nt)
+
+            fDev = devs[-1]
+            frequency = RWRFFrequencyScalar(e, fDev)
+            voltage = RWTotalVoltage(attachedTrans) if e._cfg.transmitters else None
+            ne = e.attach(self, frequency, voltage)
+            self.add_rf_plant(ne)
+
+        elif isinstance(e, BetatronTuneMonitor):
+            # Built in tune monitor
+            betatron_tune = RBetatronTuneArray(e, devs)
+            e = e.attach(self, betatron_tune)
+            self.add_betatron_tune_monitor(e)
+
+        elif isinstance(e, TuningTool) | isinstance(e, MeasurementTool):
+            self.add_tool(e.attach(self))
+
+        elif isinstance(e, UnboundElement):
+            if self.name() in e._control_modes:
+                ne = e.instantiate(self)
+
+                if isinstance(ne, ABetatronTuneMonitor):
+                    self.add_betatron_tune_monitor(ne)
+                else:
+                    # Default to standard Element
+                    self.add_element(ne)
 
 
 class ControlSystemAdapter(ControlSystem):
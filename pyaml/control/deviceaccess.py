@@ -1,5 +1,8 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
 
+from .monitor import DEFAULT_CAPACITY, DEFAULT_POLL_PERIOD, Callback, Monitor
+
 # TODO: correctly type value
 
 
@@ -66,3 +69,101 @@ class DeviceAccess(metaclass=ABCMeta):
             True if device is available, False otherwise
         """
         pass
+
+    def get_tolerance(self) -> float | None:
+        """
+        Get the absolute tolerance used by set_and_wait() to consider that
+        the readback has reached the setpoint.
+
+        Returns
+        -------
+        float | None
+            Tolerance, None (default) if set_and_wait() does not wait for the
+            readback of this device
+        """
+        return None
+
+    def get_deadband(self) -> float | None:
+        """
+        Get the dead-band used by aggregators to drop writes that change
+        the setpoint by less than the device resolution.
+
+        Returns
+        -------
+        float | None
+            Dead-band, None (default) to disable write filtering
+        """
+        return None
+
+    def get_max_rate(self) -> float | None:
+        """
+        Get the maximum setpoint change per second (slew rate) used when
+        ramping this device (see :py:class:`~pyaml.common.ramp.Ramp`).
+
+        Returns
+        -------
+        float | None
+            Maximum rate in unit per second, None (default) for no limit
+        """
+        return None
+
+    def get_timeout(self) -> float | None:
+        """
+        Get the maximum time set_and_wait() waits for the readback to reach
+        the setpoint.
+
+        Returns
+        -------
+        float | None
+            Timeout in seconds, None (default) to use the default timeout
+        """
+        return None
+
+    # Asynchronous access, backends having a native asynchronous API should
+    # override these methods
+
+    async def get_async(self):
+        """
+        Asynchronous version of :py:meth:`get`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self.get)
+
+    async def set_async(self, value):
+        """
+        Asynchronous version of :py:meth:`set`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        await asyncio.to_thread(self.set, value)
+
+    async def readback_async(self):
+        """
+        Asynchronous version of :py:meth:`readback`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self.readback)
+
+    def monitor(self, period: float = DEFAULT_POLL_PERIOD, capacity: int = DEFAULT_CAPACITY) -> Monitor:
+        """
+        Creates a (not started) monitor of the readback of this variable.
+        The default implementation polls readback(), backends having native
+        events should override it.
+
+        Parameters
+        ----------
+        period : float
+            Polling period in seconds
+        capacity : int
+            Number of samples kept in the history
+        """
+        return Monitor(self, 1, period, capacity)
+
+    def subscribe(self, callback: Callback, period: float = DEFAULT_POLL_PERIOD) -> Monitor:
+        """
+        Calls callback(timestamp, values, qualities) on each readback change.
+        Returns the running monitor, call stop() on it to unsubscribe.
+        """
+        m = self.monitor(period)
+        m.subscribe(callback)
+        m.start()
+        return m
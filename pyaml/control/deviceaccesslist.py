@@ -1,9 +1,13 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
 
 import numpy as np
 import numpy.typing as npt
 
+from ..common.exception import PyAMLException
 from .deviceaccess import DeviceAccess
+from .monitor import DEFAULT_CAPACITY, DEFAULT_POLL_PERIOD, Callback, Monitor
+from .readback_value import ValueArray
 
 
 class DeviceAccessList(metaclass=ABCMeta):
@@ -38,14 +42,31 @@ class DeviceAccessList(metaclass=ABCMeta):
         """Write a list control system device variable (i.e. a power supply currents)"""
         pass
 
+    def supports_sparse_write(self) -> bool:
+        """Tells if set_sparse() is supported, False by default"""
+        return False
+
+    def set_sparse(self, indices: npt.NDArray[np.intp], value: npt.NDArray[np.float64]):
+        """
+        Writes only a subset of the variables of the list.
+
+        Parameters
+        ----------
+        indices : NDArray
+            Indices of the variables to write
+        value : NDArray
+            Values, one per index
+        """
+        raise PyAMLException(f"{self.__class__.__name__} does not support sparse writes")
+
     @abstractmethod
     def get(self) -> npt.NDArray[np.float64]:
         """Return a list of setpoints of control system device variables"""
         pass
 
     @abstractmethod
-    def readback(self) -> np.array:
-        """Return the measured variables"""
+    def readback(self) -> ValueArray:
+        """Return the measured variables, with their quality and timestamp"""
         pass
 
     @abstractmethod
@@ -77,6 +98,30 @@ class DeviceAccessList(metaclass=ABCMeta):
         """
         pass
 
+    # Asynchronous access, backends having a native asynchronous API should
+    # override these methods
+
+    async def get_async(self) -> npt.NDArray[np.float64]:
+        """
+        Asynchronous version of :py:meth:`get`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self.get)
+
+    async def set_async(self, value: npt.NDArray[np.float64]):
+        """
+        Asynchronous version of :py:meth:`set`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        await asyncio.to_thread(self.set, value)
+
+    async def readback_async(self) -> np.array:
+        """
+        Asynchronous version of :py:meth:`readback`.
+        The default implementation offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self.readback)
+
     # Immutable list implementation
 
     def __getitem__(self, index):
@@ -95,3 +140,28 @@ class DeviceAccessList(metaclass=ABCMeta):
             return self._items[self._iter_pos - 1]
         else:
             raise StopIteration
+
+    def monitor(self, period: float = DEFAULT_POLL_PERIOD, capacity: int = DEFAULT_CAPACITY) -> Monitor:
+        """
+        Creates a (not started) monitor of the readbacks of all variables of
+        the list. The default implementation polls readback() of the whole list,
+        backends having native events should override it.
+
+        Parameters
+        ----------
+        period : float
+            Polling period in seconds
+        capacity : int
+            Number of samples kept in the history
+        """
+        return Monitor(self, self.len(), period, capacity)
+
+    def subscribe(self, callback: Callback, period: float = DEFAULT_POLL_PERIOD) -> Monitor:
+        """
+        Calls callback(timestamp, values, qualities) on each readback change.
+        Returns the running monitor, call stop() on it to unsubscribe.
+        """
+        m = self.monitor(period)
+        m.subscribe(callback)
+        m.start()
+        return m
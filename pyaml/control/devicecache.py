@@ -0,0 +1,347 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ConfigDict
+
+from ..common.exception import PyAMLException
+from .deviceaccess import DeviceAccess
+from .deviceaccesslist import DeviceAccessList
+from .monitor import Monitor
+from .readback_value import ValueArray
+
+# Define the main class name for this module
+PYAMLCLASS = "DeviceCache"
+
+# Suffix used to store readbacks next to setpoints
+_READBACK = "#readback"
+
+
+class ConfigModel(BaseModel):
+    """
+    Configuration model for a device cache
+
+    Parameters
+    ----------
+    ttl : float
+        Time to live of a cached value in seconds
+    max_entries : int
+        Maximum number of cached values, the least recently used
+        values are evicted first
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
+
+    ttl: float = 0.1
+    max_entries: int = 10000
+
+
+class DeviceCache:
+    """
+    In memory cache of device values shared by all the cached device accesses
+    of a control system. Values are indexed by device name, so a value read
+    through a :py:class:`CachedDeviceAccessList` can be served to a
+    :py:class:`CachedDeviceAccess` pointing to the same device and a write
+    through one of them invalidates both.
+
+    Example
+    -------
+
+    A cache can be given to a control system as in the following example:
+
+    .. code-block:: python
+
+        >>> cache = DeviceCache(ConfigModel(ttl=0.2))
+        >>> cs.set_device_cache(cache)
+        >>> ... # attach elements
+        >>> print(cache.stats())
+    """
+
+    def __init__(self, cfg: ConfigModel):
+        if cfg.ttl < 0:
+            raise PyAMLException(f"DeviceCache: ttl must be positive, got {cfg.ttl}")
+        if cfg.max_entries < 1:
+            raise PyAMLException(f"DeviceCache: max_entries must be strictly positive, got {cfg.max_entries}")
+        self._cfg = cfg
+        # Entries are (time, value, None) or (time, array, channel index)
+        self.__entries: OrderedDict[str, tuple[float, Any, int | None]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __lookup(self, keys: list[str]) -> list[tuple[Any, int | None]] | None:
+        now = time.monotonic()
+        entries = []
+        with self.__lock:
+            for k in keys:
+                entry = self.__entries.get(k)
+                if entry is None or now - entry[0] > self._cfg.ttl:
+                    self.__hits += len(entries)
+                    self.__misses += len(keys) - len(entries)
+                    return None
+                self.__entries.move_to_end(k)
+                entries.append(entry[1:])
+            self.__hits += len(entries)
+        return entries
+
+    def lookup(self, keys: list[str]) -> list[Any] | None:
+        """
+        Returns the cached values for all the given keys or None if at least one
+        of them is missing or expired. Hit and miss counters are updated per key.
+        """
+        entries = self.__lookup(keys)
+        if entries is None:
+            return None
+        return [v if idx is None else v[idx] for v, idx in entries]
+
+    def lookup_array(self, keys: list[str]) -> Any | None:
+        """
+        Same as lookup() but returns the array given to store_array() when all
+        the keys were stored together by this call, in the same order.
+        """
+        entries = self.__lookup(keys)
+        if entries is None or len(entries) == 0:
+            return entries
+        array = entries[0][0]
+        if all(v is array and idx == i for i, (v, idx) in enumerate(entries)) and len(array) == len(entries):
+            return array
+        return [v if idx is None else v[idx] for v, idx in entries]
+
+    def store(self, keys: list[str], values: list[Any]):
+        """Stores the given values, evicts least recently used ones if needed"""
+        self.__store(zip(keys, values, [None] * len(keys), strict=True))
+
+    def store_array(self, keys: list[str], values: Any):
+        """
+        Stores the values of several channels (NumPy array or ValueArray) read
+        in one call. The array is shared by the entries, it is not split.
+        """
+        self.__store(zip(keys, [values] * len(keys), range(len(keys)), strict=True))
+
+    def __store(self, entries):
+        now = time.monotonic()
+        with self.__lock:
+            for k, v, idx in entries:
+                self.__entries[k] = (now, v, idx)
+                self.__entries.move_to_end(k)
+            while len(self.__entries) > self._cfg.max_entries:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def invalidate(self, keys: list[str] | None = None):
+        """Removes the given keys (setpoints and readbacks) from the cache, everything if keys is None"""
+        with self.__lock:
+            if keys is None:
+                self.__entries.clear()
+                return
+            for k in keys:
+                self.__entries.pop(k, None)
+                self.__entries.pop(k + _READBACK, None)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns cache statistics.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of hits, misses, evictions and current number of entries
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "entries": len(self.__entries),
+            }
+
+    def reset_stats(self):
+        """Resets hit, miss and eviction counters"""
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def __repr__(self):
+        return repr(self._cfg).replace("ConfigModel", self.__class__.__name__)
+
+
+# ------------------------------------------------------------------------------
+
+
+class CachedDeviceAccess(DeviceAccess):
+    """
+    DeviceAccess decorator serving setpoints and readbacks from a
+    :py:class:`DeviceCache`. Writes are forwarded to the device and
+    invalidate the cached values.
+
+    Parameters
+    ----------
+    dev : DeviceAccess
+        Decorated device
+    cache : DeviceCache
+        Cache shared with the other cached accesses of the control system
+    """
+
+    def __init__(self, dev: DeviceAccess, cache: DeviceCache):
+        self.__dev = dev
+        self.__cache = cache
+        self.__key = [dev.name()]
+        self.__rb_key = [dev.name() + _READBACK]
+
+    def device(self) -> DeviceAccess:
+        """Returns the decorated device"""
+        return self.__dev
+
+    def name(self) -> str:
+        return self.__dev.name()
+
+    def measure_name(self) -> str:
+        return self.__dev.measure_name()
+
+    def set(self, value):
+        self.__dev.set(value)
+        self.__cache.invalidate(self.__key)
+
+    def set_and_wait(self, value):
+        self.__dev.set_and_wait(value)
+        self.__cache.invalidate(self.__key)
+
+    def get(self):
+        values = self.__cache.lookup(self.__key)
+        if values is not None:
+            return values[0]
+        value = self.__dev.get()
+        self.__cache.store(self.__key, [value])
+        return value
+
+    def readback(self):
+        values = self.__cache.lookup(self.__rb_key)
+        if values is not None:
+            return values[0]
+        value = self.__dev.readback()
+        self.__cache.store(self.__rb_key, [value])
+        return value
+
+    def unit(self) -> str:
+        return self.__dev.unit()
+
+    def get_range(self) -> list[float]:
+        return self.__dev.get_range()
+
+    def get_tolerance(self) -> float | None:
+        return self.__dev.get_tolerance()
+
+    def get_timeout(self) -> float | None:
+        return self.__dev.get_timeout()
+
+    def get_deadband(self) -> float | None:
+        return self.__dev.get_deadband()
+
+    def check_device_availability(self) -> bool:
+        return self.__dev.check_device_availability()
+
+    def monitor(self, *args, **kwargs) -> Monitor:
+        # Monitors bypass the cache
+        return self.__dev.monitor(*args, **kwargs)
+
+    def __repr__(self):
+        return repr(self.__dev)
+
+
+# ------------------------------------------------------------------------------
+
+
+class CachedDeviceAccessList(DeviceAccessList):
+    """
+    DeviceAccessList decorator serving setpoints and readbacks from a
+    :py:class:`DeviceCache`. A read is served from memory only when all the
+    channels of the list are cached, otherwise a single read of the whole
+    list is performed and the cache is refreshed.
+
+    Parameters
+    ----------
+    devs : DeviceAccessList
+        Decorated device list
+    cache : DeviceCache
+        Cache shared with the other cached accesses of the control system
+    """
+
+    def __init__(self, devs: DeviceAccessList, cache: DeviceCache):
+        self.__devs = devs
+        self.__cache = cache
+        self._items: list[DeviceAccess] = []
+        self.__keys: list[str] = []
+        self.__rb_keys: list[str] = []
+
+    def device_list(self) -> DeviceAccessList:
+        """Returns the decorated device list"""
+        return self.__devs
+
+    def add_devices(self, devices: DeviceAccess | list[DeviceAccess]):
+        self.__devs.add_devices(devices)
+        devices = devices if isinstance(devices, list) else [devices]
+        self._items.extend(devices)
+        self.__keys.extend([d.name() for d in devices])
+        self.__rb_keys.extend([d.name() + _READBACK for d in devices])
+
+    def get_device_at(self, index: int) -> DeviceAccess:
+        return self.__devs.get_device_at(index)
+
+    def len(self) -> int:
+        return self.__devs.len()
+
+    def set(self, value: npt.NDArray[np.float64]):
+        self.__devs.set(value)
+        self.__cache.invalidate(self.__keys)
+
+    def set_and_wait(self, value: npt.NDArray[np.float64]):
+        self.__devs.set_and_wait(value)
+        self.__cache.invalidate(self.__keys)
+
+    def supports_sparse_write(self) -> bool:
+        return self.__devs.supports_sparse_write()
+
+    def set_sparse(self, indices: npt.NDArray[np.intp], value: npt.NDArray[np.float64]):
+        self.__devs.set_sparse(indices, value)
+        self.__cache.invalidate([self.__keys[i] for i in indices])
+
+    def get(self) -> npt.NDArray[np.float64]:
+        # Copies are returned as callers may modify setpoint arrays
+        values = self.__cache.lookup_array(self.__keys)
+        if values is not None:
+            return np.array(values, dtype=float)
+        values = np.asarray(self.__devs.get(), dtype=float)
+        self.__cache.store_array(self.__keys, values.copy())
+        return values
+
+    def readback(self) -> ValueArray:
+        values = self.__cache.lookup_array(self.__rb_keys)
+        if isinstance(values, ValueArray):
+            return ValueArray(values.values.copy(), values.quality.copy(), values.timestamp.copy())
+        if values is not None:
+            return ValueArray.from_values(values)
+        values = self.__devs.readback()
+        if len(values) == len(self.__rb_keys):
+            self.__cache.store_array(self.__rb_keys, ValueArray.from_values(values))
+        return values
+
+    def unit(self) -> str:
+        return self.__devs.unit()
+
+    def get_range(self) -> list[float]:
+        return self.__devs.get_range()
+
+    def check_device_availability(self) -> bool:
+        return self.__devs.check_device_availability()
+
+    def monitor(self, *args, **kwargs) -> Monitor:
+        # Monitors bypass the cache
+        return self.__devs.monitor(*args, **kwargs)
+
+    def __repr__(self):
+        return repr(self.__devs)
@@ -0,0 +1,297 @@
+"""
+Subscription to value changes of control system variables with
+ring-buffered history.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from ..common.exception import PyAMLException
+from .readback_value import Quality, Value, ValueArray
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_PERIOD = 0.1
+"""Default polling period in seconds"""
+DEFAULT_CAPACITY = 1024
+"""Default number of samples kept in the history"""
+
+Callback = Callable[[float, npt.NDArray[np.float64], npt.NDArray[np.uint8]], None]
+"""Callback signature: callback(timestamp, values, qualities)"""
+
+
+class RingBuffer:
+    """
+    Fixed size history of (timestamp, value, quality) samples of a set of
+    channels. Samples are stored in preallocated NumPy arrays, the oldest
+    sample is overwritten when the buffer is full. Qualities are stored
+    as :py:class:`~pyaml.control.readback_value.Quality` values.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of samples
+    nb_channel : int
+        Number of channels per sample
+    """
+
+    def __init__(self, capacity: int, nb_channel: int):
+        if capacity < 1:
+            raise PyAMLException(f"RingBuffer: capacity must be strictly positive, got {capacity}")
+        self.__timestamps = np.zeros(capacity)
+        self.__values = np.zeros((capacity, nb_channel))
+        self.__qualities = np.zeros((capacity, nb_channel), dtype=np.uint8)
+        self.__capacity = capacity
+        self.__count = 0  # Total number of appended samples
+        self.__lock = threading.Lock()
+
+    def append(self, timestamp: float, values: npt.NDArray[np.float64], qualities: npt.NDArray[np.uint8]):
+        """Appends a sample"""
+        with self.__lock:
+            idx = self.__count % self.__capacity
+            self.__timestamps[idx] = timestamp
+            self.__values[idx] = values
+            self.__qualities[idx] = qualities
+            self.__count += 1
+
+    def count(self) -> int:
+        """Returns the total number of samples appended since creation"""
+        return self.__count
+
+    def __len__(self) -> int:
+        return min(self.__count, self.__capacity)
+
+    def last(self, n: int | None = None) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.uint8]]:
+        """
+        Returns the n last samples in chronological order.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of samples, all available samples by default
+
+        Returns
+        -------
+        tuple
+            Timestamps (n,), values (n, nb_channel) and qualities (n, nb_channel)
+        """
+        with self.__lock:
+            size = min(self.__count, self.__capacity)
+            n = size if n is None else min(n, size)
+            idx = (np.arange(self.__count - n, self.__count)) % self.__capacity
+            return self.__timestamps[idx], self.__values[idx], self.__qualities[idx]
+
+    def mean(self, n: int | None = None) -> npt.NDArray[np.float64]:
+        """
+        Returns the average of the n last samples per channel, samples
+        whose quality is not VALID are ignored (NaN if no valid sample).
+        """
+        _, values, qualities = self.last(n)
+        valid = qualities == Quality.VALID.value
+        nb = np.sum(valid, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(nb > 0, np.sum(np.where(valid, values, 0.0), axis=0) / nb, np.nan)
+
+
+def split_sample(values: Any) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.uint8]]:
+    """
+    Converts value(s) returned by a DeviceAccess or a DeviceAccessList
+    (float, Value, ValueArray, list of Value or array) to float values and quality codes.
+    """
+    if isinstance(values, ValueArray):
+        return values.values, values.quality
+    items = values if isinstance(values, (list, tuple, np.ndarray)) else [values]
+    items = np.ravel(np.asarray(items, dtype=object))
+    v = np.array([float(i.value) if isinstance(i, Value) else float(i) for i in items])
+    q = np.array([i.quality.value if isinstance(i, Value) else Quality.VALID.value for i in items], dtype=np.uint8)
+    return v, q
+
+
+def sample_time(values: Any) -> float | None:
+    """
+    Returns the most recent timestamp (time.time() reference) of value(s)
+    returned by a DeviceAccess or a DeviceAccessList, None if they carry no
+    timestamp (plain numbers).
+    """
+    if isinstance(values, ValueArray):
+        return float(np.max(values.timestamp)) if len(values) > 0 else None
+    items = values if isinstance(values, (list, tuple, np.ndarray)) else [values]
+    times = [i.timestamp.timestamp() for i in np.ravel(np.asarray(items, dtype=object)) if isinstance(i, Value)]
+    return max(times) if len(times) > 0 else None
+
+
+class Monitor:
+    """
+    Subscription to the value changes of a DeviceAccess or a DeviceAccessList.
+    Each new sample is stored in a :py:class:`RingBuffer` and sent to the
+    subscribed callbacks.
+
+    Samples are fed with :py:meth:`push`. Once started, the default
+    implementation polls readback() of the source from a daemon thread and pushes
+    a sample when values or qualities change. Backends supporting native events
+    should create a Monitor and call push() from their event callback instead of
+    starting the polling thread.
+
+    Parameters
+    ----------
+    source : DeviceAccess | DeviceAccessList
+        Monitored variable(s)
+    nb_channel : int
+        Number of channels of the source
+    period : float
+        Polling period in seconds
+    capacity : int
+        Number of samples kept in the history
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        >>> with bpm_devices.monitor(period=0.05) as m:
+        ...     t, pos, q = m.wait_next(timeout=1.0)
+        ...     avg = m.history().mean(10)
+    """
+
+    def __init__(self, source: Any, nb_channel: int, period: float = DEFAULT_POLL_PERIOD, capacity: int = DEFAULT_CAPACITY):
+        if period <= 0:
+            raise PyAMLException(f"Monitor: period must be strictly positive, got {period}")
+        self.__source = source
+        self.__period = period
+        self.__history = RingBuffer(capacity, nb_channel)
+        self.__callbacks: dict[int, Callback] = {}
+        self.__next_handle = 0
+        self.__cond = threading.Condition()
+        self.__thread: threading.Thread | None = None
+        self.__stop = threading.Event()
+        self.__last: tuple[npt.NDArray[np.float64], npt.NDArray[np.uint8]] | None = None
+
+    def history(self) -> RingBuffer:
+        """Returns the sample history"""
+        return self.__history
+
+    def subscribe(self, callback: Callback) -> int:
+        """
+        Adds a callback called with (timestamp, values, qualities) on each new sample.
+        Callbacks are executed in the thread pushing the sample.
+
+        Returns
+        -------
+        int
+            Handle used to unsubscribe
+        """
+        with self.__cond:
+            handle = self.__next_handle
+            self.__next_handle += 1
+            self.__callbacks[handle] = callback
+        return handle
+
+    def unsubscribe(self, handle: int):
+        """Removes a callback"""
+        with self.__cond:
+            self.__callbacks.pop(handle, None)
+
+    def push(self, values: Any, timestamp: float | None = None):
+        """
+        Stores a new sample and notifies subscribers.
+
+        Parameters
+        ----------
+        values : Any
+            Value(s) as returned by the source readback()
+        timestamp : float, optional
+            Sample time (time.time() reference), by default the most recent
+            timestamp of the values or now if they carry no timestamp
+        """
+        v, q = split_sample(values)
+        self.__store(self.__sample_time(values) if timestamp is None else timestamp, v, q)
+
+    @staticmethod
+    def __sample_time(values: Any) -> float:
+        t = sample_time(values)
+        return time.time() if t is None else t
+
+    def __store(self, timestamp: float, v: npt.NDArray[np.float64], q: npt.NDArray[np.uint8]):
+        with self.__cond:
+            self.__history.append(timestamp, v, q)
+            self.__last = (v, q)
+            callbacks = list(self.__callbacks.values())
+            self.__cond.notify_all()
+        for callback in callbacks:
+            try:
+                callback(timestamp, v, q)
+            except Exception as ex:
+                logger.error(f"Monitor callback {callback} failed: {ex}")
+
+    def wait_next(self, timeout: float | None = None) -> tuple[float, npt.NDArray[np.float64], npt.NDArray[np.uint8]]:
+        """
+        Waits for the next sample pushed after this call.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum waiting time in seconds, no timeout by default
+
+        Returns
+        -------
+        tuple
+            Timestamp, values and qualities of the sample
+
+        Raises
+        ------
+        PyAMLException
+            If no sample is received before the timeout
+        """
+        with self.__cond:
+            count = self.__history.count()
+            if not self.__cond.wait_for(lambda: self.__history.count() > count, timeout):
+                raise PyAMLException(f"Monitor: no new sample received after {timeout:g}s")
+            t, v, q = self.__history.last(1)
+            return t[0], v[0], q[0]
+
+    def start(self):
+        """Reads the initial value(s) and starts the polling thread"""
+        if self.__thread is not None:
+            return
+        self.__poll_once()
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__poll, name=f"pyaml-monitor-{id(self):x}", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stops the polling thread"""
+        if self.__thread is None:
+            return
+        self.__stop.set()
+        self.__thread.join()
+        self.__thread = None
+
+    def is_running(self) -> bool:
+        return self.__thread is not None
+
+    def __poll_once(self):
+        try:
+            values = self.__source.readback()
+            v, q = split_sample(values)
+            last = self.__last
+            if last is None or not (np.array_equal(last[0], v, equal_nan=True) and np.array_equal(last[1], q)):
+                # Samples are stamped with the acquisition time given by the source
+                self.__store(self.__sample_time(values), v, q)
+        except Exception as ex:
+            logger.warning(f"Monitor polling of {self.__source} failed: {ex}")
+
+    def __poll(self):
+        while not self.__stop.wait(self.__period):
+            self.__poll_once()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,160 @@
+"""
+Simultaneous acquisition of heterogeneous observables (tunes, RF frequency,
+BPM positions, ...).
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ..common.abstract_aggregator import ScalarAggregator
+from ..common.exception import PyAMLException
+from .deviceaccess import DeviceAccess
+from .readback_value import ValueArray
+
+
+@dataclass(frozen=True)
+class MultiReading:
+    """
+    Values of the observables of a :py:class:`MultiReader` acquired together.
+
+    Parameters
+    ----------
+    read_time : float
+        Local time (time.time() reference) at the middle of the read
+    values : dict[str, np.ndarray]
+        Values of each observable, reshaped to the observable shape
+    timestamps : dict[str, np.ndarray]
+        POSIX timestamps given by the control system for each value of each
+        observable, read_time for observables read through an accessor
+    """
+
+    read_time: float
+    values: dict[str, npt.NDArray[np.float64]] = field(default_factory=dict)
+    timestamps: dict[str, npt.NDArray[np.float64]] = field(default_factory=dict)
+
+    def spread(self) -> float:
+        """
+        Returns the time span in seconds between the oldest and the most recent
+        timestamps of all the values, i.e. how far the acquisition is from
+        being simultaneous
+        """
+        if len(self.timestamps) == 0:
+            return 0.0
+        t = np.concatenate([np.ravel(t) for t in self.timestamps.values()])
+        return float(np.max(t) - np.min(t))
+
+    def __getitem__(self, name: str) -> npt.NDArray[np.float64]:
+        return self.values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+
+class MultiReader:
+    """
+    Reads several named observables together. Observables backed by control
+    system devices are concatenated in a single aggregator and their readbacks
+    are fetched in one DeviceAccessList call, others (i.e. simulator accessors)
+    are read through their accessor right after.
+
+    Readers are created by
+    :py:meth:`ElementHolder.create_multi_reader() <pyaml.common.element_holder.ElementHolder.create_multi_reader>`.
+
+    Parameters
+    ----------
+    peer : ScalarAggregator, optional
+        Aggregator used to read device backed observables
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        >>> reader = sr.live.create_multi_reader({"tune": tm, "orbit": bpms, "rf": rf})
+        >>> r = reader.get()
+        >>> r["tune"], r["orbit"], r["rf"]
+    """
+
+    def __init__(self, peer: ScalarAggregator | None = None):
+        self.__peer = peer
+        self.__slices: dict[str, tuple[slice, tuple[int, ...]]] = {}
+        self.__accessors: dict[str, tuple[Any, tuple[int, ...]]] = {}
+        self.__nb_channel = 0
+
+    def add_devices(self, name: str, devices: list[DeviceAccess], shape: tuple[int, ...] = None):
+        """
+        Adds an observable read from devices
+
+        Parameters
+        ----------
+        name : str
+            Observable name
+        devices : list[DeviceAccess]
+            Devices of the observable, in flattened order
+        shape : tuple[int, ...], optional
+            Shape of the observable value, (len(devices),) by default
+        """
+        if self.__peer is None:
+            raise PyAMLException(f"MultiReader: cannot add devices of '{name}', no aggregator")
+        shape = (len(devices),) if shape is None else tuple(shape)
+        if int(np.prod(shape)) != len(devices):
+            raise PyAMLException(f"MultiReader: shape {shape} of '{name}' does not match {len(devices)} devices")
+        self.__check_name(name)
+        self.__peer.add_devices(devices)
+        self.__slices[name] = (slice(self.__nb_channel, self.__nb_channel + len(devices)), shape)
+        self.__nb_channel += len(devices)
+
+    def add_accessor(self, name: str, accessor: Any, shape: tuple[int, ...] = ()):
+        """
+        Adds an observable read through an accessor (i.e. tune monitor tune)
+
+        Parameters
+        ----------
+        name : str
+            Observable name
+        accessor : ReadFloatScalar | ReadFloatArray
+            Accessor of the observable
+        shape : tuple[int, ...]
+            Shape of the observable value, () for a scalar
+        """
+        self.__check_name(name)
+        self.__accessors[name] = (accessor, tuple(shape))
+
+    def __check_name(self, name: str):
+        if name in self.__slices or name in self.__accessors:
+            raise PyAMLException(f"MultiReader: duplicate observable '{name}'")
+
+    def names(self) -> list[str]:
+        return list(self.__slices) + list(self.__accessors)
+
+    def nb_device(self) -> int:
+        """Returns the number of channels read in the single backend call"""
+        return self.__nb_channel
+
+    def get(self) -> MultiReading:
+        """
+        Reads all observables
+
+        Returns
+        -------
+        MultiReading
+            Values of all observables
+        """
+        t0 = time.time()
+        values = {}
+        timestamps = {}
+        if self.__nb_channel > 0:
+            channels = ValueArray.from_values(self.__peer.readback())
+            for name, (s, shape) in self.__slices.items():
+                values[name] = channels.values[s].reshape(shape)
+                timestamps[name] = channels.timestamp[s].reshape(shape)
+        for name, (accessor, shape) in self.__accessors.items():
+            values[name] = np.asarray(accessor.get(), dtype=float).reshape(shape)
+        read_time = 0.5 * (t0 + time.time())
+        for name, (_, shape) in self.__accessors.items():
+            timestamps[name] = np.full(shape, read_time)
+        return MultiReading(read_time, values, timestamps)
@@ -1,8 +1,10 @@
+import time
 from datetime import datetime
 from enum import Enum, auto
-from typing import Union
+from typing import Any, Iterator, Union
 
 import numpy as np
+import numpy.typing as npt
 
 
 class Quality(Enum):
@@ -50,6 +52,8 @@ class Value:
         Timestamp associated with the value. Defaults to current time.
     """
 
+    __slots__ = ("value", "quality", "timestamp")
+
     def __init__(
         self,
         value: Union[float, int, np.ndarray],
@@ -317,3 +321,157 @@ class Value:
             True if the quality is VALID or CHANGING.
         """
         return self.quality in (Quality.VALID, Quality.CHANGING)
+
+
+_GOOD_QUALITIES = np.array([Quality.VALID.value, Quality.CHANGING.value], dtype=np.uint8)
+
+
+def _raw(other):
+    """Returns the raw value(s) of an operand"""
+    if isinstance(other, ValueArray):
+        return other.values
+    if isinstance(other, Value):
+        return other.value
+    return other
+
+
+class ValueArray:
+    """
+    Readbacks of several channels stored in contiguous arrays.
+
+    This is the array counterpart of :py:class:`Value` returned by
+    :py:meth:`DeviceAccessList.readback() <pyaml.control.deviceaccesslist.DeviceAccessList.readback>`.
+    It converts to a float NumPy array (``np.asarray(va)``), supports
+    vectorized arithmetic and comparisons, and yields :py:class:`Value`
+    objects when iterated or indexed.
+
+    Parameters
+    ----------
+    values : array_like
+        The numerical values, one per channel.
+    quality : array_like of uint8 or Quality, optional
+        Quality codes (:py:class:`Quality` values), one per channel or a
+        single one for all channels. Defaults to Quality.VALID.
+    timestamp : array_like of float, optional
+        POSIX timestamps, one per channel or a single one for all channels.
+        Defaults to current time.
+    """
+
+    __slots__ = ("values", "quality", "timestamp")
+
+    def __init__(
+        self,
+        values: npt.ArrayLike,
+        quality: npt.ArrayLike | Quality = Quality.VALID,
+        timestamp: npt.ArrayLike | None = None,
+    ):
+        self.values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+        n = self.values.size
+        if isinstance(quality, Quality):
+            quality = quality.value
+        self.quality = np.ascontiguousarray(np.broadcast_to(np.asarray(quality, dtype=np.uint8), (n,)))
+        timestamp = time.time() if timestamp is None else timestamp
+        self.timestamp = np.ascontiguousarray(np.broadcast_to(np.asarray(timestamp, dtype=np.float64), (n,)))
+
+    @classmethod
+    def from_values(cls, values: list[Any]) -> "ValueArray":
+        """
+        Builds a ValueArray from a list of :py:class:`Value` or numbers.
+
+        Parameters
+        ----------
+        values : list[Value | float]
+            Readbacks of each channel
+        """
+        if isinstance(values, ValueArray):
+            return values
+        now = time.time()
+        v = np.empty(len(values))
+        q = np.full(len(values), Quality.VALID.value, dtype=np.uint8)
+        t = np.full(len(values), now)
+        for idx, item in enumerate(values):
+            if isinstance(item, Value):
+                v[idx] = float(item.value)
+                q[idx] = item.quality.value
+                t[idx] = item.timestamp.timestamp()
+            else:
+                v[idx] = float(item)
+        return cls(v, q, t)
+
+    def is_good(self) -> npt.NDArray[np.bool_]:
+        """
+        Check which channels have a good quality.
+
+        Returns
+        -------
+        numpy.ndarray of bool
+            True where the quality is VALID or CHANGING.
+        """
+        return np.isin(self.quality, _GOOD_QUALITIES)
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def __getitem__(self, index) -> Union[Value, "ValueArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Value(
+                float(self.values[index]),
+                Quality(int(self.quality[index])),
+                datetime.fromtimestamp(self.timestamp[index]),
+            )
+        return ValueArray(self.values[index], self.quality[index], self.timestamp[index])
+
+    def __iter__(self) -> Iterator[Value]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self.values.dtype:
+            return self.values.copy() if copy else self.values
+        return self.values.astype(dtype)
+
+    def __repr__(self):
+        qualities = [str(Quality(int(q))) for q in np.unique(self.quality)]
+        return f"ValueArray({self.values}, quality={qualities})"
+
+    def __eq__(self, other):
+        return np.array_equal(self.values, _raw(other))
+
+    def __lt__(self, other):
+        return self.values < _raw(other)
+
+    def __le__(self, other):
+        return self.values <= _raw(other)
+
+    def __gt__(self, other):
+        return self.values > _raw(other)
+
+    def __ge__(self, other):
+        return self.values >= _raw(other)
+
+    def __add__(self, other):
+        return self.values + _raw(other)
+
+    def __radd__(self, other):
+        return other + self.values
+
+    def __sub__(self, other):
+        return self.values - _raw(other)
+
+    def __rsub__(self, other):
+        return other - self.values
+
+    def __mul__(self, other):
+        return self.values * _raw(other)
+
+    def __rmul__(self, other):
+        return other * self.values
+
+    def __truediv__(self, other):
+        return self.values / _raw(other)
+
+    def __rtruediv__(self, other):
+        return other / self.values
+
+    def __neg__(self):
+        return -self.values
@@ -0,0 +1,148 @@
+"""
+Helpers used by set_and_wait() implementations to wait until readbacks
+of control system devices reach their setpoints.
+"""
+
+import time
+from typing import Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from ..common.exception import PyAMLException
+from .deviceaccess import DeviceAccess
+from .deviceaccesslist import DeviceAccessList
+from .devicecache import CachedDeviceAccess, CachedDeviceAccessList
+from .readback_value import Value
+
+DEFAULT_TIMEOUT = 10.0
+"""Default maximum waiting time in seconds"""
+INITIAL_POLL_PERIOD = 0.005
+"""First polling period in seconds"""
+MAX_POLL_PERIOD = 0.5
+"""Maximum polling period in seconds"""
+BACKOFF_FACTOR = 2.0
+"""Polling period growth factor"""
+
+
+def as_float_array(values: Any) -> npt.NDArray[np.float64]:
+    """
+    Converts readback(s) returned by a DeviceAccess or a DeviceAccessList
+    (float, Value, list of Value or array) to a 1D float array.
+    """
+    if isinstance(values, Value):
+        values = values.value
+    if isinstance(values, (list, tuple)) or (isinstance(values, np.ndarray) and values.dtype == object):
+        values = [v.value if isinstance(v, Value) else v for v in values]
+    return np.asarray(values, dtype=float).ravel()
+
+
+def wait_for_setpoints(
+    readback: Callable[[], Any],
+    setpoints: Any,
+    tolerances: npt.NDArray[np.float64],
+    timeout: float,
+    names: list[str],
+):
+    """
+    Polls readback() until all channels are within tolerance of their
+    setpoints. The polling period starts at INITIAL_POLL_PERIOD and grows
+    exponentially up to MAX_POLL_PERIOD. Channels without configured
+    tolerance are not waited for, readback() is not called when no channel
+    has a tolerance.
+
+    Parameters
+    ----------
+    readback : Callable
+        Function returning the readbacks of all channels in one call
+    setpoints : Any
+        Setpoints (one per channel or a single one for all channels)
+    tolerances : NDArray
+        Absolute tolerance per channel, NaN for channels without configured
+        tolerance
+    timeout : float
+        Maximum waiting time in seconds
+    names : list[str]
+        Channel names, used for error reporting
+
+    Raises
+    ------
+    PyAMLException
+        If setpoints are not reached before the timeout
+    """
+    sp = np.broadcast_to(as_float_array(setpoints), (len(names),))
+    tol = np.asarray(tolerances, dtype=float)
+    polled = ~np.isnan(tol)
+    if not np.any(polled):
+        return
+    deadline = time.monotonic() + timeout
+    period = INITIAL_POLL_PERIOD
+    while True:
+        rb = as_float_array(readback())
+        if rb.size != sp.size:
+            raise PyAMLException(f"Readback returned {rb.size} values for {sp.size} setpoints")
+        reached = ~polled | (np.abs(rb - sp) <= tol)
+        if np.all(reached):
+            return
+        now = time.monotonic()
+        if now >= deadline:
+            lines = [f"Setpoints not reached after {timeout:g}s:"]
+            for idx in np.flatnonzero(~reached):
+                lines.append(f"'{names[idx]}' setpoint={sp[idx]:g} readback={rb[idx]:g} tolerance={tol[idx]:g}")
+            raise PyAMLException("\n".join(lines))
+        time.sleep(min(period, deadline - now))
+        period = min(period * BACKOFF_FACTOR, MAX_POLL_PERIOD)
+
+
+def _tolerances(devs: list[DeviceAccess]) -> npt.NDArray[np.float64]:
+    tols = [d.get_tolerance() for d in devs]
+    return np.array([np.nan if t is None else t for t in tols], dtype=float)
+
+
+def _timeout(devs: list[DeviceAccess]) -> float:
+    timeouts = [d.get_timeout() for d in devs]
+    timeouts = [t for t in timeouts if t is not None]
+    return max(timeouts) if timeouts else DEFAULT_TIMEOUT
+
+
+def _uncached(dev: DeviceAccess) -> DeviceAccess:
+    # Readbacks must not be served from the device cache while polling
+    return dev.device() if isinstance(dev, CachedDeviceAccess) else dev
+
+
+def wait_for_devices(devs: list[DeviceAccess], setpoints: Any):
+    """
+    Waits until the readbacks of the given devices reach their setpoints.
+    Devices are polled one after the other within the same polling loop.
+
+    Parameters
+    ----------
+    devs : list[DeviceAccess]
+        Devices to wait for
+    setpoints : Any
+        Setpoints (one per device or a single one for all devices)
+    """
+    devs = [_uncached(d) for d in devs]
+
+    def readback():
+        return np.concatenate([as_float_array(d.readback()) for d in devs])
+
+    wait_for_setpoints(readback, setpoints, _tolerances(devs), _timeout(devs), [d.name() for d in devs])
+
+
+def wait_for_device_list(devs: DeviceAccessList, setpoints: Any):
+    """
+    Waits until the readbacks of the given device list reach their setpoints.
+    Readbacks of the whole list are fetched in a single call per polling step.
+
+    Parameters
+    ----------
+    devs : DeviceAccessList
+        Device list to wait for
+    setpoints : Any
+        Setpoints (one per device or a single one for all devices)
+    """
+    if isinstance(devs, CachedDeviceAccessList):
+        devs = devs.device_list()
+    items = [devs.get_device_at(i) for i in range(devs.len())]
+    wait_for_setpoints(devs.readback, setpoints, _tolerances(items), _timeout(items), [d.name() for d in items])
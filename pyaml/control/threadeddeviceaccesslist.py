@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from ..common.exception import PyAMLException
+from .deviceaccess import DeviceAccess
+from .deviceaccesslist import DeviceAccessList
+from .readback_value import ValueArray
+
+DEFAULT_MAX_WORKERS = 16
+
+_executors: dict[int, ThreadPoolExecutor] = {}  # Shared pools by number of workers
+_executors_lock = threading.Lock()
+
+
+def _get_shared_executor(max_workers: int) -> Executor:
+    """Returns the module level thread pool of max_workers threads"""
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyaml-devices")
+        return _executors[max_workers]
+
+
+class ThreadedDeviceAccessList(DeviceAccessList):
+    """
+    Generic DeviceAccessList working with arbitrary DeviceAccess objects.
+    Accesses to the underlying devices are performed concurrently through a
+    bounded thread pool. It is used as default aggregator by control systems
+    that do not provide their own DeviceAccessList.
+
+    Parameters
+    ----------
+    max_workers : int
+        Maximum number of concurrent device accesses. Ignored when an
+        executor is given.
+    executor : Executor, optional
+        Executor used to perform the accesses, it allows several lists to
+        share the same pool (i.e. one pool per control system). If not given,
+        a module level pool of max_workers threads, shared by all the lists
+        created with the same max_workers, is used.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, executor: Executor | None = None):
+        self._items: list[DeviceAccess] = []
+        if executor is None:
+            if max_workers < 1:
+                raise PyAMLException(f"ThreadedDeviceAccessList: max_workers must be strictly positive, got {max_workers}")
+            executor = _get_shared_executor(max_workers)
+        self.__executor = executor
+
+    def _map(self, fn: Callable, *args, items: list[DeviceAccess] | None = None) -> list:
+        """
+        Applies fn to each device (and optional arguments) concurrently, the first raised exception is propagated.
+        All devices are used if items is not given.
+        """
+        items = self._items if items is None else items
+        if len(items) < 2:
+            return list(map(fn, items, *args))
+        return list(self.__executor.map(fn, items, *args))
+
+    def _check_length(self, value: npt.NDArray[np.float64]):
+        if len(value) != len(self._items):
+            raise PyAMLException(f"ThreadedDeviceAccessList: {len(value)} values given for {len(self._items)} devices")
+
+    def add_devices(self, devices: DeviceAccess | list[DeviceAccess]):
+        if isinstance(devices, list):
+            self._items.extend(devices)
+        else:
+            self._items.append(devices)
+
+    def get_device_at(self, index: int) -> DeviceAccess:
+        return self._items[index]
+
+    def len(self) -> int:
+        return len(self._items)
+
+    def set(self, value: npt.NDArray[np.float64]):
+        self._check_length(value)
+        self._map(lambda d, v: d.set(v), value)
+
+    def set_and_wait(self, value: npt.NDArray[np.float64]):
+        self._check_length(value)
+        self._map(lambda d, v: d.set_and_wait(v), value)
+
+    def supports_sparse_write(self) -> bool:
+        return True
+
+    def set_sparse(self, indices: npt.NDArray[np.intp], value: npt.NDArray[np.float64]):
+        if len(indices) != len(value):
+            raise PyAMLException(f"ThreadedDeviceAccessList: {len(value)} values given for {len(indices)} indices")
+        self._map(lambda d, v: d.set(v), value, items=[self._items[i] for i in indices])
+
+    def get(self) -> npt.NDArray[np.float64]:
+        return np.array(self._map(lambda d: d.get()))
+
+    def readback(self) -> ValueArray:
+        return ValueArray.from_values(self._map(lambda d: d.readback()))
+
+    def unit(self) -> list[str]:
+        return [d.unit() for d in self._items]
+
+    def get_range(self) -> list[float]:
+        dev_range: list[float] = []
+        for r in self._map(lambda d: d.get_range()):
+            dev_range.extend(r if r is not None else [None, None])
+        return dev_range
+
+    def check_device_availability(self) -> bool:
+        return all(self._map(lambda d: d.check_device_availability()))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({[d.name() for d in self._items]})"
@@ -55,6 +55,7 @@ class BetatronTuneMonitor(Element, ABetatronTuneMonitor):
         super().__init__(cfg.name)
         self._cfg = cfg
         self.__tune = None
+        self.__frequency_reader = None
         self._h = None
 
     def set_harmonic(self, h: int):
@@ -92,10 +93,9 @@ class BetatronTuneMonitor(Element, ABetatronTuneMonitor):
                 h = self.parent._h
                 rf_name = self.parent._cfg.rf_plant_name
                 if h is not None and rf_name is not None:
-                    tune = self.parent.tune.get()
-                    rf = self.parent.peer.get_rf_plant(rf_name)
-                    freq = rf.frequency.get()
-                    return tune * freq / h
+                    # Tune and RF frequency are acquired together
+                    reading = self.parent._get_frequency_reader().get()
+                    return reading["tune"] * reading["rf"] / h
 
             def unit(self) -> str:
                 return "Hz"
@@ -103,6 +103,12 @@ class BetatronTuneMonitor(Element, ABetatronTuneMonitor):
         self.check_peer()
         return TuneFreq(self)
 
+    def _get_frequency_reader(self):
+        if self.__frequency_reader is None:
+            rf = self.peer.get_rf_plant(self._cfg.rf_plant_name)
+            self.__frequency_reader = self.peer.create_multi_reader({"tune": self, "rf": rf})
+        return self.__frequency_reader
+
     def attach(self, peer, betatron_tune: ReadFloatArray) -> Self:
         """
         Attach the tune monitor to a peer with betatron tune data.
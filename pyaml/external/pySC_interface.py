@@ -1,4 +1,3 @@
-import time
 from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
@@ -9,8 +8,6 @@ from ..common.exception import PyAMLException
 
 
 class pySCInterface:
-    set_wait_time: float = 0
-
     def __init__(
         self,
         element_holder: "ElementHolder",
@@ -38,8 +35,7 @@ class pySCInterface:
 
     def set(self, name: str, value: float) -> None:
         magnet = self.element_holder.get_magnet(name=name)
-        magnet.strength.set(value=value)  # ideally set_and_wait but not implemented
-        time.sleep(self.set_wait_time)
+        magnet.strength.set_and_wait(value)
         return
 
     def get_rf_main_frequency(self) -> float:
@@ -50,6 +46,5 @@ class pySCInterface:
     def set_rf_main_frequency(self, value: float) -> None:
         if self.rf_plant is None:
             raise PyAMLException("RF plant name was not provided.")
-        self.rf_plant.frequency.set(value)
-        time.sleep(self.set_wait_time)
+        self.rf_plant.frequency.set_and_wait(value)
         return
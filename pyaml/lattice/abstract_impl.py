@@ -1,3 +1,5 @@
+import threading
+
 import at
 import numpy as np
 from numpy.typing import NDArray
@@ -11,8 +13,141 @@ from ..rf.rf_plant import RFPlant
 from ..rf.rf_transmitter import RFTransmitter
 from .polynom_info import PolynomInfo
 
+# pyAT tracking engine is not reentrant, tracking calls coming from several
+# threads (i.e. asynchronous reads offloaded to worker threads) are serialized
+_TRACKING_LOCK = threading.RLock()
+
+# Element attributes checked to detect direct lattice edits
+_FINGERPRINT_ATTRIBUTES = ("PolynomA", "PolynomB", "KickAngle", "T1", "T2", "R1", "R2", "Frequency", "Voltage", "TimeLag")
+
+
+def _find_orbit(lattice: at.Lattice, refpts) -> np.array:
+    with _TRACKING_LOCK:
+        _, orbit = at.find_orbit(lattice, refpts=refpts)
+    return orbit
+
+
+class LatticeState:
+    """
+    Generation counter of a simulator lattice and closed orbit cache.
+
+    Every simulator setter bumps the generation. The closed orbit is computed
+    once per generation at all the registered reference points (typically all
+    BPMs), so that all orbit reads between two lattice changes share a single
+    tracking.
+
+    Direct edits of the lattice must be signaled with invalidate(). Edits of
+    multipoles, kicks, misalignments and RF parameters can also be detected
+    on request with check_edits(), which compares a fingerprint of all
+    elements with the one taken at the last orbit computation.
+
+    Parameters
+    ----------
+    lattice : at.Lattice
+        Simulated lattice
+    """
+
+    def __init__(self, lattice: at.Lattice):
+        self.__lattice = lattice
+        self.__generation = 0
+        self.__lock = threading.Lock()
+        self.__refpts = np.zeros(0, dtype=np.intp)  # Sorted registered reference points
+        self.__orbit: NDArray[np.float64] | None = None
+        self.__orbit_generation = -1
+        self.__orbit_fingerprint: bytes | None = None
+        self.__nb_computation = 0
+        self.__tracked: list[tuple[at.Element, str]] | None = None
+        self.__tracked_length = 0
+
+    def modified(self):
+        """Signals a lattice change, invalidates cached results"""
+        with self.__lock:
+            self.__generation += 1
+
+    def invalidate(self):
+        """Signals a direct lattice edit, which may have replaced elements"""
+        with self.__lock:
+            self.__generation += 1
+            self.__tracked = None
+
+    def generation(self) -> int:
+        """Returns the number of lattice changes"""
+        return self.__generation
+
+    def nb_orbit_computation(self) -> int:
+        """Returns the number of closed orbit computations"""
+        return self.__nb_computation
+
+    def __fingerprint(self) -> bytes:
+        """Returns the values of the tracked attributes of all elements"""
+        if self.__tracked is None or self.__tracked_length != len(self.__lattice):
+            self.__tracked_length = len(self.__lattice)
+            self.__tracked = [(e, a) for e in self.__lattice for a in _FINGERPRINT_ATTRIBUTES if hasattr(e, a)]
+        values = (getattr(e, a) for e, a in self.__tracked)
+        return b"".join(v.tobytes() if isinstance(v, np.ndarray) else repr(v).encode() for v in values)
+
+    def check_edits(self) -> bool:
+        """
+        Detects direct edits of multipoles, kicks, misalignments or RF
+        parameters made since the last orbit computation and invalidates
+        cached results if any. All elements are scanned.
+
+        Returns
+        -------
+        bool
+            True if the lattice was edited
+        """
+        with _TRACKING_LOCK:
+            if self.__orbit_fingerprint is None or self.__fingerprint() == self.__orbit_fingerprint:
+                return False
+            self.__orbit_fingerprint = None
+            self.modified()
+            return True
+
+    def register(self, refpts: NDArray[np.intp] | list[int]):
+        """Adds reference points at which the closed orbit is computed"""
+        refpts = np.asarray(refpts, dtype=np.intp)
+        with _TRACKING_LOCK:
+            if not np.all(np.isin(refpts, self.__refpts)):
+                self.__refpts = np.union1d(self.__refpts, refpts)
+                self.__orbit = None
+
+    def orbit(self, refpts: NDArray[np.intp] | list[int]) -> NDArray[np.float64]:
+        """
+        Returns the closed orbit at the given reference points.
+
+        Parameters
+        ----------
+        refpts : array of int
+            Lattice indices, registered on the fly if needed
+
+        Returns
+        -------
+        np.ndarray
+            Closed orbit of shape (len(refpts), 6)
+        """
+        refpts = np.asarray(refpts, dtype=np.intp)
+        with _TRACKING_LOCK:
+            self.register(refpts)
+            generation = self.__generation
+            if self.__orbit is None or self.__orbit_generation != generation:
+                self.__orbit_fingerprint = self.__fingerprint()
+                self.__orbit = _find_orbit(self.__lattice, self.__refpts)
+                self.__orbit_generation = generation
+                self.__nb_computation += 1
+            return self.__orbit[np.searchsorted(self.__refpts, refpts)]
+
+
+def _modified(state: LatticeState | None):
+    if state is not None:
+        state.modified()
+
+
 # TODO handle serialized magnets for magnet array
 
+# Note: setpoints are applied immediately in the simulator, set_and_wait()
+# methods are equivalent to set()
+
 # ------------------------------------------------------------------------------
 
 
@@ -22,9 +157,10 @@ class RWHardwareScalar(abstract.ReadWriteFloatScalar):
     Hardware unit is converted from strength using the magnet model
     """
 
-    def __init__(self, elements: list[at.Element], poly: PolynomInfo, model: MagnetModel):
+    def __init__(self, elements: list[at.Element], poly: PolynomInfo, model: MagnetModel, state: LatticeState | None = None):
         self.__model = model
         self.__elements = elements
+        self.__state = state
         self.__poly = [e.__getattribute__(poly.attName) for e in elements]
         self.__sign = poly.sign
         self.__polyIdx = poly.index
@@ -45,9 +181,10 @@ class RWHardwareScalar(abstract.ReadWriteFloatScalar):
         s = self.__model.compute_strengths([value])[0]
         for idx, _ in enumerate(self.__elements):
             self.__poly[idx][self.__polyIdx] = s / (self.__length * self.__sign)
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return self.__model.get_hardware_units()[0]
@@ -64,9 +201,10 @@ class RWStrengthScalar(abstract.ReadWriteFloatScalar):
     Class providing read write access to a strength of a simulator
     """
 
-    def __init__(self, elements: list[at.Element], poly: PolynomInfo, model: MagnetModel):
+    def __init__(self, elements: list[at.Element], poly: PolynomInfo, model: MagnetModel, state: LatticeState | None = None):
         self.__model = model
         self.__elements = elements
+        self.__state = state
         self.__poly = [e.__getattribute__(poly.attName) for e in elements]
         self.__sign = poly.sign
         self.__polyIdx = poly.index
@@ -88,10 +226,11 @@ class RWStrengthScalar(abstract.ReadWriteFloatScalar):
     def set(self, value: float):
         for idx, _ in enumerate(self.__elements):
             self.__poly[idx][self.__polyIdx] = value / (self.__length * self.__sign)
+        _modified(self.__state)
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -101,6 +240,21 @@ class RWStrengthScalar(abstract.ReadWriteFloatScalar):
     def get_model(self) -> MagnetModel:
         return self.__model
 
+    def get_elements(self) -> list[at.Element]:
+        """Returns the pyAT elements holding the strength"""
+        return self.__elements
+
+    def get_polynom_refs(self) -> list[tuple[NDArray[np.float64], int, float, float]]:
+        """
+        Returns, for each element, the polynom array, the coefficient index, the
+        weight of the coefficient in the strength and the divisor applied to
+        the strength when writing the coefficient
+        """
+        return [
+            (self.__poly[idx], self.__polyIdx, self.__sign * e.Length, self.__length * self.__sign)
+            for idx, e in enumerate(self.__elements)
+        ]
+
 
 # ------------------------------------------------------------------------------
 
@@ -129,7 +283,7 @@ class RWSerializedHardware(abstract.ReadWriteFloatScalar):
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -182,7 +336,7 @@ class RWSerializedStrength(abstract.ReadWriteFloatScalar):
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -198,8 +352,11 @@ class RWHardwareArray(abstract.ReadWriteFloatArray):
     Hardware units are converted from strengths using the magnet model
     """
 
-    def __init__(self, elements: list[at.Element], poly: list[PolynomInfo], model: MagnetModel):
+    def __init__(
+        self, elements: list[at.Element], poly: list[PolynomInfo], model: MagnetModel, state: LatticeState | None = None
+    ):
         self.__elements = elements
+        self.__state = state
         self.__poly = []
         self.__polyIdx = []
         self.__sign = []
@@ -223,10 +380,11 @@ class RWHardwareArray(abstract.ReadWriteFloatArray):
         s = self.__model.compute_strengths(value)
         for i in range(nbStrength):
             self.__poly[i][self.__polyIdx[i]] = s[i] / (self.__elements[0].Length * self.__sign[i])
+        _modified(self.__state)
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> list[str]:
@@ -241,8 +399,11 @@ class RWStrengthArray(abstract.ReadWriteFloatArray):
     Class providing read write access to a strength (array) of a simulator
     """
 
-    def __init__(self, elements: list[at.Element], poly: list[PolynomInfo], model: MagnetModel):
+    def __init__(
+        self, elements: list[at.Element], poly: list[PolynomInfo], model: MagnetModel, state: LatticeState | None = None
+    ):
         self.__elements = elements
+        self.__state = state
         self.__poly = []
         self.__polyIdx = []
         self.__sign = []
@@ -266,15 +427,198 @@ class RWStrengthArray(abstract.ReadWriteFloatArray):
         s = np.zeros(nbStrength)
         for i in range(nbStrength):
             self.__poly[i][self.__polyIdx[i]] = value[i] / (self.__elements[0].Length * self.__sign[i])
+        _modified(self.__state)
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> list[str]:
         return self.__model.get_strength_units()
 
+    def get_elements(self) -> list[at.Element]:
+        """Returns the pyAT elements holding the strengths"""
+        return self.__elements[:1]
+
+    def get_polynom_refs(self, index: int) -> list[tuple[NDArray[np.float64], int, float, float]]:
+        """
+        Returns the polynom array, the coefficient index, the weight of the
+        coefficient in the strength and the write divisor of the given strength
+        """
+        length = self.__elements[0].Length * self.__sign[index]
+        return [(self.__poly[index], self.__polyIdx[index], length, length)]
+
+
+# ------------------------------------------------------------------------------
+
+
+class StrengthScalarAggregator(ScalarAggregator):
+    """
+    Simulator aggregator for a list of magnet strengths. Polynom coefficients
+    of all magnets are gathered in flat tables built when magnets are added,
+    strengths are computed from or dispatched to the coefficients with a few
+    NumPy operations instead of one accessor call per magnet.
+
+    Supported magnets are single function magnets (RWStrengthScalar) and
+    magnets exported from combined function magnets (RWMapper of a
+    RWStrengthArray), see :py:meth:`supports`.
+
+    Parameters
+    ----------
+    state : LatticeState, optional
+        Lattice state, modified on each write
+    """
+
+    def __init__(self, state: LatticeState | None = None):
+        self.__state = state
+        self.__polys: list[NDArray[np.float64]] = []
+        self.__polyIdx: list[int] = []
+        self.__owner: list[int] = []  # Magnet index of each coefficient
+        self.__weight: list[float] = []
+        self.__divisor: list[float] = []
+        self.__units: list[str] = []
+        self.__tables = None  # NumPy tables, compiled on first access
+        self.__nbMagnet = 0
+
+    @staticmethod
+    def supports(strength: abstract.ReadWriteFloatScalar) -> bool:
+        """Returns True if the given strength accessor can be aggregated"""
+        if isinstance(strength, abstract.RWMapper):
+            return isinstance(strength.bind, RWStrengthArray)
+        return isinstance(strength, RWStrengthScalar)
+
+    def add_magnet(self, magnet):
+        """Adds a magnet, its strength accessor must be supported"""
+        strength = magnet.strength
+        if isinstance(strength, abstract.RWMapper) and isinstance(strength.bind, RWStrengthArray):
+            refs = strength.bind.get_polynom_refs(strength.index())
+        elif isinstance(strength, RWStrengthScalar):
+            refs = strength.get_polynom_refs()
+        else:
+            raise PyAMLException(f"{magnet}: strength accessor not supported by simulator aggregator")
+        for poly, polyIdx, weight, divisor in refs:
+            self.__polys.append(poly)
+            self.__polyIdx.append(polyIdx)
+            self.__owner.append(self.__nbMagnet)
+            self.__weight.append(weight)
+            self.__divisor.append(divisor)
+        self.__units.append(strength.unit())
+        self.__nbMagnet += 1
+        self.__tables = None
+
+    def nb_magnet(self) -> int:
+        return self.__nbMagnet
+
+    def __compile(self):
+        self.__tables = (
+            np.array(self.__owner, dtype=np.intp),
+            np.array(self.__weight, dtype=float),
+            np.array(self.__divisor, dtype=float),
+        )
+
+    def get(self) -> NDArray[np.float64]:
+        if self.__tables is None:
+            self.__compile()
+        owner, weight, _ = self.__tables
+        nb = len(self.__polys)
+        coefs = np.fromiter((p[i] for p, i in zip(self.__polys, self.__polyIdx, strict=True)), dtype=float, count=nb)
+        return np.bincount(owner, weights=coefs * weight, minlength=self.__nbMagnet)
+
+    def set(self, value: NDArray[np.float64]):
+        if self.__tables is None:
+            self.__compile()
+        owner, _, divisor = self.__tables
+        value = np.broadcast_to(np.asarray(value, dtype=float), (self.__nbMagnet,))
+        coefs = value[owner] / divisor
+        for p, i, c in zip(self.__polys, self.__polyIdx, coefs.tolist(), strict=True):
+            p[i] = c
+        _modified(self.__state)
+
+    def set_and_wait(self, value: NDArray[np.float64]):
+        self.set(value)
+
+    def readback(self) -> NDArray[np.float64]:
+        return self.get()
+
+    def unit(self) -> list[str]:
+        return list(self.__units)
+
+
+# ------------------------------------------------------------------------------
+
+
+class HardwareScalarAggregator(StrengthScalarAggregator):
+    """
+    Simulator aggregator for a list of magnet hardware values. Strengths are
+    accessed through :py:class:`StrengthScalarAggregator` and converted with
+    the magnet models, models sharing the same batch key are converted
+    together. Only single function magnets are supported.
+
+    Parameters
+    ----------
+    state : LatticeState, optional
+        Lattice state, modified on each write
+    """
+
+    def __init__(self, state: LatticeState | None = None):
+        super().__init__(state)
+        self.__models: list[MagnetModel] = []
+        self.__units: list[str] = []
+        self.__batches = None  # Vectorized conversions, compiled on first access
+
+    @staticmethod
+    def supports(strength: abstract.ReadWriteFloatScalar) -> bool:
+        return isinstance(strength, RWStrengthScalar)
+
+    def add_magnet(self, magnet):
+        if not self.supports(magnet.strength):
+            raise PyAMLException(f"{magnet}: hardware accessor not supported by simulator aggregator")
+        super().add_magnet(magnet)
+        self.__models.append(magnet.model)
+        self.__units.append(magnet.model.get_hardware_units()[0])
+        self.__batches = None
+
+    def __compile(self):
+        groups: dict = {}
+        others = []
+        for idx, model in enumerate(self.__models):
+            key = model.get_batch_key()
+            if key is None:
+                others.append((idx, model))
+            else:
+                groups.setdefault(key, []).append(idx)
+        self.__batches = [
+            (type(self.__models[idx[0]]).create_batch([self.__models[i] for i in idx]), np.array(idx, dtype=np.intp))
+            for idx in groups.values()
+        ]
+        self.__others = others
+
+    def get(self) -> NDArray[np.float64]:
+        if self.__batches is None:
+            self.__compile()
+        strengths = super().get()
+        values = np.empty(len(self.__models))
+        for batch, idx in self.__batches:
+            values[idx] = batch.compute_hardware_values(strengths[idx])
+        for idx, model in self.__others:
+            values[idx] = model.compute_hardware_values(strengths[idx : idx + 1])[0]
+        return values
+
+    def set(self, value: NDArray[np.float64]):
+        if self.__batches is None:
+            self.__compile()
+        value = np.broadcast_to(np.asarray(value, dtype=float), (len(self.__models),))
+        strengths = np.empty(len(self.__models))
+        for batch, idx in self.__batches:
+            strengths[idx] = batch.compute_strengths(value[idx])
+        for idx, model in self.__others:
+            strengths[idx] = model.compute_strengths(value[idx : idx + 1])[0]
+        super().set(strengths)
+
+    def unit(self) -> list[str]:
+        return list(self.__units)
+
 
 # ------------------------------------------------------------------------------
 
@@ -284,12 +628,15 @@ class BPMScalarAggregator(ScalarAggregator):
     BPM simulator aggregator
     """
 
-    def __init__(self, ring: at.Lattice):
+    def __init__(self, ring: at.Lattice, state: LatticeState):
         self.lattice = ring
         self.refpts = []
+        self.state = state
 
-    def add_elem(self, elem: at.Element):
-        self.refpts.append(self.lattice.index(elem))
+    def add_elem(self, elem: at.Element, refpt: int | None = None):
+        """Adds a BPM, refpt is the index of the element in the lattice (searched if not given)"""
+        self.refpts.append(self.lattice.index(elem) if refpt is None else refpt)
+        self.state.register(self.refpts[-1:])
 
     def set(self, value: NDArray[np.float64]):
         pass
@@ -298,7 +645,7 @@ class BPMScalarAggregator(ScalarAggregator):
         pass
 
     def get(self) -> np.array:
-        _, orbit = at.find_orbit(self.lattice, refpts=self.refpts)
+        orbit = self.state.orbit(self.refpts)
         return orbit[:, [0, 2]].flatten()
 
     def readback(self) -> np.array:
@@ -317,7 +664,7 @@ class BPMHScalarAggregator(BPMScalarAggregator):
     """
 
     def get(self) -> np.array:
-        _, orbit = at.find_orbit(self.lattice, refpts=self.refpts)
+        orbit = self.state.orbit(self.refpts)
         return orbit[:, 0]
 
 
@@ -330,7 +677,7 @@ class BPMVScalarAggregator(BPMScalarAggregator):
     """
 
     def get(self) -> np.array:
-        _, orbit = at.find_orbit(self.lattice, refpts=self.refpts)
+        orbit = self.state.orbit(self.refpts)
         return orbit[:, 2]
 
 
@@ -340,19 +687,19 @@ class BPMVScalarAggregator(BPMScalarAggregator):
 class RBpmArray(abstract.ReadFloatArray):
     """
     Class providing read access to a BPM position (array) of a simulator.
-    Position in pyAT is calculated using find_orbit function, which returns the
-    orbit at a specified index. The position is then extracted from the orbit
-    array as the first two elements (x, y).
+    Position is taken from the closed orbit shared by all BPMs of the
+    simulator (see LatticeState), at the lattice index of the BPM.
+    The position is then extracted from the orbit array as the first two
+    elements (x, y).
     """
 
-    def __init__(self, element: at.Element, lattice: at.Lattice):
-        self.__element = element
-        self.__lattice = lattice
+    def __init__(self, refpt: int, state: LatticeState):
+        self.__refpt = refpt
+        self.__state = state
 
     # Gets the value
     def get(self) -> np.array:
-        index = self.__lattice.index(self.__element)
-        _, orbit = at.find_orbit(self.__lattice, refpts=index)
+        orbit = self.__state.orbit([self.__refpt])
         return orbit[0, [0, 2]]
 
     # Gets the unit of the value
@@ -392,7 +739,7 @@ class RWBpmOffsetArray(abstract.ReadWriteFloatArray):
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: np.array):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -408,8 +755,9 @@ class RWBpmTiltScalar(abstract.ReadWriteFloatScalar):
     pyAT is defined in Rotation attribute as a first element.
     """
 
-    def __init__(self, element: at.Element):
+    def __init__(self, element: at.Element, state: LatticeState | None = None):
         self.__element = element
+        self.__state = state
         try:
             self.__tilt = element.__getattribute__("Rotation")[0]
         except AttributeError:
@@ -428,10 +776,11 @@ class RWBpmTiltScalar(abstract.ReadWriteFloatScalar):
     ):
         self.__tilt = value
         self.__element.__setattr__("Rotation", [value, None, None])
+        _modified(self.__state)
 
     # Sets the value and wait that the read value reach the setpoint
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     # Gets the unit of the value
     def unit(self) -> str:
@@ -447,8 +796,9 @@ class RWRFVoltageScalar(abstract.ReadWriteFloatScalar):
     of a simulator for a given RF trasnmitter.
     """
 
-    def __init__(self, elements: list[at.Element]):
+    def __init__(self, elements: list[at.Element], state: LatticeState | None = None):
         self.__elements = elements
+        self.__state = state
 
     def get(self) -> float:
         sum = 0
@@ -460,9 +810,10 @@ class RWRFVoltageScalar(abstract.ReadWriteFloatScalar):
         v = value / len(self.__elements)
         for e in self.__elements:
             e.Voltage = v
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return "V"
@@ -477,8 +828,9 @@ class RWRFPhaseScalar(abstract.ReadWriteFloatScalar):
     a simulator for a given RF trasnmitter.
     """
 
-    def __init__(self, elements: list[at.Element]):
+    def __init__(self, elements: list[at.Element], state: LatticeState | None = None):
         self.__elements = elements
+        self.__state = state
 
     def get(self) -> float:
         # Assume that all cavities of this transmitter
@@ -490,9 +842,10 @@ class RWRFPhaseScalar(abstract.ReadWriteFloatScalar):
         wavelength = speed_of_light / self.__elements[0].Frequency
         for e in self.__elements:
             e.TimeLag = wavelength * value / (2.0 * np.pi)
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return "rad"
@@ -506,9 +859,10 @@ class RWRFFrequencyScalar(abstract.ReadWriteFloatScalar):
     Class providing read write access to RF frequency of a simulator.
     """
 
-    def __init__(self, elements: list[at.Element], harmonics: list[float]):
+    def __init__(self, elements: list[at.Element], harmonics: list[float], state: LatticeState | None = None):
         self.__elements = elements
         self.__harm = harmonics
+        self.__state = state
 
     def get(self) -> float:
         # Serialized cavity has the same frequency
@@ -517,9 +871,10 @@ class RWRFFrequencyScalar(abstract.ReadWriteFloatScalar):
     def set(self, value: float):
         for idx, e in enumerate(self.__elements):
             e.Frequency = value * self.__harm[idx]
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return "Hz"
@@ -534,17 +889,19 @@ class RWRFATFrequencyScalar(abstract.ReadWriteFloatScalar):
     AT methods.
     """
 
-    def __init__(self, ring: at.Lattice):
+    def __init__(self, ring: at.Lattice, state: LatticeState | None = None):
         self.__ring = ring
+        self.__state = state
 
     def get(self) -> float:
         return self.__ring.get_rf_frequency()
 
     def set(self, value: float):
         self.__ring.set_rf_frequency(value)
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return "Hz"
@@ -558,17 +915,19 @@ class RWRFATotalVoltageScalar(abstract.ReadWriteFloatScalar):
     Class providing read write access to a RF voltage of a simulator using AT methods.
     """
 
-    def __init__(self, ring: at.Lattice):
+    def __init__(self, ring: at.Lattice, state: LatticeState | None = None):
         self.__ring = ring
+        self.__state = state
 
     def get(self) -> float:
         return self.__ring.get_rf_voltage()
 
     def set(self, value: float):
         self.__ring.set_rf_voltage(value)
+        _modified(self.__state)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        self.set(value)
 
     def unit(self) -> str:
         return "V"
@@ -586,7 +945,8 @@ class RBetatronTuneArray(abstract.ReadFloatArray):
         self.__ring = ring
 
     def get(self) -> float:
-        return self.__ring.get_tune()[:2]
+        with _TRACKING_LOCK:
+            return self.__ring.get_tune()[:2]
 
     def unit(self) -> str:
         return "1"
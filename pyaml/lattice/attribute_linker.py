@@ -1,3 +1,5 @@
+from typing import Hashable
+
 import at
 from pydantic import ConfigDict
 
@@ -84,3 +86,11 @@ class PyAtAttributeElementsLinker(LatticeElementsLinker):
     def _test_at_element(self, identifier: PyAtAttributeIdentifier, element: at.Element) -> bool:
         attr_value = getattr(element, identifier.attribute_name, None)
         return attr_value == identifier.identifier
+
+    def _index_key(self, element: at.Element) -> Hashable | None:
+        return getattr(element, self.linker_config_model.attribute_name, None)
+
+    def _identifier_key(self, identifier: PyAtAttributeIdentifier) -> Hashable | None:
+        if identifier.attribute_name != self.linker_config_model.attribute_name:
+            return None
+        return identifier.identifier
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Iterable
+from typing import Hashable, Iterable
 
 import at
 from at import Lattice
@@ -48,6 +48,14 @@ class LatticeElementsLinker(metaclass=ABCMeta):
     to PyAT elements based on a given linking strategy (e.g., by family name,
     by index, or by a custom attribute).
 
+    Implementations able to compute a hashable key from both a PyAT element
+    and an identifier (see :py:meth:`_index_key` and :py:meth:`_identifier_key`)
+    get an index built on the first lookup after :py:meth:`set_lattice`, so that
+    each lookup costs O(1) instead of a scan of the whole lattice, including
+    lookups of identifiers matching no element. The index is only rebuilt after
+    :py:meth:`invalidate`, which has to be called when elements of the lattice
+    are added, replaced or re-tagged.
+
     Parameters
     ----------
     linker_config_model : LinkerConfigModel
@@ -62,6 +70,7 @@ class LatticeElementsLinker(metaclass=ABCMeta):
     def __init__(self, linker_config_model: LinkerConfigModel):
         self.linker_config_model = linker_config_model
         self.lattice: Lattice = None
+        self._index: dict[Hashable, list[at.Element]] | None = None
 
     def set_lattice(self, lattice: Lattice):
         """
@@ -73,6 +82,14 @@ class LatticeElementsLinker(metaclass=ABCMeta):
             The lattice to link elements with
         """
         self.lattice = lattice
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drops the element index, it is rebuilt on next lookup. To be called
+        when elements of the lattice are added, replaced or re-tagged.
+        """
+        self._index = None
 
     @abstractmethod
     def _test_at_element(self, identifier: LinkerIdentifier, element: at.Element) -> bool:
@@ -95,11 +112,52 @@ class LatticeElementsLinker(metaclass=ABCMeta):
         """
         pass
 
+    def _index_key(self, element: at.Element) -> Hashable | None:
+        """
+        Returns the index key of a PyAT element, None if the element cannot
+        match any identifier. Linkers not overriding this method and
+        :py:meth:`_identifier_key` scan the lattice on each lookup.
+        """
+        return None
+
+    def _identifier_key(self, identifier: LinkerIdentifier) -> Hashable | None:
+        """
+        Returns the index key matching an identifier, None if the identifier
+        cannot be resolved through the index.
+        """
+        return None
+
+    def _build_index(self) -> dict[Hashable, list[at.Element]]:
+        index: dict[Hashable, list[at.Element]] = {}
+        for elem in self.lattice:
+            key = self._index_key(elem)
+            if key is None:
+                continue
+            try:
+                index.setdefault(key, []).append(elem)
+            except TypeError:
+                # Unhashable attribute value, cannot match a hashable key
+                continue
+        return index
+
+    def _lookup(self, key: Hashable) -> list[at.Element]:
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index.get(key, [])
+
     def _iter_matches(self, identifier: LinkerIdentifier) -> Iterable[at.Element]:
         """Yield all elements in the lattice whose matches the identifier."""
-        for elem in self.lattice:
-            if self._test_at_element(identifier, elem):
-                yield elem
+        key = self._identifier_key(identifier)
+        try:
+            indexed = key is not None and hash(key) is not None
+        except TypeError:
+            indexed = False
+        if not indexed:
+            for elem in self.lattice:
+                if self._test_at_element(identifier, elem):
+                    yield elem
+            return
+        yield from self._lookup(key)
 
     def get_at_elements(self, element_id: LinkerIdentifier | list[LinkerIdentifier]) -> list[at.Element]:
         """Return a list of PyAT elements matching the given identifiers.
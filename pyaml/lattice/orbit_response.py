@@ -0,0 +1,103 @@
+"""
+Model based orbit response matrix computation.
+"""
+
+import at
+import numpy as np
+from numpy.typing import NDArray
+
+from ..common import abstract
+from ..common.exception import PyAMLException
+from .abstract_impl import _TRACKING_LOCK
+
+
+def _segment_kicks(
+    ring: at.Lattice,
+    strengths: list[abstract.ReadWriteFloatScalar],
+    segments: list[tuple[int, int]],
+    delta: float,
+) -> NDArray[np.float64]:
+    """
+    Returns the change of the 6D coordinates at the exit of each segment per
+    unit strength. Each segment [first, last[ is tracked from the closed orbit
+    with the strength moved by -delta/2 and +delta/2, then restored.
+    """
+    firsts = np.array([first for first, _ in segments], dtype=np.intp)
+    refpts = np.unique(firsts)
+    _, orbits = ring.find_orbit(refpts=refpts)
+    orbits = orbits[np.searchsorted(refpts, firsts)]
+    kicks = np.zeros((len(segments), 6))
+    for idx, (strength, (first, last)) in enumerate(zip(strengths, segments, strict=True)):
+        s0 = strength.get()
+        sub = ring[first:last]
+        out = []
+        try:
+            for s in (s0 - delta / 2, s0 + delta / 2):
+                strength.set(s)
+                r_out, *_ = at.lattice_track(sub, orbits[idx].reshape(6, 1), nturns=1, in_place=False)
+                out.append(r_out.reshape(6))
+        finally:
+            strength.set(s0)
+        kicks[idx] = (out[1] - out[0]) / delta
+    return kicks
+
+
+def compute_orbit_response(
+    ring: at.Lattice,
+    bpm_refpts: list[int],
+    strengths: list[abstract.ReadWriteFloatScalar],
+    segments: list[tuple[int, int]],
+    delta: float,
+) -> NDArray[np.float64]:
+    """
+    Computes the closed orbit response at BPMs to corrector strengths from the
+    linear transfer matrices of the lattice (one-turn matrix and transfer
+    matrices to BPMs and correctors), instead of a closed orbit search for
+    each corrector excitation.
+
+    The orbit jump produced by each corrector is obtained by tracking through
+    the corrector only, the closed orbit distortion is then propagated
+    analytically. 6D lattices are handled with 6x6 matrices (orbit computed
+    at constant RF frequency, as find_orbit6), 4D lattices with 4x4 matrices.
+
+    Parameters
+    ----------
+    ring : at.Lattice
+        Lattice
+    bpm_refpts : list[int]
+        Lattice index of BPMs
+    strengths : list[ReadWriteFloatScalar]
+        Strength accessor of each corrector
+    segments : list[tuple[int, int]]
+        First element index and index following the last element of each corrector
+    delta : float
+        Strength excursion used to compute the corrector kicks
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Matrix of shape (2 * nb_bpm, nb_corrector), horizontal responses of
+        all BPMs followed by vertical responses
+    """
+    if len(strengths) != len(segments):
+        raise PyAMLException("compute_orbit_response: strengths and segments must have the same length")
+    bpm_refpts = np.asarray(bpm_refpts, dtype=np.intp)
+    exits = np.array([last for _, last in segments], dtype=np.intp)
+    dim = 6 if ring.is_6d else 4
+    with _TRACKING_LOCK:
+        kicks = _segment_kicks(ring, strengths, segments, delta)[:, :dim]
+        refpts = np.unique(np.concatenate([bpm_refpts, exits]))
+        if ring.is_6d:
+            one_turn, matrices = ring.find_m66(refpts=refpts)
+        else:
+            one_turn, matrices = ring.find_m44(refpts=refpts)
+    m_exit = matrices[np.searchsorted(refpts, exits)]
+    m_bpm = matrices[np.searchsorted(refpts, bpm_refpts)]
+
+    # Closed orbit at the lattice start, propagated through one turn for BPMs
+    # located before the corrector
+    w = np.linalg.solve(np.eye(dim) - one_turn, np.linalg.solve(m_exit, kicks[:, :, None])[:, :, 0].T)
+    after = np.einsum("bij,jc->bic", m_bpm, w)
+    before = np.einsum("bij,jc->bic", m_bpm, one_turn @ w)
+    orbit = np.where((bpm_refpts[:, None] >= exits[None, :])[:, None, :], after, before)
+    return np.vstack([orbit[:, 0, :], orbit[:, 2, :]])
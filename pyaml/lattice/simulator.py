@@ -1,19 +1,24 @@
 from pathlib import Path
 
 import at
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 from ..bpm.bpm import BPM
+from ..common.abstract import RWMapper
 from ..common.abstract_aggregator import ScalarAggregator
 from ..common.element import Element
 from ..common.element_holder import ElementHolder
 from ..common.exception import PyAMLException
+from ..common.transaction import WriteTransaction
 from ..configuration import ROOT
 from ..diagnostics.tune_monitor import BetatronTuneMonitor
 from ..lattice.abstract_impl import (
     BPMHScalarAggregator,
     BPMScalarAggregator,
     BPMVScalarAggregator,
+    HardwareScalarAggregator,
+    LatticeState,
     RBetatronTuneArray,
     RBpmArray,
     RWBpmOffsetArray,
@@ -29,6 +34,7 @@ from ..lattice.abstract_impl import (
     RWSerializedStrength,
     RWStrengthArray,
     RWStrengthScalar,
+    StrengthScalarAggregator,
 )
 from ..magnet.cfm_magnet import CombinedFunctionMagnet
 from ..magnet.magnet import Magnet
@@ -44,6 +50,7 @@ from .attribute_linker import (
     PyAtAttributeElementsLinker,
 )
 from .lattice_elements_linker import LatticeElementsLinker
+from .orbit_response import compute_orbit_response
 
 # Define the main class name for this module
 PYAMLCLASS = "Simulator"
@@ -90,6 +97,8 @@ class Simulator(ElementHolder):
             self.ring = at.load_lattice(path)
         else:
             self.ring = at.load_lattice(path, mat_key=f"{self._cfg.mat_key}")
+        self.__state = LatticeState(self.ring)
+        self.__refpts: dict[int, int] | None = None
 
         self._linker = cfg.linker
         if self._linker:
@@ -106,8 +115,53 @@ class Simulator(ElementHolder):
         return self._cfg.name
 
     def get_lattice(self) -> at.Lattice:
+        """
+        Returns the pyAT lattice. Direct edits of the lattice must be followed
+        by invalidate() (or check_edits()) so that cached results (i.e. closed
+        orbit) are computed again.
+        """
         return self.ring
 
+    def invalidate(self):
+        """
+        Invalidates cached results (i.e. closed orbit, element index of the
+        linker) after a direct modification of the lattice
+        """
+        self.__state.invalidate()
+        if self._linker:
+            self._linker.invalidate()
+
+    def check_edits(self) -> bool:
+        """
+        Invalidates cached results if multipoles, kicks, misalignments or RF
+        parameters of the lattice were directly edited since the last orbit
+        computation. Other edits (i.e. element lengths) are not detected.
+
+        Returns
+        -------
+        bool
+            True if the lattice was edited
+        """
+        return self.__state.check_edits()
+
+    def get_lattice_state(self) -> LatticeState:
+        """
+        Returns the generation counter and closed orbit cache of the lattice
+        """
+        return self.__state
+
+    def get_refpt(self, elem: at.Element) -> int:
+        """
+        Returns the index of a pyAT element in the lattice. Indices of all
+        elements are computed once, on first call.
+        """
+        if self.__refpts is None:
+            self.__refpts = {id(e): idx for idx, e in enumerate(self.ring)}
+        refpt = self.__refpts.get(id(elem))
+        if refpt is None:
+            raise PyAMLException(f"{elem.FamName} not found in lattice:{self._cfg.lattice}")
+        return refpt
+
     def get_description(self) -> str:
         """
         Returns the description of the accelerator
@@ -115,37 +169,104 @@ class Simulator(ElementHolder):
         return self._cfg.description
 
     def create_magnet_strength_aggregator(self, magnets: list[Magnet]) -> ScalarAggregator:
+        """Strengths are read and written through flat polynom tables,
+        serialized magnets are accessed one by one"""
+        agg = StrengthScalarAggregator(self.__state)
+        for m in magnets:
+            if not m.model.has_physics() or not agg.supports(m.strength):
+                return None
+            agg.add_magnet(m)
+        return agg
+
+    def create_magnet_hardware_aggregator(self, magnets: list[Magnet]) -> ScalarAggregator:
+        """Hardware values of single function magnets are converted in batches,
+        magnets exported from combined function magnets are accessed one by one"""
+        agg = HardwareScalarAggregator(self.__state)
+        for m in magnets:
+            if not m.model.has_physics() or not agg.supports(m.strength):
+                return None
+            agg.add_magnet(m)
+        return agg
+
+    def create_cfm_strength_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator:
         # No magnet aggregator for simulator
         return None
 
-    def create_magnet_hardware_aggregator(self, magnets: list[Magnet]) -> ScalarAggregator:
+    def create_cfm_hardware_aggregator(self, magnets: list[CombinedFunctionMagnet]) -> ScalarAggregator:
+        # No magnet aggregator for simulator
+        return None
+
+    def create_serialized_strength_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator:
+        # No magnet aggregator for simulator
+        return None
+
+    def create_serialized_hardware_aggregator(self, magnets: list[SerializedMagnets]) -> ScalarAggregator:
         # No magnet aggregator for simulator
         return None
 
     def create_bpm_aggregators(self, bpms: list[BPM]) -> list[ScalarAggregator]:
-        agg = BPMScalarAggregator(self.get_lattice())
-        aggh = BPMHScalarAggregator(self.get_lattice())
-        aggv = BPMVScalarAggregator(self.get_lattice())
+        agg = BPMScalarAggregator(self.ring, self.__state)
+        aggh = BPMHScalarAggregator(self.ring, self.__state)
+        aggv = BPMVScalarAggregator(self.ring, self.__state)
         for b in bpms:
             e = self.get_at_elems(b)[0]
-            agg.add_elem(e)
-            aggh.add_elem(e)
-            aggv.add_elem(e)
+            refpt = self.get_refpt(e)
+            agg.add_elem(e, refpt)
+            aggh.add_elem(e, refpt)
+            aggv.add_elem(e, refpt)
         return [agg, aggh, aggv]
 
+    def transaction(self, wait: bool = False) -> WriteTransaction:
+        # pyAT accesses are in-process, nothing to overlap
+        return WriteTransaction(wait, concurrent=False)
+
+    def compute_orbit_response(self, bpms: list[BPM], magnets: list[Magnet], delta: float) -> np.ndarray:
+        """Orbit response computed from the lattice transfer matrices, see
+        :py:func:`~pyaml.lattice.orbit_response.compute_orbit_response`"""
+        bpm_refpts = [self.get_refpt(self.get_at_elems(b)[0]) for b in bpms]
+        strengths = []
+        segments = []
+        for m in magnets:
+            strength = m.strength
+            if not StrengthScalarAggregator.supports(strength):
+                raise PyAMLException(f"{m.get_name()}: model orbit response not supported for this magnet")
+            elems = strength.bind.get_elements() if isinstance(strength, RWMapper) else strength.get_elements()
+            refpts = [self.get_refpt(e) for e in elems]
+            strengths.append(strength)
+            segments.append((min(refpts), max(refpts) + 1))
+        return compute_orbit_response(self.ring, bpm_refpts, strengths, segments, delta)
+
+    def create_bpm_offset_aggregator(self, bpms: list[BPM]) -> ScalarAggregator:
+        # Offsets and tilts are element attributes, no aggregator for simulator
+        return None
+
+    def create_bpm_tilt_aggregator(self, bpms: list[BPM]) -> ScalarAggregator:
+        return None
+
+    def create_bpm_snapshot_aggregator(self, bpms: list[BPM]) -> ScalarAggregator:
+        return None
+
     def fill_device(self, elements: list[Element]):
         for e in elements:
             # Need conversion to physics unit to work with simulator
             if isinstance(e, Magnet):
-                current = RWHardwareScalar(self.get_at_elems(e), e.polynom, e.model) if e.model.has_physics() else None
-                strength = RWStrengthScalar(self.get_at_elems(e), e.polynom, e.model) if e.model.has_physics() else None
+                current = (
+                    RWHardwareScalar(self.get_at_elems(e), e.polynom, e.model, self.__state) if e.model.has_physics() else None
+                )
+                strength = (
+                    RWStrengthScalar(self.get_at_elems(e), e.polynom, e.model, self.__state) if e.model.has_physics() else None
+                )
                 # Create a unique ref for this simulator
                 m = e.attach(self, strength, current)
                 self.add_magnet(m)
 
             elif isinstance(e, CombinedFunctionMagnet):
-                currents = RWHardwareArray(self.get_at_elems(e), e.polynoms, e.model) if e.model.has_physics() else None
-                strengths = RWStrengthArray(self.get_at_elems(e), e.polynoms, e.model) if e.model.has_physics() else None
+                currents = (
+                    RWHardwareArray(self.get_at_elems(e), e.polynoms, e.model, self.__state) if e.model.has_physics() else None
+                )
+                strengths = (
+                    RWStrengthArray(self.get_at_elems(e), e.polynoms, e.model, self.__state) if e.model.has_physics() else None
+                )
                 # Create unique refs of each function for this simulator
                 ms = e.attach(self, strengths, currents)
                 self.add_cfm_magnet(ms[0])
@@ -164,6 +285,7 @@ class Simulator(ElementHolder):
                             self.get_at_elems(magnet),
                             e.polynom,
                             e.model.get_sub_model(index),
+                            self.__state,
                         )
                         if e.model.has_hardware()
                         else None
@@ -173,6 +295,7 @@ class Simulator(ElementHolder):
                             self.get_at_elems(magnet),
                             e.polynom,
                             e.model.get_sub_model(index),
+                            self.__state,
                         )
                         if e.model.has_physics()
                         else None
@@ -193,9 +316,13 @@ class Simulator(ElementHolder):
 
             elif isinstance(e, BPM):
                 # This assumes unique BPM names in the pyAT lattice
-                tilt = RWBpmTiltScalar(self.get_at_elems(e)[0])
-                offsets = RWBpmOffsetArray(self.get_at_elems(e)[0])
-                positions = RBpmArray(self.get_at_elems(e)[0], self.ring)
+                elem = self.get_at_elems(e)[0]
+                refpt = self.get_refpt(elem)
+                # The shared closed orbit is computed at all BPMs
+                self.__state.register([refpt])
+                tilt = RWBpmTiltScalar(elem, self.__state)
+                offsets = RWBpmOffsetArray(elem)
+                positions = RBpmArray(refpt, self.__state)
                 e = e.attach(self, positions, offsets, tilt)
                 self.add_bpm(e)
 
@@ -215,21 +342,21 @@ class Simulator(ElementHolder):
                                 raise PyAMLException(f"RF transmitter {t.get_name()}, No cavity found")
                             cavsPerTrans.append(cav[0])
                             harmonics.append(t._cfg.harmonic)
-                        voltage = RWRFVoltageScalar(cavsPerTrans)
-                        phase = RWRFPhaseScalar(cavsPerTrans)
+                        voltage = RWRFVoltageScalar(cavsPerTrans, self.__state)
+                        phase = RWRFPhaseScalar(cavsPerTrans, self.__state)
                         nt = t.attach(self, voltage, phase)
                         self.add_rf_transnmitter(nt)
                         cavs.extend(cavsPerTrans)
                         attachedTrans.append(nt)
 
-                    frequency = RWRFFrequencyScalar(cavs, harmonics)
+                    frequency = RWRFFrequencyScalar(cavs, harmonics, self.__state)
                     voltage = RWTotalVoltage(attachedTrans)
                     ne = e.attach(self, frequency, voltage)
                     self.add_rf_plant(ne)
                 else:
                     # No transmitter defined switch to AT methods
-                    frequency = RWRFATFrequencyScalar(self.ring)
-                    voltage = RWRFATotalVoltageScalar(self.ring)
+                    frequency = RWRFATFrequencyScalar(self.ring, self.__state)
+                    voltage = RWRFATotalVoltageScalar(self.ring, self.__state)
                     ne = e.attach(self, frequency, voltage)
                     self.add_rf_plant(ne)
 
@@ -47,13 +47,8 @@ class RWCorrectorAngle(abstract.ReadWriteFloatScalar):
         ----------
         value : float
             Target kick angle in radians
-
-        Raises
-        ------
-        NotImplementedError
-            This method is not yet implemented
         """
-        raise NotImplementedError("Not implemented yet.")
+        self._mag.strength.set_and_wait(np.tan(value))
 
     def unit(self) -> str:
         """
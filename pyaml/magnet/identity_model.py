@@ -4,7 +4,7 @@ from pydantic import BaseModel, ConfigDict
 from .. import PyAMLException
 from ..common.element import __pyaml_repr__
 from ..control.deviceaccess import DeviceAccess
-from .model import MagnetModel
+from .model import MagnetModel, MagnetModelBatch
 
 # Define the main class name for this module
 PYAMLCLASS = "IdentityMagnetModel"
@@ -71,8 +71,27 @@ class IdentityMagnetModel(MagnetModel):
     def has_physics(self) -> bool:
         return self._cfg.physics is not None
 
+    def get_batch_key(self):
+        return PYAMLCLASS
+
+    @classmethod
+    def create_batch(cls, models: list["IdentityMagnetModel"]) -> MagnetModelBatch:
+        return IdentityMagnetModelBatch()
+
     def has_hardware(self) -> bool:
         return self._cfg.powerconverter is not None
 
     def __repr__(self):
         return __pyaml_repr__(self)
+
+
+class IdentityMagnetModelBatch(MagnetModelBatch):
+    """
+    Vectorized conversion for a list of identity magnet models
+    """
+
+    def compute_hardware_values(self, strengths: np.array) -> np.array:
+        return strengths
+
+    def compute_strengths(self, currents: np.array) -> np.array:
+        return currents
@@ -6,7 +6,7 @@ from ..common.exception import PyAMLException
 from ..control.deviceaccess import DeviceAccess
 from .curve import Curve
 from .matrix import Matrix
-from .model import MagnetModel
+from .model import MagnetModel, MagnetModelBatch
 
 # Define the main class name for this module
 PYAMLCLASS = "LinearCFMagnetModel"
@@ -128,6 +128,16 @@ class LinearCFMagnetModel(MagnetModel):
         # Compute pseudo inverse
         self.__inv = np.linalg.pinv(self.__matrix)
 
+        # Models sharing the same curves and matrix can be converted together
+        self.__batch_key = (
+            PYAMLCLASS,
+            self.__matrix.shape,
+            self.__matrix.tobytes(),
+            tuple((c.shape, c.tobytes()) for c in self.__curves),
+            np.asarray(self.__pf, dtype=float).tobytes(),
+            np.asarray(self.__po, dtype=float).tobytes(),
+        )
+
     def __check_len(self, obj, name, expected_len):
         lgth = len(obj)
         if lgth != expected_len:
@@ -161,8 +171,70 @@ class LinearCFMagnetModel(MagnetModel):
     def set_magnet_rigidity(self, brho: np.double):
         self._brho = brho
 
+    def get_magnet_rigidity(self) -> np.double:
+        return self._brho
+
+    def get_matrix(self) -> np.array:
+        return self.__matrix
+
+    def get_hardware_matrix(self) -> np.array:
+        return self.__matrix
+
+    def get_inverse_matrix(self) -> np.array:
+        return self.__inv
+
+    def get_curves(self) -> list[np.array]:
+        return self.__curves
+
+    def get_inverse_curves(self) -> list[np.array]:
+        return self.__rcurves
+
+    def get_pseudo_factors_and_offsets(self) -> tuple[np.array, np.array]:
+        return np.asarray(self.__pf, dtype=float), np.asarray(self.__po, dtype=float)
+
     def has_hardware(self) -> bool:
         return (self.__nbPS == self.__nbFunction) and np.allclose(self.__matrix, np.eye(self.__nbFunction))
 
+    def get_batch_key(self):
+        return self.__batch_key
+
+    @classmethod
+    def create_batch(cls, models: list["LinearCFMagnetModel"]) -> MagnetModelBatch:
+        return LinearCFMagnetModelBatch(models)
+
     def __repr__(self):
         return __pyaml_repr__(self)
+
+
+class LinearCFMagnetModelBatch(MagnetModelBatch):
+    """
+    Vectorized conversion for a list of linear combined function magnet models
+    sharing the same curves, matrix and pseudo current factors. Strengths and
+    currents are ordered model by model.
+    """
+
+    def __init__(self, models: list[LinearCFMagnetModel]):
+        self.__models = models
+        self.__matrix = models[0].get_matrix()
+        self.__inv = models[0].get_inverse_matrix()
+        self.__curves = models[0].get_curves()
+        self.__rcurves = models[0].get_inverse_curves()
+        self.__pf, self.__po = models[0].get_pseudo_factors_and_offsets()
+
+    def __brho(self) -> np.array:
+        # Rigidity may change after the batch creation
+        return np.array([m.get_magnet_rigidity() for m in self.__models], dtype=float)
+
+    def compute_hardware_values(self, strengths: np.array) -> np.array:
+        _s = np.reshape(strengths, (len(self.__models), len(self.__rcurves))) * self.__brho()[:, None]
+        _pI = np.empty_like(_s)
+        for idx, c in enumerate(self.__rcurves):
+            _pI[:, idx] = self.__pf[idx] * np.interp(_s[:, idx], c[:, 0], c[:, 1]) + self.__po[idx]
+        return np.ravel(_pI @ self.__inv.T)
+
+    def compute_strengths(self, currents: np.array) -> np.array:
+        _pI = np.reshape(currents, (len(self.__models), self.__matrix.shape[1])) @ self.__matrix.T
+        _strength = np.empty_like(_pI)
+        for idx, c in enumerate(self.__curves):
+            _strength[:, idx] = np.interp((_pI[:, idx] - self.__po[idx]) / self.__pf[idx], c[:, 0], c[:, 1])
+        return np.ravel(_strength / self.__brho()[:, None])
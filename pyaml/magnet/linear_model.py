@@ -3,7 +3,7 @@ from pydantic import BaseModel, ConfigDict
 
 from ..common.element import __pyaml_repr__
 from .curve import Curve
-from .model import MagnetModel
+from .model import MagnetModel, MagnetModelBatch
 
 # Define the main class name for this module
 PYAMLCLASS = "LinearMagnetModel"
@@ -64,6 +64,11 @@ class LinearMagnetModel(MagnetModel):
         self.__hardware_unit = cfg.hardware_unit
         self.__ps = cfg.powerconverter
         self.__brho = np.nan
+        # Models sharing the same curve can be converted with a single interpolation
+        if self.__curve is not None:
+            self.__batch_key = (PYAMLCLASS, self.__curve.shape, self.__curve.tobytes())
+        else:
+            self.__batch_key = (PYAMLCLASS, None)
 
     def compute_hardware_values(self, strengths: np.array) -> np.array:
         if self.__rcurve is not None:
@@ -91,5 +96,56 @@ class LinearMagnetModel(MagnetModel):
     def set_magnet_rigidity(self, brho: np.double):
         self.__brho = brho
 
+    def get_magnet_rigidity(self) -> np.double:
+        return self.__brho
+
+    def get_curve(self) -> np.array:
+        return self.__curve
+
+    def get_inverse_curve(self) -> np.array:
+        return self.__rcurve
+
+    def get_gain_and_offset(self) -> tuple[float, float]:
+        return (self._cfg.calibration_factor * self._cfg.crosstalk, self._cfg.calibration_offset)
+
+    def get_batch_key(self):
+        return self.__batch_key
+
+    @classmethod
+    def create_batch(cls, models: list["LinearMagnetModel"]) -> MagnetModelBatch:
+        return LinearMagnetModelBatch(models)
+
     def __repr__(self):
         return __pyaml_repr__(self)
+
+
+class LinearMagnetModelBatch(MagnetModelBatch):
+    """
+    Vectorized conversion for a list of linear magnet models sharing
+    the same curve (or all having no curve)
+    """
+
+    def __init__(self, models: list[LinearMagnetModel]):
+        self.__models = models
+        self.__curve = models[0].get_curve()
+        self.__rcurve = models[0].get_inverse_curve()
+        if self.__curve is None:
+            go = np.array([m.get_gain_and_offset() for m in models])
+            self.__g = go[:, 0]
+            self.__o = go[:, 1]
+
+    def __brho(self) -> np.array:
+        # Rigidity may change after the batch creation
+        return np.array([m.get_magnet_rigidity() for m in self.__models], dtype=float)
+
+    def compute_hardware_values(self, strengths: np.array) -> np.array:
+        if self.__rcurve is not None:
+            return np.interp(strengths * self.__brho(), self.__rcurve[:, 0], self.__rcurve[:, 1])
+        else:
+            return (strengths * self.__brho()) / self.__g + self.__o
+
+    def compute_strengths(self, currents: np.array) -> np.array:
+        if self.__curve is not None:
+            return np.interp(currents, self.__curve[:, 0], self.__curve[:, 1]) / self.__brho()
+        else:
+            return ((currents - self.__o) * self.__g) / self.__brho()
@@ -100,6 +100,7 @@ class LinearSerializedMagnetModel(MagnetModel):
         self.__crosstalk = np.ones(self.__nbMagnets)
         self.__curves = _to_list_of_length(self._cfg.curves, self.__nbMagnets)
         self.__sub_models: list[LinearMagnetModel] = []
+        self.__total_curve = None
 
     def __initialize(self):
         if self._cfg.calibration_factors is None:
@@ -142,6 +143,7 @@ class LinearSerializedMagnetModel(MagnetModel):
                 hardware_unit=self._cfg.hardware_unit,
             )
             self.__sub_models.append(LinearMagnetModel(sub_model))
+        self.__total_curve = None
 
     def set_number_of_magnets(self, nb_magnets: int):
         self.__nbMagnets = nb_magnets
@@ -158,6 +160,36 @@ class LinearSerializedMagnetModel(MagnetModel):
         current = currents[0]
         return np.array([model.compute_strengths([current])[0] for model in self.__sub_models])
 
+    def get_total_curve(self) -> np.array:
+        """
+        Returns the curve giving the sum of the integrated strengths of all the
+        magnets of the series (not divided by the magnet rigidity) as a function
+        of the power supply current
+        """
+        if self.__total_curve is None:
+            curves = [model.get_curve() for model in self.__sub_models]
+            x = np.unique(np.concatenate([c[:, 0] for c in curves]))
+            y = np.sum([np.interp(x, c[:, 0], c[:, 1]) for c in curves], axis=0)
+            self.__total_curve = np.column_stack((x, y))
+        return self.__total_curve
+
+    def compute_total_strength(self, current: float) -> float:
+        """
+        Returns the sum of the strengths of all the magnets of the series
+        for the given power supply current
+        """
+        return float(np.sum(self.compute_strengths(np.array([current]))))
+
+    def compute_total_hardware_value(self, strength: float) -> float:
+        """
+        Returns the power supply current giving the sum of strengths of all the
+        magnets of the series, using the total curve (see get_total_curve())
+        """
+        curve = self.get_total_curve()
+        if curve[-1, 1] < curve[0, 1]:
+            curve = curve[::-1]
+        return float(np.interp(strength * self.__brho, curve[:, 1], curve[:, 0]))
+
     def get_strength_units(self) -> list[str]:
         return [self._cfg.unit] * self.__nbMagnets
 
@@ -3,6 +3,7 @@ from scipy.constants import speed_of_light
 from .. import PyAMLException
 from ..common import abstract
 from ..common.element import Element, ElementConfigModel
+from ..common.lazy import LazyAccessor, resolve
 from .model import MagnetModel
 
 try:
@@ -55,6 +56,7 @@ class Magnet(Element):
         self.check_peer()
         if self.__strength is None:
             raise PyAMLException(f"{str(self)} has no model that supports physics units")
+        self.__strength = resolve(self.__strength)
         return self.__strength
 
     @property
@@ -66,6 +68,7 @@ class Magnet(Element):
         self.check_peer()
         if self.__hardware is None:
             raise PyAMLException(f"{str(self)} has no model that supports hardware units")
+        self.__hardware = resolve(self.__hardware)
         return self.__hardware
 
     @property
@@ -78,12 +81,13 @@ class Magnet(Element):
     def attach(
         self,
         peer,
-        strength: abstract.ReadWriteFloatScalar,
-        hardware: abstract.ReadWriteFloatScalar,
+        strength: abstract.ReadWriteFloatScalar | LazyAccessor,
+        hardware: abstract.ReadWriteFloatScalar | LazyAccessor,
     ) -> Self:
         """
         Create a new reference to attach this magnet to a simulator
-        or a control systemand.
+        or a control systemand. Accessors given as LazyAccessor are
+        created on first use.
         """
         obj = self.__class__(self._cfg)
         obj.__modelName = self.__modelName
@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from typing import Hashable
 
 import numpy as np
 import numpy.typing as npt
@@ -6,6 +7,72 @@ import numpy.typing as npt
 from ..control.deviceaccess import DeviceAccess
 
 
+class MagnetModelBatch(metaclass=ABCMeta):
+    """
+    Abstract class providing vectorized strength to hardware value conversion
+    for a group of magnet models sharing the same structure (same number of
+    strengths and power supplies). Arrays are the concatenation of the arrays
+    of each model of the batch, for single function models item i corresponds
+    to model i of the batch.
+    """
+
+    @abstractmethod
+    def compute_hardware_values(self, strengths: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Compute hardware values of all models of the batch
+
+        Parameters
+        ----------
+        strengths : npt.NDArray[np.float64]
+            Array of strengths of all models
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Array of hardware values of all models
+        """
+        pass
+
+    @abstractmethod
+    def compute_strengths(self, hardware_values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Compute strengths of all models of the batch
+
+        Parameters
+        ----------
+        hardware_values : npt.NDArray[np.float64]
+            Array of hardware values of all models
+
+        Returns
+        -------
+        npt.NDArray[np.float64]
+            Array of strengths of all models
+        """
+        pass
+
+
+class SequentialMagnetModelBatch(MagnetModelBatch):
+    """
+    Generic batch converting each model with its own conversion methods. It is
+    used by models returning a batch key without providing a vectorized batch.
+    """
+
+    def __init__(self, models: list["MagnetModel"]):
+        self.__models = models
+        nbStrength = [len(m.get_strength_units()) for m in models]
+        nbHardware = [len(m.get_device_names()) for m in models]
+        self.__strengthSplit = np.cumsum(nbStrength)[:-1]
+        self.__hardwareSplit = np.cumsum(nbHardware)[:-1]
+
+    def compute_hardware_values(self, strengths: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        parts = np.split(np.asarray(strengths, dtype=float), self.__strengthSplit)
+        return np.concatenate([m.compute_hardware_values(s) for m, s in zip(self.__models, parts, strict=True)])
+
+    def compute_strengths(self, hardware_values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        parts = np.split(np.asarray(hardware_values, dtype=float), self.__hardwareSplit)
+        return np.concatenate([m.compute_strengths(h) for m, h in zip(self.__models, parts, strict=True)])
+
+
 class MagnetModel(metaclass=ABCMeta):
     """
     Abstract class providing strength to coil current conversion
@@ -106,3 +173,71 @@ class MagnetModel(metaclass=ABCMeta):
             True if the model supports physics unit
         """
         return True
+
+    def get_hardware_matrix(self) -> npt.NDArray[np.float64] | None:
+        """
+        Returns the matrix giving the hardware value of each function (i.e. a
+        pseudo current) as a linear combination of the power supply values, for
+        models that do not map one power supply to one function.
+
+        Returns
+        ----------
+        npt.NDArray[np.float64] | None
+            (number of strengths x number of power supplies) matrix or None if
+            the model does not define hardware values for its functions
+        """
+        return None
+
+    def get_function_hardware_units(self) -> list[str]:
+        """
+        Returns the hardware unit of each function. For models defining a
+        hardware matrix, the pseudo current of a function has the unit of the
+        power supplies it combines (empty string if their units differ).
+
+        Returns
+        ----------
+        list[str]
+            Hardware unit of each function
+        """
+        units = self.get_hardware_units()
+        matrix = self.get_hardware_matrix()
+        if matrix is None:
+            return units
+        functionUnits = []
+        for row in np.asarray(matrix, dtype=float):
+            rowUnits = {units[j] for j in np.flatnonzero(row)}
+            functionUnits.append(rowUnits.pop() if len(rowUnits) == 1 else "")
+        return functionUnits
+
+    def get_batch_key(self) -> Hashable | None:
+        """
+        Returns a key identifying the models that can be converted together
+        by a single :py:class:`MagnetModelBatch`. Models returning the same
+        key must be of the same class and have the same number of strengths
+        and power supplies.
+
+        Returns
+        ----------
+        Hashable | None
+            Batch key or None if the model does not support batching
+        """
+        return None
+
+    @classmethod
+    def create_batch(cls, models: list["MagnetModel"]) -> MagnetModelBatch:
+        """
+        Creates a batch for a list of models sharing the same batch key.
+        Models returning a batch key should override it with a vectorized
+        batch, the default batch converts the models one by one.
+
+        Parameters
+        ----------
+        models : list[MagnetModel]
+            Models of the batch
+
+        Returns
+        ----------
+        MagnetModelBatch
+            Vectorized conversion for the given models
+        """
+        return SequentialMagnetModelBatch(models)
@@ -24,18 +24,38 @@ class ConfigModel(ElementConfigModel):
 
 
 class ReadWriteSerializedStrengths(abstract.ReadWriteFloatScalar):
-    def __init__(self, cfg: ConfigModel, elements: list[abstract.ReadWriteFloatScalar]):
+    """
+    Value of a series of magnets. By default, the value is the sum of the
+    values of the magnets and is written through the first magnet. A series
+    accessor may be given when the peer handles the series itself.
+    """
+
+    def __init__(
+        self,
+        cfg: ConfigModel,
+        elements: list[abstract.ReadWriteFloatScalar],
+        series: abstract.ReadWriteFloatScalar | None = None,
+    ):
         self.elements = elements
         self._cfg = cfg
+        self._series = series
 
     def get(self) -> float:
+        if self._series is not None:
+            return self._series.get()
         return sum([elem.get() for elem in self.elements])
 
     def set(self, value: float):
-        self.elements[0].set(value)
+        if self._series is not None:
+            self._series.set(value)
+        else:
+            self.elements[0].set(value)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        if self._series is not None:
+            self._series.set_and_wait(value)
+        else:
+            self.elements[0].set_and_wait(value)
 
     def unit(self) -> str:
         return self._cfg.model.get_strength_units()[0]
@@ -51,8 +71,13 @@ class ReadWriteSerializedStrengths(abstract.ReadWriteFloatScalar):
 
 
 class ReadWriteSerializedHardwares(ReadWriteSerializedStrengths):
-    def __init__(self, cfg: ConfigModel, elements: list[abstract.ReadWriteFloatScalar]):
-        super().__init__(cfg, elements)
+    def __init__(
+        self,
+        cfg: ConfigModel,
+        elements: list[abstract.ReadWriteFloatScalar],
+        series: abstract.ReadWriteFloatScalar | None = None,
+    ):
+        super().__init__(cfg, elements, series)
 
     def unit(self) -> str:
         return self._cfg.model.get_hardware_units()[0]
@@ -122,11 +147,20 @@ class SerializedMagnets(Element):
         peer,
         strengths: list[abstract.ReadWriteFloatScalar],
         hardwares: list[abstract.ReadWriteFloatScalar],
+        series_strength: abstract.ReadWriteFloatScalar | None = None,
+        series_hardware: abstract.ReadWriteFloatScalar | None = None,
     ) -> list[Magnet]:
+        """
+        Creates new references to attach the series and its magnets to a
+        simulator or a control system. series_strength and series_hardware,
+        when given, give access to the whole series (sum of the strengths of
+        the magnets, power supply setpoint), otherwise the series is accessed
+        through its magnets.
+        """
         l = []
         n_ser_mag = SerializedMagnets(self._cfg, peer)
-        n_ser_mag.__strengths = ReadWriteSerializedStrengths(self._cfg, strengths)
-        n_ser_mag.__hardwares = ReadWriteSerializedHardwares(self._cfg, hardwares)
+        n_ser_mag.__strengths = ReadWriteSerializedStrengths(self._cfg, strengths, series_strength)
+        n_ser_mag.__hardwares = ReadWriteSerializedHardwares(self._cfg, hardwares, series_hardware)
         l.append(n_ser_mag)
         # Construct a single magnet for each magnet.
         sub_magnets: list[Magnet] = []
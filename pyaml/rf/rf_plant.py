@@ -88,7 +88,10 @@ class RWTotalVoltage(abstract.ReadWriteFloatScalar):
                 t.voltage.set(v)
 
     def set_and_wait(self, value: float):
-        raise NotImplementedError("Not implemented yet.")
+        for t in self.__trans:
+            if t._cfg.harmonic == 1.0:
+                v = value * t._cfg.distribution
+                t.voltage.set_and_wait(v)
 
     def unit(self) -> str:
         return self.__trans[0]._cfg.phase.unit()
@@ -236,6 +236,10 @@ class ChomaticityMonitor(MeasurementTool):
 
         f0 = rf.frequency.get()
 
+        # Tune and orbit are acquired together
+        observables = {"tune": tm} if bpms is None else {"tune": tm, "orbit": bpms}
+        reader = self.peer.create_multi_reader(observables)
+
         delta = np.linspace(-e_delta, e_delta, n_step)
         delta_frec = -delta * alphac * f0
 
@@ -249,19 +253,18 @@ class ChomaticityMonitor(MeasurementTool):
         aborted = False
         try:
             for i, f in enumerate(delta_frec):
-                # TODO : Use set_and_wait once it is implemented !
-
-                rf.frequency.set(f0 + f)
+                rf.frequency.set_and_wait(f0 + f)
                 self.send_callback(Action.APPLY, {"step": i, "rf": float(f0 + f)})
                 sleep(sleep_between_step)
 
                 # Averaging
                 for j in range(n_avg_meas):
-                    tune = tm.tune.get()
+                    reading = reader.get()
+                    tune = reading["tune"]
                     Q[i] += tune
                     cb_data = {"step": i, "avg_step": j, "rf": float(f0 + f), "tune": tune}
                     if bpms is not None:
-                        orb = bpms.positions.get()
+                        orb = reading["orbit"]
                         orbit[i] += orb
                         cb_data["orbit"] = orb
                     self.send_callback(Action.MEASURE, cb_data)
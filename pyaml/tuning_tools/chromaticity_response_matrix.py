@@ -147,7 +147,7 @@ class ChromaticityResponseMatrix(MeasurementTool):
 
                 for step, d in enumerate(deltas):
                     # apply strength
-                    m.strength.set(str + d)
+                    m.strength.set_and_wait(str + d)
 
                     self.send_callback(
                         Action.APPLY, {"idx": qidx, "step": step, "magnet": m.get_name(), "strength": float(str + d)}
@@ -180,7 +180,7 @@ class ChromaticityResponseMatrix(MeasurementTool):
                     chromamat[qidx] = coefs[1]
 
                 # Restore strength
-                m.strength.set(str)
+                m.strength.set_and_wait(str)
                 self.send_callback(
                     Action.RESTORE,
                     {"idx": qidx, "magnet": m.get_name(), "strength": float(str), "dchroma": chromamat[qidx]},
@@ -57,7 +57,8 @@ class Dispersion(MeasurementTool):
             bpm_array_name=self.bpm_array_name,
             rf_plant_name=self.rf_plant_name,
         )
-        interface.set_wait_time = set_waiting_time
+        if set_waiting_time:
+            logger.warning("set_waiting_time is ignored, the RF frequency is waited for by set_and_wait()")
 
         generator = measure_dispersion(
             interface=interface,
@@ -244,7 +244,7 @@ class Orbit(TuningTool):
 
         corrector_names = corr_array.names()
         corrector_to_index = {name: idx for idx, name in enumerate(corrector_names)}
-        data_to_send = corr_array.strengths.get()
+        delta = np.zeros(len(corrector_names))
         for name in trims.keys():
             idx = corrector_to_index.get(name, None)
             if idx is None:
@@ -253,13 +253,13 @@ class Orbit(TuningTool):
                     "Possible inconcistency between corrector arrays and "
                     "response matrix."
                 )
-            data_to_send[idx] += trims[name]
+            delta[idx] += trims[name]
 
-        # send trims
-        corr_array.strengths.set(data_to_send)
-        if rf_flag:
-            rf_frequency = self._rf_plant.frequency.get()
-            self._rf_plant.frequency.set(rf_frequency + rf_trim)
+        # send corrector and rf trims together
+        with self.peer.transaction() as tx:
+            tx.add(corr_array.strengths, delta)
+            if rf_flag:
+                tx.add(self._rf_plant.frequency, rf_trim)
 
         return
 
@@ -60,7 +60,8 @@ class OrbitResponseMatrix(MeasurementTool):
         callback: Optional[Callable] = None,
     ):
         """
-        Measure orbit response matrix.
+        Measure orbit response matrix. On a simulator, see also :py:meth:`compute`
+        which computes the matrix from the model without corrector excitation.
 
         **Example**
 
@@ -77,8 +78,8 @@ class OrbitResponseMatrix(MeasurementTool):
         Parameters
         ----------
         sleep_between_step: float
-            Default time sleep after steerer exitation
-            Default: from config
+            Ignored, steerer setpoints are waited for by set_and_wait()
+            according to the configured device tolerances
         n_avg_meas : int, optional
             Default number of orbit measurement per step used for averaging
             Default from config
@@ -93,6 +94,8 @@ class OrbitResponseMatrix(MeasurementTool):
         """
         nb_meas = n_avg_meas if n_avg_meas is not None else self._cfg.n_avg_meas
         sleep_step = sleep_between_step if sleep_between_step is not None else self._cfg.sleep_between_step
+        if sleep_step:
+            logger.warning("sleep_between_step is ignored, steerer setpoints are waited for by set_and_wait()")
         sleep_meas = sleep_between_meas if sleep_between_meas is not None else self._cfg.sleep_between_meas
 
         element_holder = self._peer
@@ -101,7 +104,6 @@ class OrbitResponseMatrix(MeasurementTool):
             bpm_array_name=self.bpm_array_name,
         )
         # TODO handle sleep_meas
-        interface.set_wait_time = sleep_step
 
         if corrector_names is None:
             logger.info(f"Measuring correctors from the default arrays: {self.hcorr_array_name} and {self.vcorr_array_name}.")
@@ -159,6 +161,47 @@ class OrbitResponseMatrix(MeasurementTool):
 
         return True
 
+    def compute(self, corrector_names: Optional[List[str]] = None) -> bool:
+        """
+        Compute the orbit response matrix from the model. The closed orbit
+        response is obtained from the lattice transfer matrices instead of
+        exciting correctors one by one as :py:meth:`measure` does. Only
+        available on a simulator.
+
+        **Example**
+
+        .. code-block:: python
+
+            sr = Accelerator.load("MyAccelerator.yaml")
+            if sr.design.orm.compute():
+                sr.design.orm.save("ideal_orm.json")
+
+        Parameters
+        ----------
+        corrector_names : list[str], optional
+            Correctors, default to the correctors of the horizontal and
+            vertical arrays
+
+        Returns
+        -------
+        bool
+            True when the matrix has been computed
+        """
+        element_holder = self._peer
+        if corrector_names is None:
+            hcorrector_names = element_holder.get_magnets(self.hcorr_array_name).names()
+            vcorrector_names = element_holder.get_magnets(self.vcorr_array_name).names()
+            corrector_names = hcorrector_names + vcorrector_names
+
+        bpms = list(element_holder.get_bpms(self.bpm_array_name))
+        magnets = [element_holder.get_magnet(name) for name in corrector_names]
+        matrix = element_holder.compute_orbit_response(bpms, magnets, self.corrector_delta)
+
+        self._init_measure("pyaml.tuning_tools.orbit_response_matrix_data")
+        orm_data = self._pySC_response_data_to_ORMData({"matrix": matrix.tolist(), "input_names": list(corrector_names)})
+        self.latest_measurement.update(orm_data.model_dump())
+        return True
+
     def _pySC_response_data_to_ORMData(self, data: dict) -> OrbitResponseMatrixDataConfigModel:
         # all metadata is discarded here. Should we keep something?
 
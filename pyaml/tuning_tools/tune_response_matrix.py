@@ -138,7 +138,7 @@ class TuneResponseMatrix(MeasurementTool):
 
                 for step, d in enumerate(deltas):
                     # apply strength
-                    m.strength.set(str + d)
+                    m.strength.set_and_wait(str + d)
 
                     self.send_callback(
                         Action.APPLY, {"idx": qidx, "step": step, "magnet": m.get_name(), "strength": float(str + d)}
@@ -167,7 +167,7 @@ class TuneResponseMatrix(MeasurementTool):
                     tunemat[qidx] = coefs[1]
 
                 # Restore strength
-                m.strength.set(str)
+                m.strength.set_and_wait(str)
                 self.send_callback(
                     Action.RESTORE,
                     {"idx": qidx, "magnet": m.get_name(), "strength": float(str), "dtune": tunemat[qidx]},
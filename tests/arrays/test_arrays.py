@@ -9,6 +9,7 @@ from pyaml.arrays.bpm import ConfigModel as BPMArrayConfigModel
 from pyaml.arrays.bpm_array import BPMArray
 from pyaml.arrays.cfm_magnet import CombinedFunctionMagnet
 from pyaml.arrays.cfm_magnet import ConfigModel as CombinedFunctionMagnetConfigModel
+from pyaml.arrays.cfm_magnet_array import CombinedFunctionMagnetArray
 from pyaml.arrays.element_array import ElementArray
 from pyaml.arrays.magnet import ConfigModel as MagnetArrayConfigModel
 from pyaml.arrays.magnet import Magnet
@@ -250,3 +251,27 @@ def test_serialized_magnets_arrays(sr_file):
     assert len(hardwares) == 1
     print(hardwares)
     the_serie.hardwares.set([10])
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_cfm_array_aggregator(install_test_package):
+    sr: Accelerator = Accelerator.load("tests/config/sr.yaml")
+    cfm = sr.live.get_cfm_magnets("CFM")
+    strengths = np.array([0.000010, 0.000015, 1e-6, -0.000008, -0.000017, 1e-6])
+
+    ma = importlib.import_module("tango.pyaml.multi_attribute")
+    ma.LAST_NB_WRITTEN = 0
+    cfm.strengths.set(strengths)
+    assert ma.LAST_NB_WRITTEN == 6  # All power supplies written in a single call
+    assert np.allclose(cfm.strengths.get(), strengths)
+
+    # Same behavior without aggregator
+    noagg = CombinedFunctionMagnetArray("CFM_noagg", list(cfm), use_aggregator=False)
+    assert np.allclose(noagg.strengths.get(), strengths)
+    assert np.allclose(noagg.hardwares.get(), cfm.hardwares.get())
+    noagg.strengths.set(strengths * 2.0)
+    assert np.allclose(cfm.strengths.get(), strengths * 2.0)
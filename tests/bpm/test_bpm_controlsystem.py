@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from pyaml import PyAMLException
 from pyaml.accelerator import Accelerator
+from pyaml.arrays.bpm_array import BPM_SNAPSHOT_DTYPE, BPMArray
 
 
 @pytest.mark.parametrize(
@@ -94,3 +96,51 @@ def test_controlsystem_bpm_position_indexed(install_test_package):
     bpm = sr.live.get_bpm("BPM_C01-04")
 
     assert np.allclose(bpm.positions.get(), np.array([0.0, 1.0]))
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_controlsystem_bpm_array_snapshot(install_test_package):
+    from tango.pyaml.attribute_store import set_attribute
+
+    sr: Accelerator = Accelerator.load("tests/config/bpms.yaml")
+    bpm = sr.live.get_bpm("BPM_C01-01")
+    set_attribute("srdiag/bpm/c01-01/SA_HPosition", 1e-4)
+    bpms = BPMArray("BBA", [bpm])
+
+    bpms.offsets.set(np.array([[0.1, 0.2]]))
+    bpms.tilts.set(np.array([0.01]))
+    assert np.allclose(bpms.offsets.get(), [[0.1, 0.2]])
+    assert np.allclose(bpms.tilts.get(), [0.01])
+    assert np.allclose(bpm.offset.get(), [0.1, 0.2])
+
+    snap = bpms.snapshot()
+    assert snap.dtype == BPM_SNAPSHOT_DTYPE
+    assert snap.shape == (1,)
+    assert np.allclose(list(snap[0]), [1e-4, 0.0, 0.1, 0.2, 0.01])
+
+    # BPMs without offset and tilt devices
+    bpms = BPMArray("ALL", [bpm, sr.live.get_bpm("BPM_C01-02")])
+    snap = bpms.snapshot()
+    assert np.allclose(snap["x_offset"], [0.1, np.nan], equal_nan=True)
+    assert np.isnan(snap[1]["tilt"])
+    with pytest.raises(PyAMLException, match="no offset device"):
+        bpms.offsets.set(np.array([[0.1, 0.2], [0.0, 0.0]]))
+
+    # Same snapshot without aggregator
+    bpms = BPMArray("ALL", [bpm, sr.live.get_bpm("BPM_C01-02")], use_aggregator=False)
+    assert np.allclose(bpms.snapshot().view(float), snap.view(float), equal_nan=True)
+
+
+def test_simulator_bpm_array_snapshot():
+    sr: Accelerator = Accelerator.load("tests/config/bpms.yaml", ignore_external=True)
+
+    bpms = BPMArray("BBA", [sr.design.get_bpm("BPM_C01-01")])
+    bpms.tilts.set(np.array([0.01]))
+    snap = bpms.snapshot()
+    assert np.allclose(snap["tilt"], [0.01])
+    assert np.allclose(snap["x_offset"], bpms.offsets.get()[:, 0])
+    assert np.allclose(snap["x"], bpms.h.get())
@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.accelerator import Accelerator
+from pyaml.arrays.magnet_array import RWMagnetHardware
+from pyaml.common.constants import Action
+from pyaml.common.ramp import Ramp
+
+
+class LimitedHardware:
+    """In memory magnet hardware accessor having a slew rate"""
+
+    def __init__(self, max_rate):
+        self.value = 0.0
+        self.max_rate = max_rate
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def get_max_rate(self):
+        return self.max_rate
+
+
+class RecordingAccessor:
+    """In memory accessor recording written setpoints"""
+
+    def __init__(self, value):
+        self.value = np.array(value, dtype=float)
+        self.written = []
+
+    def get(self):
+        return self.value.copy()
+
+    def set(self, value):
+        self.written.append(np.array(value))
+        self.value = np.array(value)
+
+
+def test_ramp():
+    acc = RecordingAccessor([0.0, 1.0])
+    events = []
+    ramp = Ramp(acc, [1.0, 3.0], nb_step=4, period=0.01, callback=lambda a, d: events.append((a, d["step"])))
+    ramp.start()
+    assert ramp.wait(timeout=5.0)
+    assert len(acc.written) == 4
+    assert np.allclose(acc.written[0], [0.25, 1.5])
+    assert np.allclose(acc.value, [1.0, 3.0])
+    assert events == [(Action.APPLY, i) for i in range(1, 5)]
+    assert ramp.progress() == 1.0
+
+    # Slew limits increase the number of steps
+    acc = RecordingAccessor([0.0, 0.0])
+    ramp = Ramp(acc, [1.0, 0.1], nb_step=2, period=0.001, max_rate=[100.0, 1000.0])
+    ramp.start()
+    ramp.wait(timeout=5.0)
+    assert ramp.get_nb_step() == 10
+    assert np.all(np.abs(np.diff(np.array(acc.written), axis=0)) <= [0.1 + 1e-12, 1.0])
+
+    # Slew limits cannot be enforced without period
+    with pytest.raises(PyAMLException, match="period"):
+        Ramp(acc, [1.0, 0.1], period=0.0, max_rate=1.0)
+
+
+def test_ramp_cancel():
+    acc = RecordingAccessor([0.0])
+    events = []
+
+    def callback(action, data):
+        events.append(action)
+        return data["step"] < 3
+
+    ramp = Ramp(acc, [10.0], nb_step=10, period=0.001, callback=callback)
+    ramp.start()
+    assert ramp.wait(timeout=5.0)
+    assert ramp.is_cancelled()
+    assert ramp.get_step() == 3
+    assert np.allclose(acc.value, [3.0])
+    assert events == [Action.APPLY] * 3 + [Action.CANCEL]
+
+    ramp = Ramp(acc, [0.0], nb_step=100, period=10.0)
+    ramp.start()
+    ramp.cancel()
+    assert ramp.wait(timeout=5.0)
+    assert ramp.get_step() == 1
+
+    with pytest.raises(PyAMLException):
+        Ramp(acc, [0.0], nb_step=0)
+
+
+def test_magnet_array_ramp():
+    sr: Accelerator = Accelerator.load("tests/config/EBSTune.yaml", ignore_external=True)
+    quads = sr.design.get_magnets("QForTune")
+    target = quads.strengths.get() * 1.01
+    ramp = quads.strengths.ramp(target, nb_step=3, period=0.0)
+    ramp.wait(timeout=10.0)
+    assert np.allclose(quads.strengths.get(), target)
+
+
+def test_magnet_array_ramp_max_rate():
+    magnets = [SimpleNamespace(hardware=LimitedHardware(r)) for r in (10.0, None)]
+    hardwares = RWMagnetHardware("HW", magnets)
+    assert np.array_equal(hardwares.get_max_rate(), [10.0, np.inf])
+    # Power supply slew rates are used by default
+    ramp = hardwares.ramp(np.array([1.0, 50.0]), nb_step=2, period=0.01)
+    assert ramp.wait(timeout=5.0)
+    assert ramp.get_nb_step() == 10
+    assert np.allclose(hardwares.get(), [1.0, 50.0])
+    ramp = hardwares.ramp(np.array([0.0, 0.0]), nb_step=2, period=0.01, max_rate=1000.0)
+    assert ramp.wait(timeout=5.0)
+    assert ramp.get_nb_step() == 5
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.common.transaction import WriteTransaction
+
+
+class SlowAccessor:
+    """In memory accessor whose accesses take some time"""
+
+    def __init__(self, value, delay: float = 0.05, fail: bool = False):
+        self.value = value
+        self.delay = delay
+        self.fail = fail
+        self.nb_get = 0
+        self.nb_set = 0
+
+    def get(self):
+        self.nb_get += 1
+        time.sleep(self.delay)
+        return self.value
+
+    def set(self, value):
+        self.nb_set += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise PyAMLException("write error")
+        self.value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+
+def test_transaction_commit():
+    strengths = SlowAccessor(np.array([1.0, 2.0, 3.0]))
+    frequency = SlowAccessor(352e6)
+    tune = SlowAccessor(np.zeros(2))
+
+    t0 = time.monotonic()
+    with WriteTransaction() as tx:
+        tx.add(strengths, np.array([0.1, 0.0, -0.1]))
+        tx.add(frequency, 10.0)
+        tx.set(tune, [0.5, 0.5])
+        tx.add(tune, np.array([0.1, 0.0]))
+        assert len(tx) == 3
+    # Reads and writes are overlapped
+    assert time.monotonic() - t0 < 0.25
+    assert tx.is_committed()
+    assert np.allclose(strengths.value, [1.1, 2.0, 2.9])
+    assert frequency.value == 352e6 + 10.0
+    # An absolute setpoint is not read back
+    assert tune.nb_get == 0
+    assert np.allclose(tune.value, [0.6, 0.5])
+
+    with pytest.raises(PyAMLException, match="already committed"):
+        tx.set(tune, [0.0, 0.0])
+
+
+def test_transaction_abort_and_errors():
+    acc = SlowAccessor(1.0, delay=0.0)
+    with pytest.raises(ValueError):
+        with WriteTransaction() as tx:
+            tx.set(acc, 2.0)
+            raise ValueError()
+    assert acc.nb_set == 0
+
+    failing = SlowAccessor(1.0, delay=0.0, fail=True)
+    tx = WriteTransaction(concurrent=False)
+    tx.set(acc, 2.0)
+    tx.add(failing, 1.0)
+    with pytest.raises(PyAMLException, match="partially applied"):
+        tx.commit()
+    assert acc.value == 2.0
+
+
+def test_transaction_async():
+    strengths = SlowAccessor(np.array([1.0, 2.0]))
+    frequency = SlowAccessor(352e6)
+    tx = WriteTransaction(wait=True)
+    tx.add(strengths, np.array([1.0, 1.0]))
+    tx.set(frequency, 352e6 + 1.0)
+    asyncio.run(tx.commit_async())
+    assert np.allclose(strengths.value, [2.0, 3.0])
+    assert frequency.value == 352e6 + 1.0
@@ -0,0 +1,70 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.arrays.bpm_array import BPMArray
+from pyaml.arrays.magnet_array import MagnetArray
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_device_access_async(install_test_package):
+    sr = Accelerator.load("tests/config/sr.yaml")
+    dev = sr.live.get_device_access("sr/ps-qf1/c01-a/current")
+    agg = sr.live.get_aggregator()
+    agg.add_devices(sr.live.get_device_access("srdiag/bpm/c04-01/SA_HPosition"))
+    agg.add_devices(sr.live.get_device_access("srdiag/bpm/c04-01/SA_VPosition"))
+
+    async def run():
+        await dev.set_async(12.5)
+        value = await dev.get_async()
+        rb = await dev.readback_async()
+        positions = await agg.get_async()
+        return value, rb, positions
+
+    value, rb, positions = asyncio.run(run())
+    assert value == 12.5
+    assert rb.value == 12.5
+    assert np.shape(positions) == (2,)
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_arrays_async(install_test_package):
+    sr = Accelerator.load("tests/config/sr.yaml")
+    hvcorr = sr.live.get_magnets("HVCORR")
+    noagg = MagnetArray("HVCORR_noagg", [m for m in hvcorr], use_aggregator=False)
+    setpoints = np.array([0.000010, -0.000008, 0.000015, -0.000017])
+
+    async def run():
+        await hvcorr.strengths.set_async(setpoints)
+        with_agg = await hvcorr.strengths.get_async()
+        without_agg = await noagg.strengths.get_async()
+        # Several reads overlapped on the same loop
+        return with_agg, without_agg, await asyncio.gather(hvcorr.strengths.get_async(), noagg.strengths.get_async())
+
+    with_agg, without_agg, (strengths, _) = asyncio.run(run())
+    assert np.allclose(with_agg, setpoints, rtol=0, atol=1e-10)
+    assert np.allclose(without_agg, setpoints, rtol=0, atol=1e-10)
+    assert np.allclose(strengths, hvcorr.strengths.get(), rtol=0, atol=1e-12)
+
+    # Design (no aggregator for magnets)
+    sr.design.get_lattice().disable_6d()
+    bpms = sr.design.get_bpms("BPMS")
+    bpms_noagg = BPMArray("BPMS_noagg", [b for b in bpms], use_aggregator=False)
+
+    async def run_bpm():
+        return await asyncio.gather(bpms.positions.get_async(), bpms_noagg.positions.get_async(), bpms.h.get_async())
+
+    pos, pos_noagg, pos_h = asyncio.run(run_bpm())
+    assert np.shape(pos) == (2, 2)
+    assert np.allclose(pos, pos_noagg, rtol=0, atol=1e-15)
+    assert np.allclose(pos[:, 0], pos_h, rtol=0, atol=1e-15)
@@ -0,0 +1,96 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.control.availability import check_devices
+from pyaml.control.deviceaccess import DeviceAccess
+
+
+class ProbedDevice(DeviceAccess):
+    """In memory device with a configurable availability probe"""
+
+    def __init__(self, name: str, available: bool = True, delay: float = 0.0, error: str | None = None):
+        self._name = name
+        self._available = available
+        self._delay = delay
+        self._error = error
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        pass
+
+    def set_and_wait(self, value):
+        pass
+
+    def get(self):
+        return 0.0
+
+    def readback(self):
+        return 0.0
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def check_device_availability(self) -> bool:
+        time.sleep(self._delay)
+        if self._error is not None:
+            raise RuntimeError(self._error)
+        return self._available
+
+
+def test_check_devices():
+    devs = [ProbedDevice(f"ps{i}") for i in range(4)]
+    devs.append(ProbedDevice("ps4", available=False))
+    devs.append(ProbedDevice("ps5", error="connection refused"))
+    devs.append(ProbedDevice("ps6", delay=1.0))
+    report = check_devices("live", devs, timeout=0.2)
+    assert not report.is_healthy()
+    assert report.nb_checked == 7
+    assert report.unavailable == {"ps4": "unavailable", "ps5": "connection refused", "ps6": "timeout"}
+    assert "4/7 devices available" in str(report)
+
+
+def test_check_devices_duration():
+    # Check completes in one timeout period regardless of the device count
+    devs = [ProbedDevice(f"ps{i}", delay=0.5) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        t0 = time.monotonic()
+        report = check_devices("live", devs, timeout=0.1, executor=executor)
+        assert time.monotonic() - t0 < 0.3
+    assert len(report.unavailable) == 200
+    reasons = list(report.unavailable.values())
+    assert reasons.count("timeout") == 64
+    assert reasons.count("not probed") == 136
+
+
+def test_check_devices_queued():
+    # Queued probes are run as workers get free, within the same deadline
+    devs = [ProbedDevice(f"ps{i}", delay=0.05) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert check_devices("live", devs, timeout=0.5, executor=executor).is_healthy()
+        report = check_devices("live", devs, timeout=0.02, executor=executor)
+    assert report.unavailable == {f"ps{i}": "timeout" if i < 4 else "not probed" for i in range(8)}
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_accelerator_health(install_test_package):
+    sr: Accelerator = Accelerator.load("tests/config/EBSTune.yaml")
+    reports = sr.health(timeout=2.0)
+    assert list(reports) == ["live"]
+    assert reports["live"].is_healthy()
+    assert reports["live"].nb_checked > 0
+    assert sr.design.check_availability().nb_checked == 0
@@ -0,0 +1,191 @@
+import time
+
+import numpy as np
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.devicecache import CachedDeviceAccess, CachedDeviceAccessList, ConfigModel, DeviceCache
+from pyaml.control.readback_value import ValueArray
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class CountingDevice(DeviceAccess):
+    """In memory device counting setpoint reads"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._value = 0.0
+        self.nb_read = 0
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        self.nb_read += 1
+        return self._value
+
+    def readback(self):
+        return self._value
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+def test_cached_device_access():
+    cache = DeviceCache(ConfigModel(ttl=10.0))
+    dev = CountingDevice("ps0")
+    cdev = CachedDeviceAccess(dev, cache)
+    cdev.set(2.0)
+    assert cdev.get() == 2.0
+    assert cdev.get() == 2.0
+    assert dev.nb_read == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    # Writes invalidate
+    cdev.set(3.0)
+    assert cdev.get() == 3.0
+    assert dev.nb_read == 2
+
+    # List and scalar accesses share entries by device name
+    devs = [dev, CountingDevice("ps1")]
+    dl = ThreadedDeviceAccessList(max_workers=2)
+    cdl = CachedDeviceAccessList(dl, cache)
+    cdl.add_devices(devs)
+    assert np.array_equal(cdl.get(), [3.0, 0.0])
+    assert np.array_equal(cdl.get(), [3.0, 0.0])
+    assert devs[1].nb_read == 1
+    cdl.set(np.array([4.0, 5.0]))
+    assert cdev.get() == 4.0
+    assert cdl.len() == 2
+
+    cache.reset_stats()
+    assert cache.stats()["hits"] == 0
+
+
+def test_cached_readback_array():
+    cache = DeviceCache(ConfigModel(ttl=10.0))
+    devs = [CountingDevice(f"ps{i}") for i in range(3)]
+    cdl = CachedDeviceAccessList(ThreadedDeviceAccessList(max_workers=2), cache)
+    cdl.add_devices(devs)
+    cdl.set(np.array([1.0, 2.0, 3.0]))
+
+    # Readbacks of the list are stored as a single array
+    rb = cdl.readback()
+    assert isinstance(rb, ValueArray)
+    assert cache.lookup_array([d.name() + "#readback" for d in devs]) is not None
+    rb2 = cdl.readback()
+    assert isinstance(rb2, ValueArray)
+    assert np.array_equal(rb2.timestamp, rb.timestamp)
+    assert rb2 == [1.0, 2.0, 3.0]
+    # Returned arrays are copies
+    rb2.values[0] = 10.0
+    values = cdl.get()
+    values[1] = 20.0
+    assert cdl.readback() == [1.0, 2.0, 3.0]
+    assert np.array_equal(cdl.get(), [1.0, 2.0, 3.0])
+    assert devs[0].nb_read == 1
+
+    # Single channels are served from the array
+    cdev = CachedDeviceAccess(devs[1], cache)
+    assert cdev.readback() == 2.0
+    assert cdev.get() == 2.0
+    assert devs[1].nb_read == 1
+
+    # Partial invalidation
+    cdev.set(5.0)
+    assert np.array_equal(cdl.get(), [1.0, 5.0, 3.0])
+    assert devs[1].nb_read == 2
+
+
+def test_cache_ttl_and_eviction():
+    cache = DeviceCache(ConfigModel(ttl=0.05, max_entries=2))
+    devs = [CountingDevice(f"ps{i}") for i in range(3)]
+    cdevs = [CachedDeviceAccess(d, cache) for d in devs]
+    for d in cdevs:
+        d.get()
+    # ps0 is the least recently used
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    cdevs[0].get()
+    assert devs[0].nb_read == 2
+    cdevs[2].get()
+    assert devs[2].nb_read == 1
+    time.sleep(0.06)
+    cdevs[2].get()
+    assert devs[2].nb_read == 2
+
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_control_system_cache(install_test_package):
+    entries = []
+    for bpm in ["C02-01", "C02-02"]:
+        for plane in ["H", "V"]:
+            entries.append(
+                {
+                    "type": "tango.pyaml.static_catalog_entry",
+                    "key": f"BPM_{bpm}/{plane}",
+                    "device": {
+                        "type": "tango.pyaml.attribute_read_only",
+                        "attribute": f"srdiag/bpm/{bpm.lower()}/SA_{plane}Position",
+                        "unit": "mm",
+                    },
+                }
+            )
+    sr = Accelerator.from_dict(
+        {
+            "type": "pyaml.accelerator",
+            "facility": "ESRF",
+            "machine": "sr",
+            "energy": 6e9,
+            "data_folder": "/data/store",
+            "controls": [
+                {
+                    "type": "tango.pyaml.controlsystem",
+                    "name": "live",
+                    "cache": {"type": "pyaml.control.devicecache", "ttl": 10.0},
+                    "catalog": {"type": "tango.pyaml.static_catalog", "entries": entries},
+                }
+            ],
+            "arrays": [{"type": "pyaml.arrays.bpm", "name": "BPMS", "elements": ["BPM_C02-0?"]}],
+            "devices": [
+                {"type": "pyaml.bpm.bpm", "name": f"BPM_{bpm}", "x_pos": f"BPM_{bpm}/H", "y_pos": f"BPM_{bpm}/V"}
+                for bpm in ["C02-01", "C02-02"]
+            ],
+        }
+    )
+
+    cache = sr.live.get_device_cache()
+    assert isinstance(cache, DeviceCache)
+    cache.reset_stats()
+    pos = sr.live.get_bpms("BPMS").positions.get()
+    assert np.shape(pos) == (2, 2)
+    assert cache.stats()["misses"] == 4
+    # Served from memory, also for single BPM reads
+    sr.live.get_bpms("BPMS").positions.get()
+    sr.live.get_bpm("BPM_C02-01").positions.get()
+    assert cache.stats()["hits"] == 6
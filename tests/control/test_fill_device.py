@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.control.controlsystem import ControlSystem
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_bulk_device_resolution(install_test_package, monkeypatch):
+    calls = []
+    bulk = ControlSystem.get_devices_access
+
+    def counting_get_devices_access(self, refs):
+        calls.append(len(refs))
+        return bulk(self, refs)
+
+    monkeypatch.setattr(ControlSystem, "get_devices_access", counting_get_devices_access)
+    sr: Accelerator = Accelerator.load("tests/config/EBSTune.yaml")
+
+    # All the devices of the configuration are resolved in a single call,
+    # following calls come from array aggregators
+    nb_ref = sum(len(sr.live._element_device_refs(e)) for e in sr._cfg.devices)
+    assert nb_ref > 1
+    assert calls[0] == nb_ref
+    timing = sr.live.get_fill_device_timing()
+    assert set(timing) == {"collect", "resolve", "attach"}
+    assert all(t >= 0.0 for t in timing.values())
+
+    quads = sr.live.get_magnets("QForTune")
+    strengths = sr.design.get_magnets("QForTune").strengths.get()
+    quads.strengths.set(strengths)
+    assert np.allclose(quads.strengths.get(), strengths)
+
+
+class MemoryControlSystem(ControlSystem):
+    """Control system resolving references to strings"""
+
+    def __init__(self):
+        super().__init__()
+        self.resolved = []
+
+    def name(self) -> str:
+        return "memory"
+
+    def get_aggregator(self) -> str | None:
+        return None
+
+    def get_device_access(self, ref):
+        self.resolved.append(ref)
+        return f"dev:{ref}"
+
+    def concurrent_device_resolution(self) -> bool:
+        return True
+
+
+def test_concurrent_resolution():
+    cs = MemoryControlSystem()
+    refs = ["a", "b", None, "a", "c"]
+    assert cs.get_devices_access(refs) == ["dev:a", "dev:b", "dev:None", "dev:a", "dev:c"]
+    # Duplicated references are resolved once
+    assert sorted(cs.resolved, key=str) == sorted(["a", "b", None, "c"], key=str)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.common.lazy import LazyAccessor
+from pyaml.control.controlsystem import ControlSystem
+
+
+def _entry(key: str, attribute: str, read_only: bool = True) -> dict:
+    return {
+        "type": "tango.pyaml.static_catalog_entry",
+        "key": key,
+        "device": {
+            "type": "tango.pyaml.attribute_read_only" if read_only else "tango.pyaml.attribute",
+            "attribute": attribute,
+            "unit": "mm",
+        },
+    }
+
+
+def test_lazy_accessor():
+    calls = []
+    lazy = LazyAccessor(lambda: calls.append(1) or "accessor")
+    assert not lazy.is_resolved()
+    assert lazy.get() == "accessor"
+    assert lazy.get() == "accessor"
+    assert lazy.is_resolved()
+    assert calls == [1]
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_lazy_attach(install_test_package, monkeypatch):
+    resolved = []
+    bulk = ControlSystem.get_devices_access
+
+    def counting_get_devices_access(self, refs):
+        resolved.extend(refs)
+        return bulk(self, refs)
+
+    monkeypatch.setattr(ControlSystem, "get_devices_access", counting_get_devices_access)
+    sr = Accelerator.from_dict(
+        {
+            "type": "pyaml.accelerator",
+            "facility": "ESRF",
+            "machine": "sr",
+            "energy": 6e9,
+            "data_folder": "/data/store",
+            "controls": [
+                {
+                    "type": "tango.pyaml.controlsystem",
+                    "tango_host": "ebs-simu-3:10000",
+                    "name": "live",
+                    "lazy_attach": True,
+                    "catalog": {
+                        "type": "tango.pyaml.static_catalog",
+                        "entries": [
+                            _entry("BPM_C02-01/x", "srdiag/bpm/c02-01/SA_HPosition"),
+                            _entry("BPM_C02-01/y", "srdiag/bpm/c02-01/SA_VPosition"),
+                            _entry("BPM_C02-01/tilt", "srdiag/bpm/c02-01/Tilt", False),
+                        ],
+                    },
+                }
+            ],
+            "devices": [
+                {
+                    "type": "pyaml.bpm.bpm",
+                    "name": "BPM_C02-01",
+                    "x_pos": "BPM_C02-01/x",
+                    "y_pos": "BPM_C02-01/y",
+                    "tilt": "BPM_C02-01/tilt",
+                }
+            ],
+        }
+    )
+    assert sr.live.is_lazy_attach()
+    # Nothing resolved at load time
+    assert resolved == []
+
+    bpm = sr.live.get_bpm("BPM_C02-01")
+    assert np.allclose(bpm.positions.get(), np.array([0.0, 0.0]))
+    assert resolved == ["BPM_C02-01/x", "BPM_C02-01/y"]
+    # Accessors are created once
+    assert bpm.positions is bpm.positions
+    assert len(resolved) == 2
+
+    bpm.tilt.set(0.1)
+    assert np.isclose(bpm.tilt.get(), 0.1)
+    assert resolved[2:] == ["BPM_C02-01/tilt"]
@@ -0,0 +1,146 @@
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.monitor import Monitor, RingBuffer
+from pyaml.control.readback_value import Quality, Value
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class MemoryDevice(DeviceAccess):
+    """In memory device returning readbacks with quality"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._value = 0.0
+        self.quality = Quality.VALID
+        self.timestamp: datetime | None = None
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        return self._value
+
+    def readback(self):
+        return Value(self._value, self.quality, self.timestamp)
+
+    def unit(self) -> str:
+        return "mm"
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+def test_ring_buffer():
+    rb = RingBuffer(4, 2)
+    assert len(rb) == 0
+    for i in range(6):
+        quality = Quality.INVALID.value if i == 5 else Quality.VALID.value
+        rb.append(float(i), np.array([i, 10 * i]), np.array([Quality.VALID.value, quality]))
+    assert len(rb) == 4
+    assert rb.count() == 6
+    t, v, q = rb.last()
+    assert np.array_equal(t, [2.0, 3.0, 4.0, 5.0])
+    assert np.array_equal(v[:, 0], [2.0, 3.0, 4.0, 5.0])
+    t, _, _ = rb.last(2)
+    assert np.array_equal(t, [4.0, 5.0])
+    # Invalid samples are ignored
+    assert np.allclose(rb.mean(2), [4.5, 40.0])
+
+    with pytest.raises(PyAMLException):
+        RingBuffer(0, 2)
+
+
+def test_monitor_push():
+    m = Monitor(None, 2, capacity=8)
+    received = []
+    handle = m.subscribe(lambda t, v, q: received.append(v))
+    m.push([Value(1.0), Value(2.0, Quality.ALARM)], timestamp=10.0)
+    assert np.array_equal(received[0], [1.0, 2.0])
+    t, v, q = m.history().last(1)
+    assert t[0] == 10.0
+    assert q[0, 1] == Quality.ALARM.value
+
+    # Wait for a sample pushed from another thread
+    threading.Timer(0.05, lambda: m.push(np.array([3.0, 4.0]))).start()
+    t, v, q = m.wait_next(timeout=2.0)
+    assert np.array_equal(v, [3.0, 4.0])
+    assert np.all(q == Quality.VALID.value)
+
+    m.unsubscribe(handle)
+    m.push([5.0, 6.0])
+    assert len(received) == 2
+
+    with pytest.raises(PyAMLException, match="no new sample"):
+        m.wait_next(timeout=0.01)
+
+
+def test_device_subscription():
+    dev = MemoryDevice("bpm0")
+    received = []
+    m = dev.subscribe(lambda t, v, q: received.append(float(v[0])), period=0.01)
+    try:
+        assert received == [0.0]
+        dev.quality = Quality.INVALID
+        dev.set(1.0)
+        _, _, q = m.wait_next(timeout=2.0)
+    finally:
+        m.stop()
+    assert not m.is_running()
+    # Unchanged values are not notified
+    assert received == [0.0, 1.0]
+    assert q[0] == Quality.INVALID.value
+
+
+def test_device_list_monitor():
+    devs = [MemoryDevice(f"bpm{i}") for i in range(3)]
+    dl = ThreadedDeviceAccessList(max_workers=3)
+    dl.add_devices(devs)
+    with dl.monitor(period=0.01, capacity=16) as m:
+        assert m.history().count() == 1
+        devs[1].set(2.0)
+        t, v, q = m.wait_next(timeout=2.0)
+        time.sleep(0.05)
+    assert np.array_equal(v, [0.0, 2.0, 0.0])
+    assert len(m.history()) == 2
+    assert np.allclose(m.history().mean(), [0.0, 1.0, 0.0])
+
+
+def test_monitor_sample_time():
+    # Polled samples are stamped with the readback timestamps, not the polling time
+    devs = [MemoryDevice(f"bpm{i}") for i in range(2)]
+    for i, d in enumerate(devs):
+        d.timestamp = datetime.fromtimestamp(1000.0 + i)
+    dl = ThreadedDeviceAccessList(max_workers=2)
+    dl.add_devices(devs)
+    with dl.monitor(period=0.01) as m:
+        devs[0].timestamp = datetime.fromtimestamp(1005.0)
+        devs[0].set(1.0)
+        t, _, _ = m.wait_next(timeout=2.0)
+    assert t == 1005.0
+    assert np.array_equal(m.history().last()[0], [1001.0, 1005.0])
+
+    m = Monitor(devs[0], 1)
+    m.push(Value(2.0, timestamp=datetime.fromtimestamp(1010.0)))
+    m.push(3.0)
+    t, _, _ = m.history().last()
+    assert t[0] == 1010.0
+    assert t[1] > 1010.0
@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.accelerator import Accelerator
+from pyaml.control.abstract_impl import CSScalarAggregator
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.multireader import MultiReader
+from pyaml.control.readback_value import Value
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class MemoryDevice(DeviceAccess):
+    """In memory device"""
+
+    def __init__(self, name: str, value: float, timestamp: float | None = None):
+        self._name = name
+        self._value = value
+        self._timestamp = timestamp
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        return self._value
+
+    def readback(self):
+        if self._timestamp is None:
+            return self._value
+        return Value(self._value, timestamp=datetime.fromtimestamp(self._timestamp))
+
+    def unit(self) -> str:
+        return ""
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+class CountingDeviceAccessList(ThreadedDeviceAccessList):
+    """Device list counting backend reads"""
+
+    nb_read = 0
+
+    def readback(self):
+        CountingDeviceAccessList.nb_read += 1
+        return super().readback()
+
+
+class ConstantAccessor:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def test_multi_reader():
+    reader = MultiReader(CSScalarAggregator(CountingDeviceAccessList(max_workers=4)))
+    reader.add_devices("tune", [MemoryDevice("qh", 0.16), MemoryDevice("qv", 0.34)])
+    reader.add_devices("rf", [MemoryDevice("freq", 352e6)], ())
+    reader.add_devices("orbit", [MemoryDevice(f"bpm{i}", float(i), 1000.0 + 0.01 * i) for i in range(6)], (3, 2))
+    reader.add_accessor("current", ConstantAccessor(0.2))
+    assert reader.names() == ["tune", "rf", "orbit", "current"]
+    assert reader.nb_device() == 9
+
+    CountingDeviceAccessList.nb_read = 0
+    r = reader.get()
+    assert CountingDeviceAccessList.nb_read == 1
+    assert np.allclose(r["tune"], [0.16, 0.34])
+    assert r["rf"].shape == () and r["rf"] == 352e6
+    assert np.array_equal(r["orbit"], [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]])
+    assert r["current"] == 0.2
+    assert "orbit" in r
+    # Control system timestamps of each value
+    assert np.allclose(r.timestamps["orbit"], [[1000.0, 1000.01], [1000.02, 1000.03], [1000.04, 1000.05]])
+    assert r.timestamps["current"] == r.read_time
+    assert r.spread() > r.read_time - 1001.0
+
+    with pytest.raises(PyAMLException, match="duplicate"):
+        reader.add_accessor("tune", ConstantAccessor(0.0))
+    with pytest.raises(PyAMLException, match="does not match"):
+        reader.add_devices("bad", [MemoryDevice("x", 0.0)], (2,))
+    with pytest.raises(PyAMLException, match="no aggregator"):
+        MultiReader().add_devices("tune", [MemoryDevice("qh", 0.16)])
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_holder_multi_reader(install_test_package):
+    sr: Accelerator = Accelerator.load("tests/config/EBSOrbit.yaml")
+    for holder in (sr.live, sr.design):
+        tm = holder.get_betatron_tune_monitor("BETATRON_TUNE")
+        rf = holder.get_rf_plant("RF")
+        bpms = holder.get_bpms("BPM")
+        reader = holder.create_multi_reader({"tune": tm, "rf": rf, "orbit": bpms})
+        r = reader.get()
+        assert np.allclose(r["tune"], tm.tune.get())
+        assert np.isclose(r["rf"], rf.frequency.get())
+        assert np.allclose(r["orbit"], bpms.positions.get())
+
+    tm = sr.live.get_betatron_tune_monitor("BETATRON_TUNE")
+    bpms = sr.live.get_bpms("BPM")
+    assert sr.live.create_multi_reader({"tune": tm, "orbit": bpms}).nb_device() == 2 + 2 * len(bpms)
+    with pytest.raises(PyAMLException, match="Unsupported observable"):
+        sr.live.create_multi_reader({"magnets": sr.live.get_magnets("HCorr")})
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from pyaml.control.abstract_impl import check_range
+from pyaml.control.abstract_impl import RangeTable, check_compiled_range, check_range, compile_range
 
 
 @pytest.mark.parametrize(
@@ -67,3 +67,41 @@ def test_check_range_raises_on_inconsistent_sizes(values, dev_range):
 )
 def test_check_range_single_value_is_equivalent_to_explicit_duplication(dev_range):
     assert check_range(3.0, dev_range) == check_range([3.0, 3.0], dev_range)
+
+
+def test_compile_range():
+    mins, maxs = compile_range([None, 10.0, 1.0, None])
+    assert mins.dtype == np.float64 and maxs.dtype == np.float64
+    assert np.array_equal(mins, [-np.inf, 1.0])
+    assert np.array_equal(maxs, [10.0, np.inf])
+    assert check_compiled_range([3.0, 2.0], mins, maxs)
+    assert not check_compiled_range([3.0, 0.5], mins, maxs)
+    with pytest.raises(ValueError):
+        check_compiled_range([1.0, 2.0, 3.0], mins, maxs)
+
+
+class RangeDevice:
+    """Minimal device exposing a range"""
+
+    def __init__(self, dev_range):
+        self.dev_range = dev_range
+        self.nb_call = 0
+
+    def get_range(self):
+        self.nb_call += 1
+        return self.dev_range
+
+
+def test_range_table():
+    devs = [RangeDevice([0.0, 10.0]), RangeDevice(None)]
+    table = RangeTable(devs)
+    assert table.check([5.0, 1e9])
+    assert not table.check([11.0, 0.0])
+    # Ranges are fetched once
+    assert devs[0].nb_call == 1
+
+    devs[0].dev_range = [0.0, 20.0]
+    assert not table.check([11.0, 0.0])
+    table.refresh()
+    assert table.check([11.0, 0.0])
+    assert devs[0].nb_call == 2
@@ -0,0 +1,151 @@
+import time
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.accelerator import Accelerator
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.setpoint_wait import wait_for_device_list, wait_for_devices
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class LaggingDevice(DeviceAccess):
+    """In memory device whose readback reaches the setpoint after a delay"""
+
+    def __init__(self, name: str, delay: float = 0.05, tolerance: float | None = None, timeout: float | None = None):
+        self._name = name
+        self._delay = delay
+        self._tolerance = tolerance
+        self._timeout = timeout
+        self._previous = 0.0
+        self._value = 0.0
+        self._t_set = 0.0
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._previous = self.readback()
+        self._value = value
+        self._t_set = time.monotonic()
+
+    def set_and_wait(self, value):
+        self.set(value)
+        wait_for_devices([self], value)
+
+    def get(self):
+        return self._value
+
+    def readback(self):
+        if time.monotonic() - self._t_set >= self._delay:
+            return self._value
+        return self._previous
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def get_tolerance(self) -> float | None:
+        return self._tolerance
+
+    def get_timeout(self) -> float | None:
+        return self._timeout
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+def test_wait_for_devices():
+    dev = LaggingDevice("ps0", delay=0.05, tolerance=1e-6)
+    t0 = time.monotonic()
+    dev.set_and_wait(1.0)
+    assert time.monotonic() - t0 >= 0.05
+    assert dev.readback() == 1.0
+
+    # Readback never reaches the setpoint within the device timeout
+    dev = LaggingDevice("ps1", delay=10.0, tolerance=1e-6, timeout=0.05)
+    with pytest.raises(PyAMLException, match="'ps1' setpoint=2 readback=0"):
+        dev.set_and_wait(2.0)
+
+    # Setpoint is considered as reached within the configured tolerance
+    dev = LaggingDevice("ps2", delay=10.0, tolerance=0.5, timeout=0.05)
+    dev.set_and_wait(0.4)
+
+
+def test_wait_large_setpoint():
+    # The tolerance is absolute: a 100 Hz change of the RF frequency is waited for
+    dev = LaggingDevice("rf", delay=0.0, tolerance=1.0)
+    dev.set_and_wait(352.2e6)
+    dev._delay = 10.0
+    dev._timeout = 0.05
+    with pytest.raises(PyAMLException, match="'rf'"):
+        dev.set_and_wait(352.2e6 + 100.0)
+
+    dev._delay = 0.05
+    dev._timeout = None
+    t0 = time.monotonic()
+    dev.set_and_wait(352.2e6 + 200.0)
+    assert time.monotonic() - t0 >= 0.05
+    assert dev.readback() == 352.2e6 + 200.0
+
+
+def test_wait_without_tolerance():
+    # Devices without configured tolerance are not polled
+    dev = LaggingDevice("ps0", delay=10.0, timeout=0.05)
+    dev.set_and_wait(1.0)
+    assert dev.readback() == 0.0
+
+    # Only channels with a tolerance are waited for
+    devs = [LaggingDevice("ps1", delay=10.0), LaggingDevice("ps2", delay=0.05, tolerance=1e-6)]
+    for d, v in zip(devs, (1.0, 2.0), strict=True):
+        d.set(v)
+    wait_for_devices(devs, [1.0, 2.0])
+    assert devs[1].readback() == 2.0
+    assert devs[0].readback() == 0.0
+
+
+def test_wait_for_device_list():
+    devs = [LaggingDevice(f"ps{i}", delay=0.02 * i, tolerance=1e-6, timeout=1.0) for i in range(4)]
+    dl = ThreadedDeviceAccessList(max_workers=4)
+    dl.add_devices(devs)
+    values = np.arange(1.0, 5.0)
+    dl.set(values)
+    wait_for_device_list(dl, values)
+    assert np.array_equal(dl.readback(), values)
+
+    devs[3]._delay = 10.0
+    devs[3]._timeout = 0.05
+    dl.set(values + 1.0)
+    with pytest.raises(PyAMLException) as exc:
+        wait_for_device_list(dl, values + 1.0)
+    assert "'ps3'" in str(exc.value)
+    assert "'ps2'" not in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_live_set_and_wait(install_test_package):
+    sr: Accelerator = Accelerator.load("tests/config/EBSTune.yaml")
+    sr.design.get_lattice().disable_6d()
+
+    quads = sr.live.get_magnets("QForTune")
+    strengths = sr.design.get_magnets("QForTune").strengths.get() * 1.001
+    quads.strengths.set_and_wait(strengths)
+    assert np.allclose(quads.strengths.get(), strengths)
+
+    qf = sr.live.get_magnet(quads[0].get_name())
+    qf.strength.set_and_wait(strengths[0])
+    assert np.isclose(qf.strength.get(), strengths[0])
+
+    # Simulator setpoints are applied immediately
+    sr.design.get_magnets("QForTune").strengths.set_and_wait(strengths)
+    assert np.allclose(sr.design.get_magnets("QForTune").strengths.get(), strengths)
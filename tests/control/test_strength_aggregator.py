@@ -0,0 +1,329 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.common.abstract import RWMapper
+from pyaml.control.abstract_impl import (
+    CSHardwareScalarAggregator,
+    CSRangeScalarAggregator,
+    CSScalarAggregator,
+    CSStrengthScalarAggregator,
+)
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+from pyaml.magnet.identity_model import ConfigModel as IdentityConfigModel
+from pyaml.magnet.identity_model import IdentityMagnetModel
+from pyaml.magnet.inline_curve import ConfigModel as InlineCurveConfigModel
+from pyaml.magnet.inline_curve import InlineCurve
+from pyaml.magnet.inline_matrix import ConfigModel as InlineMatrixConfigModel
+from pyaml.magnet.inline_matrix import InlineMatrix
+from pyaml.magnet.linear_cfm_model import ConfigModel as LinearCFMConfigModel
+from pyaml.magnet.linear_cfm_model import LinearCFMagnetModel
+from pyaml.magnet.linear_model import ConfigModel as LinearConfigModel
+from pyaml.magnet.linear_model import LinearMagnetModel
+from pyaml.magnet.model import MagnetModel, SequentialMagnetModelBatch
+
+
+class MemoryDevice(DeviceAccess):
+    """In memory device"""
+
+    def __init__(self, name: str, value: float):
+        self._name = name
+        self._value = value
+        self.nb_read = 0
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        self.nb_read += 1
+        return self._value
+
+    def readback(self):
+        return self._value
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [-200.0, 200.0]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+def _curve(slope: float) -> InlineCurve:
+    return InlineCurve(InlineCurveConfigModel(mat=[[-200.0, -200.0 * slope], [0.0, 0.0], [200.0, 200.0 * slope]]))
+
+
+def _aggregator() -> CSScalarAggregator:
+    return CSScalarAggregator(ThreadedDeviceAccessList(max_workers=2))
+
+
+def _build(cfm_strengths: tuple[int, ...] = (0, 1)):
+    agg = CSStrengthScalarAggregator(_aggregator(), _aggregator)
+    models = []
+    for i in range(12):
+        ps = f"ps{i}"
+        if i % 3 == 0:
+            cfg = LinearConfigModel(curve=_curve(0.01 * (1 + i % 2)), powerconverter=ps, unit="m-1", hardware_unit="A")
+            model = LinearMagnetModel(cfg)
+        elif i % 3 == 1:
+            cfg = LinearConfigModel(
+                calibration_factor=0.01 * i, calibration_offset=0.1, powerconverter=ps, unit="m-1", hardware_unit="A"
+            )
+            model = LinearMagnetModel(cfg)
+        else:
+            model = IdentityMagnetModel(IdentityConfigModel(powerconverter=ps, unit="A"))
+        model.set_magnet_rigidity(20.0 + i)
+        agg.add_magnet(SimpleNamespace(model=model, strength=None), [MemoryDevice(ps, 10.0 + i)])
+        models.append(model)
+
+    # Combined function magnet exporting 2 virtual magnets
+    cfm = LinearCFMagnetModel(
+        LinearCFMConfigModel(
+            multipoles=["B0", "A0"],
+            curves=[_curve(0.001), _curve(0.002)],
+            powerconverters=["ps12", "ps13"],
+            units=["rad", "rad"],
+            hardware_units=["A", "A"],
+        )
+    )
+    cfm.set_magnet_rigidity(20.0)
+    devs = [MemoryDevice("ps12", 5.0), MemoryDevice("ps13", -5.0)]
+    for idx in cfm_strengths:
+        agg.add_magnet(SimpleNamespace(model=cfm, strength=RWMapper(None, idx)), devs)
+    return agg, models, cfm, devs
+
+
+def _reference_strengths(agg, models, cfm):
+    hw = agg._devs.get()
+    strengths = [m.compute_strengths(hw[i : i + 1])[0] for i, m in enumerate(models)]
+    strengths.extend(cfm.compute_strengths(hw[len(models) :]))
+    return np.array(strengths)
+
+
+def test_strength_aggregator():
+    agg, models, cfm, _ = _build()
+    assert agg.nb_device() == 14
+    assert agg.nb_shared_device() == 0
+
+    ref = _reference_strengths(agg, models, cfm)
+    assert np.allclose(agg.get(), ref)
+    assert np.allclose(agg.readback(), ref)
+
+    # Set and read back
+    target = ref * 1.1
+    agg.set(target)
+    assert np.allclose(agg.get(), target)
+    assert np.allclose(_reference_strengths(agg, models, cfm), target)
+
+    # Rigidity change after the first access is taken into account
+    models[0].set_magnet_rigidity(40.0)
+    assert np.isclose(agg.get()[0], target[0] * 20.0 / 40.0)
+
+    with pytest.raises(PyAMLException, match="Values out of range"):
+        agg.set(target * 1e4)
+
+
+class ScaledMagnetModel(MagnetModel):
+    """Model returning a batch key without providing a vectorized batch"""
+
+    def __init__(self, ps: str, scale: float):
+        self._ps = ps
+        self._scale = scale
+
+    def compute_hardware_values(self, strengths):
+        return np.asarray(strengths) / self._scale
+
+    def compute_strengths(self, hardware_values):
+        return np.asarray(hardware_values) * self._scale
+
+    def get_strength_units(self) -> list[str]:
+        return ["m-1"]
+
+    def get_hardware_units(self) -> list[str]:
+        return ["A"]
+
+    def get_device_names(self) -> list[str]:
+        return [self._ps]
+
+    def set_magnet_rigidity(self, brho):
+        pass
+
+    def get_batch_key(self):
+        return "scaled"
+
+
+def test_strength_aggregator_default_batch():
+    agg = CSStrengthScalarAggregator(_aggregator(), _aggregator)
+    models = [ScaledMagnetModel(f"ps{i}", 0.01 * (i + 1)) for i in range(4)]
+    for i, model in enumerate(models):
+        agg.add_magnet(SimpleNamespace(model=model, strength=None), [MemoryDevice(f"ps{i}", 10.0 + i)])
+    batch = ScaledMagnetModel.create_batch(models)
+    assert isinstance(batch, SequentialMagnetModelBatch)
+
+    # Models of the batch are converted with their own parameters
+    hw = agg._devs.get()
+    ref = hw * 0.01 * np.arange(1, 5)
+    assert np.allclose(batch.compute_strengths(hw), ref)
+    assert np.allclose(batch.compute_hardware_values(ref), hw)
+    assert np.allclose(agg.get(), ref)
+    agg.set(ref * 1.1)
+    assert np.allclose(agg._devs.get(), hw * 1.1)
+
+
+def test_strength_aggregator_shared_channels():
+    # Only the A0 strength of the combined function magnet is part of the aggregator
+    agg, models, cfm, cfm_devs = _build((1,))
+    assert agg.nb_shared_device() == 2
+    devs = [agg._devs.get_device_at(i) for i in range(agg.nb_device())]
+
+    b0 = cfm.compute_strengths(np.array([5.0, -5.0]))[0]
+    strengths = agg.get()
+    for d in devs:
+        d.nb_read = 0
+    agg.set(strengths * 1.1)
+    # Only channels of the combined function magnet are read
+    assert [d.nb_read for d in devs] == [0] * 12 + [1, 1]
+    assert np.allclose(agg.get(), strengths * 1.1)
+    assert np.isclose(cfm.compute_strengths(np.array([d.get() for d in cfm_devs]))[0], b0)
+
+    # Setpoint shadow
+    agg.set_shadow_staleness(10.0)
+    agg.get()
+    for d in devs:
+        d.nb_read = 0
+    agg.set(strengths)
+    agg.set(strengths * 1.2)
+    assert all(d.nb_read == 0 for d in devs)
+    agg.refresh_shadow()
+    agg.set(strengths)
+    assert [d.nb_read for d in devs] == [0] * 12 + [1, 1]
+    assert np.allclose(agg.get(), strengths)
+
+
+def test_cfm_batch():
+    agg = CSStrengthScalarAggregator(_aggregator())
+    models = []
+    for i in range(4):
+        cfm = LinearCFMagnetModel(
+            LinearCFMConfigModel(
+                multipoles=["B0", "A0", "A1"],
+                curves=[_curve(0.001), _curve(0.002), _curve(0.01)],
+                powerconverters=[f"ps{i}-{j}" for j in range(3)],
+                matrix=InlineMatrix(InlineMatrixConfigModel(mat=[[1.0, 0.0, 0.0], [0.0, 0.5, 0.5], [0.0, -0.5, 0.5]])),
+                units=["rad", "rad", "m-1"],
+                hardware_units=["A", "A", "A"],
+            )
+        )
+        cfm.set_magnet_rigidity(20.0 + i)
+        devs = [MemoryDevice(f"ps{i}-{j}", float(i + j)) for j in range(3)]
+        agg.add_cfm_magnet(SimpleNamespace(model=cfm, nb_multipole=lambda: 3), devs)
+        models.append(cfm)
+    # All combined function magnets share the same conversion
+    assert len({m.get_batch_key() for m in models}) == 1
+    assert agg.nb_shared_device() == 0
+
+    hw = agg._devs.get()
+    ref = np.concatenate([m.compute_strengths(hw[3 * i : 3 * i + 3]) for i, m in enumerate(models)])
+    assert np.allclose(agg.get(), ref)
+
+    target = ref + 1e-5
+    agg.set(target)
+    assert np.allclose(agg.get(), target)
+    expected = [m.compute_hardware_values(target[3 * i : 3 * i + 3]) for i, m in enumerate(models)]
+    assert np.allclose(agg._devs.get(), np.concatenate(expected))
+
+
+def test_hardware_aggregator_mixed():
+    agg = CSHardwareScalarAggregator(_aggregator())
+    devs = [MemoryDevice(f"ps{i}", 1.0 + i) for i in range(3)]
+    for i in range(3):
+        cfg = LinearConfigModel(curve=_curve(0.01), powerconverter=f"ps{i}", unit="m-1", hardware_unit="A")
+        model = LinearMagnetModel(cfg)
+        agg.add_magnet(SimpleNamespace(model=model, hardware=None, strength=None), [devs[i]])
+
+    # Combined function magnet with multipole separation matrix, 2 of its 3 functions are aggregated
+    matrix = [[1.0, 0.0, 0.0], [0.0, 0.5, 0.5], [0.0, -0.5, 0.5]]
+    cfm = LinearCFMagnetModel(
+        LinearCFMConfigModel(
+            multipoles=["B0", "A0", "A1"],
+            curves=[_curve(0.001), _curve(0.002), _curve(0.01)],
+            powerconverters=["c0", "c1", "c2"],
+            matrix=InlineMatrix(InlineMatrixConfigModel(mat=matrix)),
+            units=["rad", "rad", "m-1"],
+            hardware_units=["A", "A", "A"],
+        )
+    )
+    assert not cfm.has_hardware()
+    cfm_devs = [MemoryDevice("c0", 2.0), MemoryDevice("c1", 4.0), MemoryDevice("c2", 6.0)]
+    for idx in (1, 2):
+        agg.add_magnet(SimpleNamespace(model=cfm, hardware=None, strength=RWMapper(None, idx)), cfm_devs)
+    # Power supply shared with a magnet already present
+    model = LinearMagnetModel(LinearConfigModel(curve=_curve(0.02), powerconverter="ps0", unit="m-1", hardware_unit="A"))
+    agg.add_magnet(SimpleNamespace(model=model, hardware=None, strength=None), [devs[0]])
+
+    assert agg.nb_device() == 6
+    assert agg.nb_magnet() == 6
+    assert agg.unit() == ["A"] * 6
+    # Pseudo currents of the combined function magnet
+    assert np.allclose(agg.get(), [1.0, 2.0, 3.0, 5.0, 1.0, 1.0])
+
+    agg.set(np.array([10.0, 20.0, 30.0, 8.0, 2.0, 10.0]))
+    assert [d.get() for d in devs] == [10.0, 20.0, 30.0]
+    # B0 pseudo current is kept
+    currents = np.array([d.get() for d in cfm_devs])
+    assert np.allclose(np.array(matrix) @ currents, [2.0, 8.0, 2.0])
+    assert np.allclose(agg.get(), [10.0, 20.0, 30.0, 8.0, 2.0, 10.0])
+
+    # Magnets sharing ps0 must agree on its setpoint
+    with pytest.raises(PyAMLException, match="Inconsistent setpoints"):
+        agg.set(np.array([11.0, 20.0, 30.0, 8.0, 2.0, 10.0]))
+    assert devs[0].get() == 10.0
+
+
+def test_hardware_aggregator_units():
+    agg = CSHardwareScalarAggregator(_aggregator())
+    matrix = [[0.0, 0.0, 1.0], [1.0, 1.0, 0.0], [1.0, -1.0, 0.0]]
+    cfm = LinearCFMagnetModel(
+        LinearCFMConfigModel(
+            multipoles=["B0", "A0", "A1"],
+            curves=[_curve(0.001), _curve(0.002), _curve(0.01)],
+            powerconverters=["c0", "c1", "c2"],
+            matrix=InlineMatrix(InlineMatrixConfigModel(mat=matrix)),
+            units=["rad", "rad", "m-1"],
+            hardware_units=["A", "A", "V"],
+        )
+    )
+    cfm_devs = [MemoryDevice(f"c{i}", 1.0) for i in range(3)]
+    for idx in (2, 0, 1):
+        agg.add_magnet(SimpleNamespace(model=cfm, hardware=None, strength=RWMapper(None, idx)), cfm_devs)
+    # Units of the pseudo currents, not of the power supply at the function index
+    assert cfm.get_function_hardware_units() == ["V", "A", "A"]
+    assert agg.unit() == ["A", "V", "A"]
+
+
+def test_range_aggregator():
+    agg = CSRangeScalarAggregator(_aggregator())
+    devs = [MemoryDevice(f"c{i}", 1.0) for i in range(3)]
+    agg.add_devices(devs)
+    agg.set_and_wait(np.array([10.0, -20.0, 200.0]))
+    assert np.allclose(agg.get(), [10.0, -20.0, 200.0])
+
+    with pytest.raises(PyAMLException, match="out of range"):
+        agg.set(np.array([10.0, 250.0, 0.0]))
+    with pytest.raises(PyAMLException, match="out of range"):
+        agg.set_and_wait(np.array([10.0, 250.0, 0.0]))
+    assert np.allclose(agg.get(), [10.0, -20.0, 200.0])
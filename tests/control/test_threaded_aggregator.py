@@ -0,0 +1,113 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pyaml import PyAMLException
+from pyaml.control.abstract_impl import CSScalarAggregator
+from pyaml.control.controlsystem import ControlSystemAdapter
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class SlowDevice(DeviceAccess):
+    """In memory device having a fixed access latency"""
+
+    def __init__(self, name: str, latency: float = 0.05):
+        self._name = name
+        self._latency = latency
+        self._value = 0.0
+        self.threads = set()
+
+    def _access(self):
+        self.threads.add(threading.get_ident())
+        time.sleep(self._latency)
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self._access()
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        self._access()
+        return self._value
+
+    def readback(self):
+        return self.get()
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [-10.0, 10.0]
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+class MyControlSystem(ControlSystemAdapter):
+    def name(self) -> str:
+        return "live"
+
+    def get_max_workers(self) -> int:
+        return 4
+
+
+def test_threaded_device_access_list():
+    devs = [SlowDevice(f"ps{i}") for i in range(8)]
+    dl = ThreadedDeviceAccessList(max_workers=8)
+    dl.add_devices(devs[0])
+    dl.add_devices(devs[1:])
+    assert dl.len() == 8
+    assert dl[3] is devs[3]
+    assert [d.name() for d in dl] == [f"ps{i}" for i in range(8)]
+
+    values = np.arange(8, dtype=float)
+    t0 = time.perf_counter()
+    dl.set(values)
+    assert np.array_equal(dl.get(), values)
+    assert np.array_equal(dl.readback(), values)
+    # 24 serial accesses would take 1.2s
+    assert time.perf_counter() - t0 < 0.6
+
+    assert dl.unit() == ["A"] * 8
+    assert dl.get_range() == [-10.0, 10.0] * 8
+    assert dl.check_device_availability()
+
+    with pytest.raises(PyAMLException, match="3 values given for 8 devices"):
+        dl.set([1.0, 2.0, 3.0])
+
+
+def test_control_system_fallback():
+    cs = MyControlSystem()
+    agg = cs._create_scalar_aggregator()
+    assert isinstance(agg, CSScalarAggregator)
+    devs = [SlowDevice(f"ps{i}", 0.01) for i in range(12)]
+    agg.add_devices(devs)
+    agg.set(np.ones(12))
+    assert np.array_equal(agg.get(), np.ones(12))
+
+    # Bounded executor shared by all aggregators of the control system
+    used_threads = set().union(*[d.threads for d in devs])
+    assert len(used_threads) <= 4
+    assert cs._get_executor() is cs._get_executor()
+
+
+def test_shared_pool():
+    # Lists created without executor share a module level pool
+    devs = [SlowDevice(f"ps{i}", 0.01) for i in range(6)]
+    for _ in range(10):
+        dl = ThreadedDeviceAccessList(max_workers=3)
+        dl.add_devices(devs)
+        dl.set(np.ones(6))
+    used_threads = set().union(*[d.threads for d in devs])
+    assert len(used_threads) <= 3
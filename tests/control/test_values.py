@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from pyaml.control.readback_value import Value
+from pyaml.control.readback_value import Quality, Value, ValueArray
 
 
 class TestBasicValue:
@@ -140,3 +140,54 @@ class TestValueNumpy:
                 assert isinstance(original, Value)
                 twice = original * 2
                 assert np.all(computed == twice)
+
+
+class TestValueArray:
+    """
+    Test the array counterpart of Value.
+    """
+
+    def test_value_array(self):
+        """
+        Test that a ValueArray behaves as a float array and keeps
+        per channel quality and timestamp.
+        """
+        va = ValueArray([1.0, 2.0, 3.0], [Quality.VALID.value, Quality.ALARM.value, Quality.CHANGING.value], 10.0)
+        assert len(va) == 3
+        assert va.values.dtype == np.float64
+        assert va.quality.dtype == np.uint8
+        assert np.array_equal(va.timestamp, [10.0, 10.0, 10.0])
+        assert np.array_equal(va.is_good(), [True, False, True])
+
+        # Arithmetic and NumPy interoperability
+        assert np.array_equal(va + 1, [2.0, 3.0, 4.0])
+        assert np.array_equal(2 * va, [2.0, 4.0, 6.0])
+        assert np.array_equal(va - va, [0.0, 0.0, 0.0])
+        assert np.array_equal(-va, [-1.0, -2.0, -3.0])
+        assert np.array_equal(va > 1.5, [False, True, True])
+        assert np.allclose(np.asarray(va), [1.0, 2.0, 3.0])
+        assert va == [1.0, 2.0, 3.0]
+
+        # Indexing and iteration give Value objects
+        v = va[1]
+        assert isinstance(v, Value)
+        assert v == 2.0 and v.quality == Quality.ALARM
+        assert v.timestamp.timestamp() == 10.0
+        assert [float(x) for x in va] == [1.0, 2.0, 3.0]
+        assert isinstance(va[1:], ValueArray) and len(va[1:]) == 2
+
+    def test_from_values(self):
+        """
+        Test building a ValueArray from Value objects and numbers.
+        """
+        va = ValueArray.from_values([Value(1.0, Quality.INVALID), 2.0])
+        assert np.array_equal(va.values, [1.0, 2.0])
+        assert np.array_equal(va.is_good(), [False, True])
+        assert ValueArray.from_values(va) is va
+
+    def test_value_slots(self):
+        """
+        Test that Value does not allocate a per instance dictionary.
+        """
+        with pytest.raises(AttributeError):
+            Value(1.0).other = 2
@@ -0,0 +1,152 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from pyaml.control.abstract_impl import CSScalarAggregator
+from pyaml.control.deviceaccess import DeviceAccess
+from pyaml.control.threadeddeviceaccesslist import ThreadedDeviceAccessList
+
+
+class CountingDevice(DeviceAccess):
+    """In memory device counting writes"""
+
+    def __init__(self, name: str, deadband: float | None):
+        self._name = name
+        self._deadband = deadband
+        self._value = 0.0
+        self.nb_write = 0
+        self.nb_read = 0
+
+    def name(self) -> str:
+        return self._name
+
+    def measure_name(self) -> str:
+        return self._name
+
+    def set(self, value):
+        self.nb_write += 1
+        self._value = value
+
+    def set_and_wait(self, value):
+        self.set(value)
+
+    def get(self):
+        self.nb_read += 1
+        return self._value
+
+    def readback(self):
+        return self._value
+
+    def unit(self) -> str:
+        return "A"
+
+    def get_range(self) -> list[float]:
+        return [None, None]
+
+    def get_deadband(self) -> float | None:
+        return self._deadband
+
+    def get_tolerance(self) -> float | None:
+        return 1e-3
+
+    def get_timeout(self) -> float | None:
+        return 0.2
+
+    def check_device_availability(self) -> bool:
+        return True
+
+
+class DenseDeviceAccessList(ThreadedDeviceAccessList):
+    """Device list without sparse write support"""
+
+    def supports_sparse_write(self) -> bool:
+        return False
+
+
+def _aggregator(devs, dense: bool = False) -> CSScalarAggregator:
+    dl = DenseDeviceAccessList(max_workers=2) if dense else ThreadedDeviceAccessList(max_workers=2)
+    agg = CSScalarAggregator(dl)
+    agg.add_devices(devs)
+    return agg
+
+
+def test_sparse_write():
+    devs = [CountingDevice(f"ps{i}", 0.01) for i in range(4)]
+    agg = _aggregator(devs)
+    agg.set(np.zeros(4))
+    assert [d.nb_write for d in devs] == [1, 1, 1, 1]
+
+    # Only channels changing by more than the dead-band are written
+    agg.set(np.array([0.005, 0.02, 0.0, -0.5]))
+    assert [d.nb_write for d in devs] == [1, 2, 1, 2]
+    assert agg.nb_suppressed_write() == 2
+    # Setpoints are not read back
+    assert [d.nb_read for d in devs] == [0, 0, 0, 0]
+
+    # Reference is the last written value, small changes accumulate
+    agg.set(np.array([0.011, 0.02, 0.0, -0.5]))
+    assert [d.nb_write for d in devs] == [2, 2, 1, 2]
+    assert devs[0].get() == 0.011
+    assert agg.nb_suppressed_write() == 5
+
+    # No-op write
+    asyncio.run(agg.set_async(np.array([0.011, 0.02, 0.0, -0.5])))
+    assert [d.nb_write for d in devs] == [2, 2, 1, 2]
+    assert agg.nb_suppressed_write() == 9
+
+    agg.reset_write_filter()
+    agg.set(np.array([0.011, 0.02, 0.0, -0.5]))
+    assert [d.nb_write for d in devs] == [3, 3, 2, 3]
+
+
+def test_dense_write():
+    devs = [CountingDevice(f"ps{i}", 0.01) for i in range(3)]
+    agg = _aggregator(devs, dense=True)
+    agg.set(np.zeros(3))
+    agg.set(np.array([0.0, 0.0, 0.001]))
+    assert [d.nb_write for d in devs] == [1, 1, 1]
+    # Whole vector written as soon as one channel changes
+    agg.set(np.array([0.0, 0.0, 0.1]))
+    assert [d.nb_write for d in devs] == [2, 2, 2]
+    assert agg.nb_suppressed_write() == 3
+
+
+def test_no_deadband():
+    devs = [CountingDevice(f"ps{i}", None) for i in range(3)]
+    agg = _aggregator(devs)
+    agg.set(np.zeros(3))
+    agg.set(np.zeros(3))
+    assert [d.nb_write for d in devs] == [2, 2, 2]
+    assert agg.nb_suppressed_write() == 0
+
+
+def test_external_write():
+    devs = [CountingDevice(f"ps{i}", 0.01) for i in range(3)]
+    agg = _aggregator(devs)
+    agg.set(np.ones(3))
+    # Setpoint changed without the aggregator, values written by the aggregator are trusted
+    devs[0].set(5.0)
+    agg.set(np.ones(3))
+    assert devs[0].get() == 5.0
+
+    # Current setpoints are read once the last written values are older than the staleness
+    agg.set_write_filter_staleness(10.0)
+    agg.set(np.ones(3))
+    assert devs[0].get() == 5.0
+    agg.set_write_filter_staleness(0.0)
+    agg.set(np.ones(3))
+    assert [d.get() for d in devs] == [1.0, 1.0, 1.0]
+    assert [d.nb_write for d in devs] == [3, 1, 1]
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_set_and_wait_deadband(dense):
+    devs = [CountingDevice(f"ps{i}", 0.5) for i in range(3)]
+    agg = _aggregator(devs, dense)
+    agg.set(np.zeros(3))
+    # Changes smaller than the dead-band but larger than the tolerance
+    agg.set_and_wait(np.array([0.3, 0.3, 0.3]))
+    assert [d.get() for d in devs] == [0.0, 0.0, 0.0]
+    agg.set_and_wait(np.array([0.3, 1.0, 0.3]))
+    assert [d.get() for d in devs] == ([0.3, 1.0, 0.3] if dense else [0.0, 1.0, 0.0])
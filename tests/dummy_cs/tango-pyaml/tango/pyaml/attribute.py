@@ -4,7 +4,7 @@ from pydantic import BaseModel, ConfigDict
 
 from pyaml.common.exception import PyAMLException
 from pyaml.control.deviceaccess import DeviceAccess
-from pyaml.control.readback_value import Value
+from pyaml.control.readback_value import Value, ValueArray
 
 from .attribute_store import get_state
 
@@ -18,6 +18,9 @@ class ConfigModel(BaseModel):
     unit: str = ""
     range: Optional[tuple[Optional[float], Optional[float]]] = None
     index: Optional[int] = None
+    tolerance: Optional[float] = None
+    timeout: Optional[float] = None
+    deadband: Optional[float] = None
 
 
 class Attribute(DeviceAccess):
@@ -73,7 +76,7 @@ class Attribute(DeviceAccess):
         if self._index is not None:
             return Value(value[self._index])
         if state.is_array:
-            return [Value(v) for v in value]
+            return ValueArray(value)
         return Value(value)
 
     def unit(self) -> str:
@@ -88,5 +91,14 @@ class Attribute(DeviceAccess):
             return [None, None]
         return [state.range[0], state.range[1]]
 
+    def get_tolerance(self) -> float | None:
+        return self._cfg.tolerance
+
+    def get_timeout(self) -> float | None:
+        return self._cfg.timeout
+
+    def get_deadband(self) -> float | None:
+        return self._cfg.deadband
+
     def check_device_availability(self) -> bool:
         return True
@@ -7,6 +7,7 @@ from pyaml import PyAMLException
 from pyaml.control.controlsystem import ControlSystem
 from pyaml.control.deviceaccess import DeviceAccess
 from pyaml.control.deviceaccesslist import DeviceAccessList
+from pyaml.control.devicecache import DeviceCache
 
 from .catalog import Catalog
 from .multi_attribute import MultiAttribute
@@ -23,6 +24,9 @@ class ConfigModel(BaseModel):
     debug_level: str | None = None
     lazy_devices: bool = True
     timeout_ms: int = 3000
+    cache: DeviceCache | None = None
+    shadow_staleness: float | None = None
+    lazy_attach: bool = False
 
 
 class TangoControlSystem(ControlSystem):
@@ -30,6 +34,9 @@ class TangoControlSystem(ControlSystem):
         super().__init__()
         self._cfg = cfg
         self.__devices = {}
+        self.set_device_cache(cfg.cache)
+        self.set_shadow_staleness(cfg.shadow_staleness)
+        self.set_lazy_attach(cfg.lazy_attach)
 
     def attach_array(self, devs: list[DeviceAccess | None]) -> list[DeviceAccess | None]:
         return self._attach(devs, True)
@@ -4,6 +4,7 @@ from numpy import typing as npt
 import pyaml
 from pyaml.control.deviceaccess import DeviceAccess
 from pyaml.control.deviceaccesslist import DeviceAccessList
+from pyaml.control.readback_value import ValueArray
 
 from .attribute import Attribute
 
@@ -49,12 +50,22 @@ class MultiAttribute(DeviceAccessList):
     def set_and_wait(self, value: npt.NDArray[np.float64]):
         pass
 
+    def supports_sparse_write(self) -> bool:
+        return True
+
+    def set_sparse(self, indices: npt.NDArray[np.intp], value: npt.NDArray[np.float64]):
+        print(f"MultiAttribute.set_sparse({len(value)} values)")
+        global LAST_NB_WRITTEN
+        LAST_NB_WRITTEN += len(value)
+        for idx, v in zip(indices, value, strict=True):
+            self._items[idx].set(v)
+
     def get(self) -> npt.NDArray[np.float64]:
         print(f"MultiAttribute.get({len(self._items)} values)")
         return np.array([a.get() for a in self._items])
 
-    def readback(self) -> np.array:
-        return np.array([])
+    def readback(self) -> ValueArray:
+        return ValueArray.from_values([a.readback() for a in self._items])
 
     def unit(self) -> list[str]:
         return [a.unit() for a in self._items]
@@ -1,3 +1,4 @@
+import at
 import pytest
 
 from pyaml import PyAMLException
@@ -197,3 +198,50 @@ def test_various_naming_addressing():
     elts = sr.design.get_magnet("QF1E-C04-C05-C06-3").strength._RWStrengthScalar__elements
     assert len(elts) == 3
     check_index(ring, elts, [140, 290, 424])
+
+
+def test_attribute_index(lattice_with_custom_attr):
+    linker = PyAtAttributeElementsLinker(AttrConfigModel(attribute_name="Tag"))
+    linker.set_lattice(lattice_with_custom_attr)
+    tested = []
+    test = linker._test_at_element
+    linker._test_at_element = lambda ident, e: tested.append(e) or test(ident, e)
+    assert len(linker.get_at_elements(PyAtAttributeIdentifier("Tag", "QF"))) == 2
+    # Resolved through the index, no lattice scan
+    assert len(tested) == 0
+    assert linker.get_at_elements([PyAtAttributeIdentifier("Tag", "QD"), PyAtAttributeIdentifier("Tag", "D1")]) == [
+        lattice_with_custom_attr[3],
+        lattice_with_custom_attr[0],
+    ]
+
+
+def test_attribute_index_invalidation(lattice_with_custom_attr):
+    linker = PyAtAttributeElementsLinker(AttrConfigModel(attribute_name="Tag"))
+    linker.set_lattice(lattice_with_custom_attr)
+    nb_build = []
+    build = linker._build_index
+    linker._build_index = lambda: nb_build.append(1) or build()
+    assert len(linker.get_at_elements(PyAtAttributeIdentifier("Tag", "QF"))) == 2
+
+    # Missing identifiers do not rebuild the index
+    for _ in range(3):
+        with pytest.raises(PyAMLException):
+            linker.get_at_element(PyAtAttributeIdentifier("Tag", "QF2"))
+    assert len(nb_build) == 1
+
+    # Re-tagged element
+    lattice_with_custom_attr[2].Tag = "QF2"
+    linker.invalidate()
+    assert linker.get_at_elements(PyAtAttributeIdentifier("Tag", "QF")) == [lattice_with_custom_attr[1]]
+    assert linker.get_at_element(PyAtAttributeIdentifier("Tag", "QF2")) is lattice_with_custom_attr[2]
+    assert len(nb_build) == 2
+
+    # Inserted element
+    sf = at.elements.Sextupole("SF", 0.1)
+    sf.Tag = "QF"
+    lattice_with_custom_attr.insert(0, sf)
+    linker.invalidate()
+    assert linker.get_at_elements(PyAtAttributeIdentifier("Tag", "QF")) == [sf, lattice_with_custom_attr[2]]
+
+    # Identifier on another attribute than the indexed one
+    assert linker.get_at_element(PyAtAttributeIdentifier("FamName", "QD")) is lattice_with_custom_attr[4]
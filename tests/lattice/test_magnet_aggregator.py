@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pyaml.accelerator import Accelerator
+from pyaml.arrays.magnet_array import MagnetArray
+from pyaml.lattice.abstract_impl import HardwareScalarAggregator, StrengthScalarAggregator
+
+
+def test_simulator_magnet_aggregator():
+    sr: Accelerator = Accelerator.load("tests/config/EBSTune.yaml", ignore_external=True)
+    quads = sr.design.get_magnets("QForTune")
+    magnets = list(quads)
+    assert isinstance(sr.design.create_magnet_strength_aggregator(magnets), StrengthScalarAggregator)
+    hagg = sr.design.create_magnet_hardware_aggregator(magnets)
+    assert isinstance(hagg, HardwareScalarAggregator)
+    assert hagg.unit() == [m.hardware.unit() for m in magnets]
+
+    noagg = MagnetArray("QForTune_noagg", magnets, use_aggregator=False)
+    strengths = noagg.strengths.get()
+    assert np.allclose(quads.strengths.get(), strengths)
+    assert np.allclose(quads.hardwares.get(), noagg.hardwares.get())
+
+    state = sr.design.get_lattice_state()
+    generation = state.generation()
+    quads.strengths.set(strengths * 1.01)
+    assert state.generation() > generation
+    assert np.allclose(noagg.strengths.get(), strengths * 1.01)
+    assert np.allclose([m.strength.get() for m in magnets], strengths * 1.01)
+
+    currents = noagg.hardwares.get()
+    quads.hardwares.set(currents * 0.99)
+    assert np.allclose(noagg.hardwares.get(), currents * 0.99)
+    assert np.allclose(quads.hardwares.get(), currents * 0.99)
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_simulator_cfm_functions_aggregator(install_test_package):
+    sr: Accelerator = Accelerator.load("tests/config/sr.yaml")
+    sr.design.get_lattice().disable_6d()
+    hcorr = sr.design.get_magnets("HCORR")
+    magnets = list(hcorr)
+    # Functions of combined function magnets are aggregated in strength only
+    assert isinstance(sr.design.create_magnet_strength_aggregator(magnets), StrengthScalarAggregator)
+    assert sr.design.create_magnet_hardware_aggregator(magnets) is None
+
+    hcorr.strengths.set(np.array([0.000010, -0.000008]))
+    assert np.allclose([m.strength.get() for m in magnets], [0.000010, -0.000008])
+    assert np.allclose(hcorr.strengths.get(), [0.000010, -0.000008])
+    # Other functions are not modified
+    assert np.allclose([sr.design.get_magnet(n).strength.get() for n in ("SH1A-C01-V", "SH1A-C02-V")], 0.0)
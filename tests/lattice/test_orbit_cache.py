@@ -0,0 +1,93 @@
+import at
+import numpy as np
+
+from pyaml.accelerator import Accelerator
+
+
+def test_simulator_orbit_cache():
+    sr: Accelerator = Accelerator.load("tests/config/EBSOrbit.yaml", ignore_external=True)
+    sr.design.get_lattice().disable_6d()
+    state = sr.design.get_lattice_state()
+    bpms = sr.design.get_bpms("BPM")
+    hcorr = sr.design.get_magnets("HCorr")
+
+    n0 = state.nb_orbit_computation()
+    pos = bpms.positions.get()
+    h = bpms.h.get()
+    v = bpms.v.get()
+    # A single tracking for all reads
+    assert state.nb_orbit_computation() == n0 + 1
+    assert np.array_equal(pos[:, 0], h)
+    assert np.array_equal(pos[:, 1], v)
+
+    # Setpoint changes invalidate the cache
+    generation = state.generation()
+    strengths = hcorr.strengths.get()
+    strengths[0] += 1e-5
+    hcorr.strengths.set(strengths)
+    assert state.generation() > generation
+    h2 = bpms.h.get()
+    assert state.nb_orbit_computation() == n0 + 2
+    assert not np.allclose(h, h2)
+    ring = sr.design.get_lattice()
+    _, orbit = ring.find_orbit(refpts=[ring.index(sr.design.get_at_elems(b)[0]) for b in bpms])
+    assert np.allclose(orbit[:, 0], h2)
+
+    # Direct lattice access does not invalidate the cache
+    bpms.v.get()
+    assert state.nb_orbit_computation() == n0 + 2
+
+
+def test_simulator_bpm_refpts():
+    sr: Accelerator = Accelerator.load("tests/config/EBSOrbit.yaml", ignore_external=True)
+    sr.design.get_lattice().disable_6d()
+    ring = sr.design.get_lattice()
+    state = sr.design.get_lattice_state()
+    bpms = sr.design.get_bpms("BPM")
+    sr.design.get_magnets("VCorr").strengths.set(np.full(len(sr.design.get_magnets("VCorr")), 1e-6))
+
+    elem = sr.design.get_at_elems(bpms[3])[0]
+    assert sr.design.get_refpt(elem) == ring.index(elem)
+
+    # Per BPM reads share the orbit computed at all BPMs
+    n0 = state.nb_orbit_computation()
+    pos = np.array([b.positions.get() for b in bpms])
+    assert state.nb_orbit_computation() == n0 + 1
+    assert np.array_equal(pos, bpms.positions.get())
+    assert state.nb_orbit_computation() == n0 + 1
+    _, orbit = ring.find_orbit(refpts=[ring.index(sr.design.get_at_elems(b)[0]) for b in bpms])
+    assert np.allclose(pos, orbit[:, [0, 2]])
+
+
+def test_simulator_lattice_edit():
+    sr: Accelerator = Accelerator.load("tests/config/EBSOrbit.yaml", ignore_external=True)
+    ring = sr.design.get_lattice()
+    ring.disable_6d()
+    state = sr.design.get_lattice_state()
+    bpms = sr.design.get_bpms("BPM")
+    refpts = [ring.index(sr.design.get_at_elems(b)[0]) for b in bpms]
+    h = bpms.h.get()
+
+    # In place edits of the lattice held by the caller are detected on request
+    n0 = state.nb_orbit_computation()
+    assert not sr.design.check_edits()
+    sext = ring[ring.get_uint32_index(at.Sextupole)[0]]
+    sext.PolynomB[0] -= 1e-5
+    assert np.array_equal(bpms.h.get(), h)
+    assert state.nb_orbit_computation() == n0
+    assert sr.design.check_edits()
+    h2 = bpms.h.get()
+    assert state.nb_orbit_computation() == n0 + 1
+    assert not np.allclose(h, h2)
+    _, orbit = ring.find_orbit(refpts=refpts)
+    assert np.allclose(orbit[:, 0], h2)
+    bpms.h.get()
+    assert not sr.design.check_edits()
+    assert state.nb_orbit_computation() == n0 + 1
+
+    # Other edits are signaled explicitly
+    generation = state.generation()
+    sr.design.invalidate()
+    assert state.generation() > generation
+    bpms.h.get()
+    assert state.nb_orbit_computation() == n0 + 2
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from pyaml import PyAMLException
 from pyaml.accelerator import Accelerator
+from pyaml.arrays.serialized_magnet_array import SerializedMagnetsArray
 from pyaml.magnet.serialized_magnet import SerializedMagnets
 
 
@@ -201,3 +203,97 @@ def test_strength_computation(sr_file):
     magnets_from_lattice_strengths = get_strengths_from_lattice(sr, sm)
     assert abs(sum(magnets_from_lattice_strengths) - 24.0) < 1e-3
     assert magnets_strengths == magnets_from_lattice_strengths
+
+
+def _series(name: str, elements: list[str], ps: str, slopes: list[float]) -> dict:
+    return {
+        "type": "pyaml.magnet.serialized_magnet",
+        "name": name,
+        "function": "B1",
+        "elements": elements,
+        "model": {
+            "type": "pyaml.magnet.linear_serialized_model",
+            "unit": "m-1",
+            "hardware_unit": "A",
+            "curves": [{"type": "pyaml.magnet.inline_curve", "mat": [[0.0, 0.0], [200.0, 200.0 * s]]} for s in slopes],
+            "powerconverter": ps,
+        },
+    }
+
+
+def _ps_entry(key: str) -> dict:
+    return {
+        "type": "tango.pyaml.static_catalog_entry",
+        "key": key,
+        "device": {"type": "tango.pyaml.attribute", "attribute": key, "unit": "A"},
+    }
+
+
+@pytest.mark.parametrize(
+    "install_test_package",
+    [{"name": "tango-pyaml", "path": "tests/dummy_cs/tango-pyaml"}],
+    indirect=True,
+)
+def test_serialized_magnets_aggregator(install_test_package):
+    sr = Accelerator.from_dict(
+        {
+            "type": "pyaml.accelerator",
+            "facility": "ESRF",
+            "machine": "sr",
+            "energy": 6e9,
+            "data_folder": "/data/store",
+            "controls": [
+                {
+                    "type": "tango.pyaml.controlsystem",
+                    "tango_host": "ebs-simu-3:10000",
+                    "name": "live",
+                    "catalog": {
+                        "type": "tango.pyaml.static_catalog",
+                        "entries": [_ps_entry("srmag/ps-qa/current"), _ps_entry("srmag/ps-qb/current")],
+                    },
+                }
+            ],
+            "arrays": [{"type": "pyaml.arrays.serialized_magnet", "name": "series", "elements": ["SA", "SB", "SC"]}],
+            "devices": [
+                _series("SA", ["QA1", "QA2", "QA3"], "srmag/ps-qa/current", [0.01, 0.02, 0.03]),
+                _series("SB", ["QB1", "QB2"], "srmag/ps-qb/current", [0.01, 0.01]),
+                # Second series powered by the power supply of SA
+                _series("SC", ["QC1", "QC2", "QC3"], "srmag/ps-qa/current", [0.01, 0.02, 0.03]),
+            ],
+        }
+    )
+    series = sr.live.get_serialized_magnets("series")
+    agg = series.strengths._RWMagnetStrengths__aggregator
+    # Shared power supply is accessed once
+    assert agg.nb_device() == 2
+
+    series.hardwares.set([100.0, 50.0, 100.0])
+    sa = sr.live.get_serialized_magnet("SA")
+    brho = sa.model.get_magnet_rigidity()
+    expected = np.array([100.0 * 0.06, 50.0 * 0.02, 100.0 * 0.06]) / brho
+    assert np.allclose(series.strengths.get(), expected)
+    # Same as the sum of the strengths of the magnets of each series
+    assert np.isclose(series.strengths.get()[0], sa.strength.get())
+    assert np.allclose(series.hardwares.get(), [100.0, 50.0, 100.0])
+
+    series.strengths.set(expected * 0.5)
+    assert np.allclose(series.hardwares.get(), [50.0, 25.0, 50.0])
+    assert np.allclose(series.strengths.get(), expected * 0.5)
+
+    # Series sharing a power supply cannot be given different setpoints
+    with pytest.raises(PyAMLException, match="Inconsistent setpoints"):
+        series.hardwares.set([10.0, 20.0, 30.0])
+
+    # Same convention with and without aggregator
+    noagg = SerializedMagnetsArray("series_noagg", list(series), use_aggregator=False)
+    for values in ([0.01, 0.005, 0.01], [0.02, 0.002, 0.02]):
+        noagg.strengths.set(np.array(values))
+        via_series = (series.hardwares.get(), series.strengths.get())
+        series.strengths.set(np.array(values))
+        assert np.allclose(series.hardwares.get(), via_series[0])
+        assert np.allclose(series.strengths.get(), via_series[1])
+        assert np.allclose(noagg.strengths.get(), values)
+    assert np.allclose(noagg.hardwares.get(), series.hardwares.get())
+    sa.strength.set(0.01)
+    assert np.isclose(sa.strength.get(), 0.01)
+    assert np.isclose(sa.hardware.get(), 0.01 * brho / 0.06)
@@ -24,3 +24,28 @@ def test_tuning_orm():
     orm_data = orm.get()
     orm_shape = np.array(orm_data["matrix"]).shape
     assert orm_shape == (2 * len(bpms), 8)
+
+
+def test_tuning_orm_model():
+    logging.getLogger("pyaml.tuning_tools").setLevel(logging.WARNING)
+
+    parent_folder = Path(__file__).parent
+    config_path = parent_folder.joinpath("..", "config", "EBSOrbit.yaml").resolve()
+    sr = Accelerator.load(config_path, ignore_external=True)
+    element_holder = sr.design
+    orm = element_holder.orm
+
+    hcorr = element_holder.get_magnets("HCorr")
+    corrector_names = hcorr.names()[:3] + element_holder.get_magnets("VCorr").names()[:3]
+    strengths = hcorr.strengths.get()
+    assert orm.compute(corrector_names=corrector_names)
+    # Correctors are restored
+    assert np.array_equal(hcorr.strengths.get(), strengths)
+    model = orm.get()
+    assert model["variable_names"] == corrector_names
+    assert model["variable_planes"] == ["H"] * 3 + ["V"] * 3
+
+    orm.measure(corrector_names=corrector_names)
+    measured = orm.get()
+    assert np.allclose(model["matrix"], measured["matrix"], rtol=1e-4, atol=1e-5)
+    assert model["observable_names"] == measured["observable_names"]